@@ -10,6 +10,7 @@ import logging
 import hashlib
 import json
 import os
+import sys
 from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from dataclasses import dataclass, field
@@ -478,12 +479,13 @@ class AccountManager:
         player.shield_power = account.shield_power
         player.mp = account.mp
         player.ap = account.ap
-        player.flags = account.flags.copy()
+        # Interned like the names _handle_flag_set stores (handlers/chat.py).
+        player.flags = {sys.intern(k): v for k, v in account.flags.items()}
         player.gattribs = {i: v for i, v in enumerate(account.gattribs) if v}
         # Weapons must be on the player before complete_login runs, which is
         # what announces each owned GS2 weapon to the client
         # (player_login.complete_login -> GS2ScriptManager.announce_weapons).
-        player.weapons = account.weapons.copy()
+        player.weapons = dict.fromkeys(account.weapons)
 
         # Set position if saved
         if account.level_name:
@@ -516,7 +518,7 @@ class AccountManager:
         account.mp = player.mp
         account.ap = player.ap
         account.flags = player.flags.copy()
-        account.weapons = player.weapons.copy()
+        account.weapons = list(player.weapons)
 
         # Save gattribs
         for i, v in player.gattribs.items():
@@ -7,7 +7,7 @@ blast, the GS1 host's explosion), and those loops did not agree on either the
 membership source or the shape of the affected area. This module owns both.
 
 Membership. `players_on_level` is the single definition of "attached to this
-level", and it reads the level's own player set (`Level.get_player_ids`), which
+level", and it reads the level's own player set (`Level.player_ids`), which
 is what the reference server does too - Server::sendPacketToOneLevelPart walks
 Level::findPlayersInLevelPart over `Level::m_players`
 (server/src/Server.cpp:2682-2688, server/src/level/Level.cpp:3086-3095). That is
@@ -43,6 +43,7 @@ below. The plus shape is documented rather than implemented because no call site
 uses it yet.
 """
 
+import asyncio
 import math
 from enum import Enum, auto
 from typing import Callable, Iterable, List, Optional, Set, TYPE_CHECKING
@@ -91,6 +92,19 @@ FIRESPY_HIT_PLAYERS = Shape.BOX
 GS1_EXPLOSION_PLAYERS = Shape.BOX_INCLUSIVE
 
 
+async def send_to_all(players: Iterable['Player'], packet: bytes) -> None:
+    """Write `packet` to every one of `players`, then drain the backed-up ones.
+
+    The same scheme as RCManager.broadcast_to_rcs: write_raw() encodes and
+    buffers synchronously, so per-socket order is as before, and only a
+    session past its high-water mark is drained, concurrently with the rest.
+    """
+    backlogged = [player for player in players if player.write_raw(packet)]
+    if backlogged:
+        await asyncio.gather(*(player.drain() for player in backlogged),
+                             return_exceptions=True)
+
+
 class Audience:
     """Spatial/level queries against the server's live player and NPC sets."""
 
@@ -110,11 +124,13 @@ class Audience:
         level = self.server.world.get_level(level_name)
         if level is None:
             return []
+        # The live view is safe here: nothing below awaits.
+        get_player = self.server.get_player
         out = []
-        for player_id in level.get_player_ids():
+        for player_id in level.player_ids:
             if player_id in exclude:
                 continue
-            player = self.server.get_player(player_id)
+            player = get_player(player_id)
             if player is not None:
                 out.append(player)
         return out
@@ -180,11 +196,9 @@ class Audience:
     async def broadcast_to_level(self, level_name: str, packet: bytes,
                                  exclude: Optional[Set[int]] = None):
         """Send `packet` to every client attached to `level_name`."""
-        for player in self.players_on_level(level_name, exclude):
-            await player.send_raw(packet)
+        await send_to_all(self.players_on_level(level_name, exclude), packet)
 
     async def broadcast_to_world(self, level_name: str, packet: bytes,
                                  exclude: Optional[Set[int]] = None):
         """Send `packet` to every client in the containing map."""
-        for player in self.players_in_world(level_name, exclude):
-            await player.send_raw(packet)
+        await send_to_all(self.players_in_world(level_name, exclude), packet)
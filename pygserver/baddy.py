@@ -684,7 +684,11 @@ class BaddyManager:
             player: Player to send to
             level: Level to send baddies from
         """
-        for baddy in self.get_baddies_on_level(level.name):
-            if not baddy.dead:
-                # First sighting for this player: include verses too.
-                await player.send_raw(baddy.build_props_packet(include_verses=True))
+        # First sighting for this player: include verses too.
+        packets = [
+            baddy.build_props_packet(include_verses=True)
+            for baddy in self.get_baddies_on_level(level.name)
+            if not baddy.dead
+        ]
+        if packets:
+            await player.send_raw(b''.join(packets))
@@ -352,12 +352,10 @@ class CombatManager:
         radius = self.bomb_damage_radius + (bomb.power * 0.5)
         damage = self.bomb_base_damage * bomb.power
 
-        await self.server.broadcast_to_level(
-            bomb.level_name, build_bomb_del(bomb.x, bomb.y)
-        )
-
-        # Broadcast explosion effect
-        packet = build_explosion(bomb.x, bomb.y, radius, damage)
+        # Bomb removal and the explosion effect go out as one blob so each
+        # player on the level encodes and drains once.
+        packet = (build_bomb_del(bomb.x, bomb.y)
+                  + build_explosion(bomb.x, bomb.y, radius, damage))
         await self.server.broadcast_to_level(bomb.level_name, packet)
 
         # Damage players in radius
@@ -830,7 +828,7 @@ class CombatManager:
         builder.write_gchar(PLO.SHOOT)
         builder.write_gshort(player.id)
         builder.write_bytes(shoot_data)
-        builder.write_byte(ord('\n'))
+        builder.write_newline()
 
         await self.server.broadcast_to_level(
             player.level.name, builder.build(), exclude={player.id}
@@ -851,7 +849,7 @@ class CombatManager:
         builder.write_gchar(PLO.SHOOT)
         builder.write_gshort(player.id)
         builder.write_bytes(shoot_data)
-        builder.write_byte(ord('\n'))
+        builder.write_newline()
 
         await self.server.broadcast_to_level(
             player.level.name, builder.build(), exclude={player.id}
@@ -12,12 +12,12 @@ import hashlib
 import zlib
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Optional, List, Dict, Tuple, BinaryIO
+from typing import TYPE_CHECKING, Optional, List, Dict, Tuple, BinaryIO, Union
 
 from .protocol.constants import PLO
 from .protocol.packets import (
     PacketBuilder,
-    build_file,
+    build_file_segments,
     build_raw_data_announcement,
     build_file_send_failed,
     build_file_uptodate,
@@ -33,6 +33,18 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+def _announced_file(filename: str, data: bytes) -> bytes:
+    """PLO_RAWDATA announcement plus the PLO_FILE packet, as one buffer.
+
+    The file is built as segments and joined once with its announcement, so
+    the payload is copied a single time on its way to the session codec
+    (which compresses and encrypts it, so it cannot go to the socket as-is).
+    """
+    segments = build_file_segments(filename, data)
+    announcement = build_raw_data_announcement(sum(map(len, segments)))
+    return b"".join((announcement, *segments))
+
+
 @dataclass
 class FileInfo:
     """Information about a file for directory listings."""
@@ -210,9 +222,7 @@ class FileSystem:
 
             # PLO_FILE carries raw bytes (with newlines), so announce its full
             # length via PLO_RAWDATA first; the codec compresses the stream.
-            file_packet = build_file(filename, data)
-            announcement = build_raw_data_announcement(len(file_packet))
-            await player.send_raw(announcement + file_packet)
+            await player.send_raw(_announced_file(filename, data))
 
             logger.debug(f"Sent file {filename} to player {player.id} ({len(data)} bytes)")
 
@@ -263,9 +273,7 @@ class FileSystem:
                         break
 
                     # Repeat the complete file header so each raw chunk dispatches as PLO_FILE.
-                    file_packet = build_file(filename, chunk)
-                    announcement = build_raw_data_announcement(len(file_packet))
-                    await player.send_raw(announcement + file_packet)
+                    await player.send_raw(_announced_file(filename, chunk))
 
                     self._downloads[player.id].sent_bytes += len(chunk)
             finally:
@@ -402,16 +410,27 @@ class FileSystem:
         path = path.replace('..', '').strip('/')
         dir_path = self.base_path / path if path else self.base_path
 
-        if not dir_path.exists() or not dir_path.is_dir():
+        # scandir's entries answer is_file()/is_dir() from the directory read
+        # itself, leaving one stat() per entry instead of three. A missing
+        # path or a plain file is reported by scandir itself, so there is no
+        # exists()/is_dir() stat pair up front either.
+        try:
+            with os.scandir(dir_path) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+        except (FileNotFoundError, NotADirectoryError):
+            return files
+        except Exception as e:
+            logger.error(f"Error listing directory {path}: {e}")
             return files
 
         try:
-            for entry in sorted(dir_path.iterdir()):
+            for entry in entries:
                 stat = entry.stat()
+                is_file = entry.is_file()
                 files.append(FileInfo(
                     name=entry.name,
-                    size=stat.st_size if entry.is_file() else 0,
-                    is_directory=entry.is_dir(),
+                    size=stat.st_size if is_file else 0,
+                    is_directory=not is_file and entry.is_dir(),
                     modified_time=stat.st_mtime
                 ))
         except Exception as e:
@@ -516,20 +535,21 @@ class FileSystem:
         filename = filename.replace('..', '').strip('/')
         name = Path(filename).name
 
-        # Check each directory
+        # is_file() is False for a missing path, so one stat per candidate
+        # answers both questions.
         for dir_path in self.file_dirs.values():
             file_path = dir_path / name
-            if file_path.exists() and file_path.is_file():
+            if file_path.is_file():
                 return file_path
 
         # Check base path
         file_path = self.base_path / name
-        if file_path.exists() and file_path.is_file():
+        if file_path.is_file():
             return file_path
 
         # Check with full path
         file_path = self.base_path / filename
-        if file_path.exists() and file_path.is_file():
+        if file_path.is_file():
             return file_path
 
         return None
@@ -582,7 +602,7 @@ class FileSystem:
             logger.error(f"Error reading file {filename}: {e}")
             return None
 
-    def write_file(self, filename: str, data: bytes) -> bool:
+    def write_file(self, filename: str, data: Union[bytes, bytearray]) -> bool:
         """
         Write data to a file.
 
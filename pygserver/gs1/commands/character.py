@@ -160,22 +160,15 @@ def _c_addweapon(self, a, npc, player, ctx):
     if hasattr(player, "add_weapon"):
         player.add_weapon(name)
     # The GS2 manager owns weapons/*.txt whether or not the clientside half
-    # compiled: a compiled one is announced by it (image + joined classes +
-    # script header, then the client pulls the bytecode), an uncompiled one
-    # goes out as a classic GS1-text weapon.
+    # compiled, and the script announces either kind from its kept packets: a
+    # compiled one as image + joined classes + script header (the client then
+    # pulls the bytecode), an uncompiled one as a classic GS1-text weapon.
     gs2 = getattr(self.server, "gs2_manager", None)
     weapon = gs2.get_weapon(name) if gs2 is not None else None
-    if weapon is None:
-        return
-    if weapon.bytecode:
-        _schedule(gs2.announce_weapon(player, name))
-        return
-    if not hasattr(player, "send_raw"):
+    if weapon is None or not hasattr(player, "send_raw"):
         return
     try:
-        from ...protocol.packets import build_npc_weapon_add
-        pkt = build_npc_weapon_add(weapon.name, weapon.image, weapon.clientside)
-        _schedule(player.send_raw(pkt))
+        _schedule(weapon.announce(player))
     except Exception:
         logger.debug("addweapon send failed for %s", name, exc_info=True)
 
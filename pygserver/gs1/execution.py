@@ -249,7 +249,6 @@ def _flush_player_props(player):
     if not hasattr(player, "send_props"):
         return
     try:
-        import asyncio
         asyncio.get_running_loop().create_task(player.send_props(dirty))
     except RuntimeError:
         pass  # no running loop (e.g. unit test) — state is set, just not pushed
@@ -322,11 +322,14 @@ class GS1Host(Host):
     def _broadcast_tiles(self, level, x, y, width, height):
         if self.server is None or not hasattr(level, "_tiles"):
             return
+        # Rows are copied once, from a view of the board into `tiles`, which
+        # the board-modify builders then join as-is (they take any bytes-like).
         tiles = bytearray()
+        board = memoryview(level._tiles)
         level_width = int(getattr(level, "WIDTH", LEVEL_SIZE))
         for row in range(y, y + height):
             start = (row * level_width + x) * 2
-            tiles += bytes(level._tiles[start:start + width * 2])
+            tiles += board[start:start + width * 2]
         try:
             from ..protocol.packets import build_board_modify, build_board_modify2
             world = getattr(self.server, "world", None)
@@ -338,11 +341,11 @@ class GS1Host(Host):
             if gmap_info:
                 _, map_x, map_y = gmap_info
                 packet = build_board_modify2(
-                    map_x, map_y, x, y, width, height, bytes(tiles)
+                    map_x, map_y, x, y, width, height, tiles
                 )
             else:
                 packet = build_board_modify(
-                    x, y, width, height, bytes(tiles)
+                    x, y, width, height, tiles
                 )
             _schedule(self.server.broadcast_to_level(
                 level.name, packet))
@@ -25,7 +25,7 @@ import shutil
 import subprocess
 import tempfile
 import zlib
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
@@ -251,6 +251,40 @@ class GS2Script:
     joined_classes: str = ''
     server_program: Optional[Any] = None
     server_runtime: Optional[Any] = None
+    # (fields encoded, packets) for announce_packets(); see there.
+    _announce: Optional[Tuple[tuple, Tuple[bytes, ...]]] = field(
+        default=None, init=False, repr=False, compare=False)
+
+    def announce_packets(self) -> Tuple[bytes, ...]:
+        """The packets that register this weapon with a client, built once.
+
+        Classic weapons are one PLO_NPCWEAPONADD carrying the script; compiled
+        ones are the add with the joined-class list, then the PLO_LOADSCRIPT
+        header. Every owned weapon is announced on every login, so the bytes
+        are kept. They are keyed on the fields they encode, so a script whose
+        image or bytecode is reassigned is rebuilt rather than served stale.
+        """
+        key = (self.name, self.image, self.clientside, self.bytecode,
+               self.joined_classes, self.header_with_crc)
+        cached = self._announce
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        if not self.bytecode:
+            packets = (build_npc_weapon_add(
+                self.name, self.image, self.clientside),)
+        else:
+            packets = (
+                build_npc_weapon_add_scripted(
+                    self.name, self.image, self.joined_classes),
+                build_load_script_header(self.header_with_crc),
+            )
+        self._announce = (key, packets)
+        return packets
+
+    async def announce(self, player: 'Player'):
+        """Register this weapon with `player`: send announce_packets()."""
+        for packet in self.announce_packets():
+            await player.send_raw(packet)
 
     def build_headers(self, source: str):
         """Derive the DES key, CRC32 and CSV headers from the full source.
@@ -588,16 +622,20 @@ class GS2ScriptManager:
         script = self.get_weapon(name)
         if script is None:
             return False
-        if not script.bytecode:
-            await player.send_raw(build_npc_weapon_add(
-                script.name, script.image, script.clientside))
-            return True
-        await player.send_raw(build_npc_weapon_add_scripted(
-            script.name, script.image, script.joined_classes))
-        await player.send_raw(build_load_script_header(script.header_with_crc))
+        await script.announce(player)
         return True
 
     async def announce_weapons(self, player: 'Player'):
-        """Announce every compiled weapon the player already owns."""
+        """Announce every compiled weapon the player already owns.
+
+        All of them go out as one send: the per-weapon packets are kept on
+        each script (announce_packets), so this is a join and one encode and
+        drain rather than one per weapon.
+        """
+        packets = []
         for name in list(getattr(player, 'weapons', []) or []):
-            await self.announce_weapon(player, name)
+            script = self.get_weapon(name)
+            if script is not None:
+                packets.extend(script.announce_packets())
+        if packets:
+            await player.send_raw(b''.join(packets))
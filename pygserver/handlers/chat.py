@@ -1,6 +1,7 @@
 """Chat, private messages, player flags and triggeractions."""
 
 import logging
+import sys
 
 from ..protocol.constants import PLI
 from ..protocol.packets import (
@@ -20,6 +21,11 @@ class CommunicationHandlers:
     @handles(PLI.TOALL)
     async def _handle_chat(self, data: bytes):
         """Handle PLI_TOALL chat packet."""
+        # A muted player's chat is dropped unread, and a bare length byte (or
+        # nothing) carries no message to decode.
+        if self.is_muted or len(data) < 2:
+            return
+
         reader = PacketReader(data)
         # PLI_TOALL is gchar-length-prefixed then the raw message (client's
         # build_chat matches GServer-v2 Player::msgPLI_TOALL readString(
@@ -29,7 +35,7 @@ class CommunicationHandlers:
         # match, so it never caught this; a playtester saw it immediately.)
         message = reader.read_gstring().strip()
 
-        if not message or self.is_muted:
+        if not message:
             return
 
         self.chat = message
@@ -55,7 +61,7 @@ class CommunicationHandlers:
         reader = PacketReader(data)
         count = reader.read_gshort()
         target_ids = [reader.read_gshort() for _ in range(count)]
-        message = reader.remaining().decode('latin-1', errors='replace')
+        message = reader.remaining_latin1()
         is_mass = len(target_ids) > 1
 
         for target_id in target_ids:
@@ -81,8 +87,7 @@ class CommunicationHandlers:
         The client parses PLO_SHOWIMG with the same layout as chat
         (gshort id + message), so relay it via build_chat.
         """
-        reader = PacketReader(data)
-        message = reader.remaining().decode('latin-1', errors='replace')
+        message = data.decode('latin-1')
 
         if not self.is_muted:
             packet = build_chat(self.id, message)
@@ -91,17 +96,14 @@ class CommunicationHandlers:
     @handles(PLI.FLAGSET)
     async def _handle_flag_set(self, data: bytes):
         """Handle PLI_FLAGSET packet."""
-        reader = PacketReader(data)
-        flag_data = reader.remaining().decode('latin-1', errors='replace')
-        if '=' not in flag_data:
-            name = flag_data.strip()
+        name, sep, value = data.decode('latin-1').partition('=')
+        name = name.strip()
+        if not sep:
             if name.startswith('server.'):
                 await self.server.set_flag(name, "")
             else:
-                self.flags[name] = True
+                self.flags[sys.intern(name)] = True
             return
-        name, value = flag_data.split('=', 1)
-        name = name.strip()
         value = value.strip()
         if name.startswith('server.'):
             if value:
@@ -110,14 +112,16 @@ class CommunicationHandlers:
                 await self.server.del_flag(name)
             return
         if value:
-            self.flags[name] = value
+            # Interned: the same few flag names arrive from every player, so
+            # they share one str instead of one per decode.
+            self.flags[sys.intern(name)] = value
         else:
             self.flags.pop(name, None)
 
     @handles(PLI.FLAGDEL)
     async def _handle_flag_del(self, data: bytes):
         """Handle PLI_FLAGDEL packet."""
-        flag_name = data.decode('latin-1', errors='replace').strip()
+        flag_name = data.decode('latin-1').strip()
         if flag_name.startswith('server.'):
             await self.server.del_flag(flag_name)
         else:
@@ -137,7 +141,7 @@ class CommunicationHandlers:
         npc_id = reader.read_gint3()
         x = reader.read_gchar() / 2.0
         y = reader.read_gchar() / 2.0
-        action = reader.remaining().decode('latin-1', errors='replace').strip()
+        action = reader.remaining_latin1().strip()
 
         logger.debug(f"Trigger action at ({x}, {y}): {action}")
 
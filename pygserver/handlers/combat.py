@@ -3,7 +3,7 @@
 import logging
 
 from ..protocol.constants import PLI
-from ..protocol.packets import PacketReader
+from ..protocol.packets import PacketReader, build_explosion
 from .registry import handles
 
 logger = logging.getLogger(__name__)
@@ -22,8 +22,8 @@ class CombatHandlers:
         y = reader.read_gchar() / 2.0
         # {GCHAR player_power}{GCHAR timer}: power is bits 0-1, timer is
         # 50ms increments (+50ms) - see GServer-v2 msgPLI_BOMBADD
-        power = (reader.read_gchar() & 0x03) if reader.remaining() else 1
-        time_left = (reader.read_gchar() * 0.05 + 0.05) if reader.remaining() else 3.0
+        power = (reader.read_gchar() & 0x03) if reader.has_remaining() else 1
+        time_left = (reader.read_gchar() * 0.05 + 0.05) if reader.has_remaining() else 3.0
 
         if hasattr(self.server, 'combat_manager'):
             await self.server.combat_manager.handle_bomb_add(self, x, y, power, time_left)
@@ -53,9 +53,9 @@ class CombatHandlers:
         reader = PacketReader(data)
         x = reader.read_gchar() / 2.0
         y = reader.read_gchar() / 2.0
-        flags = reader.read_gchar() if reader.remaining() else (int(self.direction) & 0x03)
-        sprite = reader.read_gchar() if reader.remaining() else 0
-        power = reader.read_gchar() if reader.remaining() else 1
+        flags = reader.read_gchar() if reader.has_remaining() else (int(self.direction) & 0x03)
+        sprite = reader.read_gchar() if reader.has_remaining() else 0
+        power = reader.read_gchar() if reader.has_remaining() else 1
 
         if hasattr(self.server, 'combat_manager'):
             await self.server.combat_manager.handle_arrow_add(self, x, y, flags, sprite, power)
@@ -101,8 +101,8 @@ class CombatHandlers:
         target_id = reader.read_gshort()
         hurt_dx = reader.read_gchar_signed()
         hurt_dy = reader.read_gchar_signed()
-        power = reader.read_gchar() if reader.remaining() else 1
-        # npc_id = reader.read_gint3() if reader.remaining() else 0  # Not used yet
+        power = reader.read_gchar() if reader.has_remaining() else 1
+        # npc_id = reader.read_gint3() if reader.has_remaining() else 0  # Not used yet
 
         if hasattr(self.server, 'combat_manager'):
             await self.server.combat_manager.handle_hurt_player(self, target_id, power, hurt_dx, hurt_dy)
@@ -127,13 +127,12 @@ class CombatHandlers:
         if not self.level:
             return
         reader = PacketReader(data)
-        radius = reader.read_gchar() if reader.remaining() else 4
-        x = reader.read_gchar() / 2.0 if reader.remaining() else self.x
-        y = reader.read_gchar() / 2.0 if reader.remaining() else self.y
-        power = reader.read_gchar() if reader.remaining() else 2
+        radius = reader.read_gchar() if reader.has_remaining() else 4
+        x = reader.read_gchar() / 2.0 if reader.has_remaining() else self.x
+        y = reader.read_gchar() / 2.0 if reader.has_remaining() else self.y
+        power = reader.read_gchar() if reader.has_remaining() else 2
 
         # Broadcast explosion effect
-        from ..protocol.packets import build_explosion
         packet = build_explosion(x, y, radius, power)
         await self.server.broadcast_to_level(
             self.level.name, packet, exclude={self.id}
@@ -159,7 +158,7 @@ class CombatHandlers:
         power = reader.read_gchar() / 2.0
         x = reader.read_gchar() / 2.0
         y = reader.read_gchar() / 2.0
-        npc_id = reader.read_gint3() if reader.remaining() else None
+        npc_id = reader.read_gint3() if reader.has_remaining() else None
 
         if hasattr(self.server, 'combat_manager'):
             await self.server.combat_manager.handle_hit_objects(self, x, y, power, npc_id)
@@ -94,7 +94,7 @@ class EntityHandlers:
                 "4-field format, falling back to legacy [id][damage]"
             )
             baddy_id = reader.read_gchar()
-            damage = reader.read_gchar() if reader.remaining() else 1
+            damage = reader.read_gchar() if reader.has_remaining() else 1
 
         if hasattr(self.server, 'baddy_manager'):
             await self.server.baddy_manager.handle_baddy_hurt(self, baddy_id, damage)
@@ -110,7 +110,7 @@ class EntityHandlers:
         y = reader.read_gchar() / 2.0
         baddy_type = reader.read_gchar()
         power = min(reader.read_gchar(), 12)
-        image = reader.remaining().decode('latin-1', errors='replace')
+        image = reader.remaining_latin1()
         if image and not Path(image).suffix:
             image += ".gif"
 
@@ -152,17 +152,14 @@ class EntityHandlers:
     @handles(PLI.NPCWEAPONDEL)
     async def _handle_npc_weapon_del(self, data: bytes):
         """Handle PLI_NPCWEAPONDEL packet."""
-        reader = PacketReader(data)
-        weapon_name = reader.remaining().decode('latin-1', errors='replace')
+        weapon_name = data.decode('latin-1')
 
-        if weapon_name in self.weapons:
-            self.weapons.remove(weapon_name)
+        self.weapons.pop(weapon_name, None)
 
     @handles(PLI.WEAPONADD)
     async def _handle_weapon_add(self, data: bytes):
         """Handle PLI_WEAPONADD packet (client requesting to add weapon)."""
-        reader = PacketReader(data)
-        weapon_name = reader.remaining().decode('latin-1', errors='replace')
+        weapon_name = data.decode('latin-1')
 
-        if weapon_name and weapon_name not in self.weapons:
-            self.weapons.append(weapon_name)
+        if weapon_name:
+            self.weapons.setdefault(weapon_name, None)
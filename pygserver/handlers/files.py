@@ -15,8 +15,7 @@ class FileHandlers:
     @handles(PLI.WANTFILE)
     async def _handle_want_file(self, data: bytes):
         """Handle PLI_WANTFILE packet."""
-        reader = PacketReader(data)
-        filename = reader.remaining().decode('latin-1', errors='replace')
+        filename = data.decode('latin-1')
 
         if hasattr(self.server, 'filesystem'):
             await self.server.filesystem.handle_want_file(self, filename)
@@ -26,7 +25,7 @@ class FileHandlers:
         """Handle PLI_UPDATEFILE packet."""
         reader = PacketReader(data)
         mod_time = reader.read_gint5()
-        filename = reader.remaining().decode('latin-1', errors='replace')
+        filename = reader.remaining_latin1()
 
         if hasattr(self.server, 'filesystem'):
             await self.server.filesystem.handle_update_file(
@@ -38,7 +37,7 @@ class FileHandlers:
         """Handle PLI_VERIFYWANTSEND packet."""
         reader = PacketReader(data)
         checksum = reader.read_gint5()
-        filename = reader.remaining().decode('latin-1', errors='replace')
+        filename = reader.remaining_latin1()
 
         if hasattr(self.server, 'filesystem'):
             await self.server.filesystem.handle_verify_want_send(self, checksum, filename)
@@ -53,7 +52,7 @@ class FileHandlers:
         """Handle PLI_UPDATEGANI packet: [gint5 crc32][gani name]."""
         reader = PacketReader(data)
         checksum = reader.read_gint5()
-        name = reader.remaining().decode('latin-1', errors='replace')
+        name = reader.remaining_latin1()
 
         gs2 = getattr(self.server, 'gs2_manager', None)
         if gs2 is not None:
@@ -62,8 +61,7 @@ class FileHandlers:
     @handles(PLI.UPDATESCRIPT)
     async def _handle_update_script(self, data: bytes):
         """Handle PLI_UPDATESCRIPT packet (payload is a weapon name)."""
-        reader = PacketReader(data)
-        name = reader.remaining().decode('latin-1', errors='replace')
+        name = data.decode('latin-1')
 
         gs2 = getattr(self.server, 'gs2_manager', None)
         if gs2 is not None:
@@ -74,7 +72,7 @@ class FileHandlers:
         """Handle PLI_UPDATECLASS packet: [gint5 crc32][class name]."""
         reader = PacketReader(data)
         checksum = reader.read_gint5()
-        classname = reader.remaining().decode('latin-1', errors='replace')
+        classname = reader.remaining_latin1()
 
         gs2 = getattr(self.server, 'gs2_manager', None)
         if gs2 is not None:
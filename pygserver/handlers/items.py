@@ -2,7 +2,7 @@
 
 import logging
 
-from ..protocol.constants import PLI
+from ..protocol.constants import PLI, LevelItemType
 from ..protocol.packets import PacketReader
 from .registry import handles
 
@@ -20,10 +20,9 @@ class ItemHandlers:
         reader = PacketReader(data)
         x = reader.read_gchar() / 2.0
         y = reader.read_gchar() / 2.0
-        item_type = reader.read_gchar() if reader.remaining() else 0
+        item_type = reader.read_gchar() if reader.has_remaining() else 0
 
         if hasattr(self.server, 'item_manager'):
-            from ..protocol.constants import LevelItemType
             await self.server.item_manager.spawn_item(
                 self.level, x, y, LevelItemType(item_type),
                 exclude_player_id=self.id,
@@ -81,10 +80,10 @@ class ItemHandlers:
         reader = PacketReader(data)
         x = reader.read_gchar() / 2.0
         y = reader.read_gchar() / 2.0
-        dir_bushes = reader.read_gchar() if reader.remaining() else 0x0E  # dir=2, bushes=3
+        dir_bushes = reader.read_gchar() if reader.has_remaining() else 0x0E  # dir=2, bushes=3
         direction = dir_bushes & 0x03
         bushes = dir_bushes >> 2
-        image = reader.remaining().decode('latin-1', errors='replace') if reader.remaining() else "horse.png"
+        image = reader.remaining_latin1() or "horse.png"
 
         if hasattr(self.server, 'horse_manager'):
             await self.server.horse_manager.handle_horse_add_packet(
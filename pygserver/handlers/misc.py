@@ -3,7 +3,13 @@
 import logging
 
 from ..protocol.constants import PLI
-from ..protocol.packets import PacketReader
+from ..protocol.packets import (
+    PacketReader,
+    build_board_modify,
+    build_board_modify2,
+    build_profile,
+    parse_profile,
+)
 from .registry import handles
 
 logger = logging.getLogger(__name__)
@@ -20,11 +26,10 @@ class MiscHandlers:
 
         # Parse modification data
         reader = PacketReader(data)
-        x = reader.read_gchar()
-        y = reader.read_gchar()
-        w = reader.read_gchar()
-        h = reader.read_gchar()
-        tile_data = reader.remaining()
+        x, y, w, h = reader.read_gchars(4)
+        # A view, not a copy: the tiles are only indexed below and then
+        # joined straight into the relayed packet.
+        tile_data = reader.remaining_view()
 
         # Validate bounds
         if x < 0 or y < 0 or w <= 0 or h <= 0:
@@ -50,7 +55,6 @@ class MiscHandlers:
                     idx += 2
 
         # Broadcast modification to other players on level
-        from ..protocol.packets import build_board_modify, build_board_modify2
         gmap_info = self.server.world.get_gmap_for_level(self.level.name)
         if gmap_info:
             _, map_x, map_y = gmap_info
@@ -83,14 +87,12 @@ class MiscHandlers:
         from the locally-persisted account profile fields instead (see
         ProfileManager).
         """
-        reader = PacketReader(data)
-        account_name = reader.remaining().decode('latin-1', errors='replace')
+        account_name = data.decode('latin-1')
 
         if hasattr(self.server, 'profile_manager'):
             profile = self.server.profile_manager.get_profile(account_name)
             if not profile:
                 return
-            from ..protocol.packets import build_profile
             packet = build_profile(profile['account'], profile, profile.get('online_time', ''))
             await self.send_raw(packet)
 
@@ -103,7 +105,6 @@ class MiscHandlers:
         embedded account name isn't the sender's own - mirror that here
         before persisting anything.
         """
-        from ..protocol.packets import parse_profile
         profile_data = parse_profile(data)
 
         if profile_data.get('account') != self.account_name:
@@ -137,8 +138,7 @@ class MiscHandlers:
         directory of its own to consult, so without a live list server
         connection there's nowhere to look this up - log and drop.
         """
-        reader = PacketReader(data)
-        server_name = reader.remaining().decode('latin-1', errors='replace')
+        server_name = data.decode('latin-1')
 
         listserver = getattr(self.server, 'listserver', None)
         if listserver is not None and listserver.connected:
@@ -158,8 +158,7 @@ class MiscHandlers:
     @handles(PLI.LANGUAGE)
     async def _handle_language(self, data: bytes):
         """Handle PLI_LANGUAGE packet."""
-        reader = PacketReader(data)
-        language = reader.remaining().decode('latin-1', errors='replace')
+        language = data.decode('latin-1')
         logger.debug(f"Player {self.id} language: {language}")
 
     @handles(PLI.MUTEPLAYER)
@@ -186,8 +185,7 @@ class MiscHandlers:
         the client's process list and discards it without acting on it -
         this is the same no-op, just with the parse for observability.
         """
-        reader = PacketReader(data)
-        processes = reader.remaining().decode('latin-1', errors='replace')
+        processes = data.decode('latin-1')
         logger.debug(f"{self.account_name} process list: {processes!r}")
 
     @handles(PLI.CLAIMPKER)
@@ -212,7 +210,7 @@ class MiscHandlers:
         PlayerRequestText.cpp msgPLI_REQUESTTEXT). A prior revision here
         implemented a "get server variable" protocol that matched no oracle.
         """
-        text = data.decode('latin-1', errors='replace')
+        text = data.decode('latin-1')
         irc = getattr(self.server, 'irc_manager', None)
         if irc is not None:
             await irc.handle_request_text(self, text)
@@ -221,7 +219,7 @@ class MiscHandlers:
     async def _handle_send_text(self, data: bytes):
         """Handle PLI_SENDTEXT packet (same wire shape as REQUESTTEXT; the
         command half of the text-op surface - irc login/join/part/privmsg)."""
-        text = data.decode('latin-1', errors='replace')
+        text = data.decode('latin-1')
         irc = getattr(self.server, 'irc_manager', None)
         if irc is not None:
             await irc.handle_send_text(self, text)
@@ -2,9 +2,10 @@
 
 import logging
 
-from ..protocol.constants import PLI, PLO, PLPROP
+from ..protocol.constants import PLI, PLPROP
 from ..protocol.packets import (
     PacketReader,
+    build_board_packet,
     build_level_name,
     build_other_player_props,
     build_raw_data_announcement,
@@ -29,6 +30,21 @@ _RELAYED_PROPS = {
 }
 
 
+# Props stored straight onto Player attributes, looked up per prop that
+# arrived rather than tested one by one against every packet. DIRECTION and
+# SPRITE share id 17, and the value has always been applied to both.
+_APPLIED_PROPS = {
+    PLPROP.SPRITE: ('direction', 'sprite'),
+    PLPROP.CARRYSPRITE: ('carrysprite',),
+    # Unconditional like CARRYSPRITE: 0 means the carried NPC was released,
+    # so a stale id must not survive a drop-without-throw.
+    PLPROP.CARRYNPC: ('npc_id',),
+    PLPROP.GANI: ('gani',),
+    PLPROP.HEADIMAGE: ('head_image',),
+    PLPROP.BODYIMAGE: ('body_image',),
+}
+
+
 class MovementHandlers:
     """Mixin: PLI_LEVELWARP/LEVELWARPMOD/PLAYERPROPS/ADJACENTLEVEL."""
 
@@ -38,7 +54,7 @@ class MovementHandlers:
         reader = PacketReader(data)
         x = reader.read_gchar() / 2.0
         y = reader.read_gchar() / 2.0
-        level_name = reader.remaining().decode('latin-1', errors='replace').strip()
+        level_name = reader.remaining_latin1().strip()
 
         if level_name:
             await self.warp(level_name, x, y)
@@ -62,33 +78,28 @@ class MovementHandlers:
         """Handle PLI_PLAYERPROPS packet."""
         props = parse_player_props(data)
 
-        # Update position
+        # Update position. Whether each axis moved is settled here once; the
+        # relay below used to re-test all four position ids twice over.
+        x_changed = y_changed = True
         if PLPROP.X2 in props:
             self.x = props[PLPROP.X2]
         elif PLPROP.X in props:
             self.x = props[PLPROP.X] / 2.0
+        else:
+            x_changed = False
 
         if PLPROP.Y2 in props:
             self.y = props[PLPROP.Y2]
         elif PLPROP.Y in props:
             self.y = props[PLPROP.Y] / 2.0
+        else:
+            y_changed = False
 
-        if PLPROP.DIRECTION in props:
-            self.direction = props[PLPROP.DIRECTION]
-
-        if PLPROP.SPRITE in props:
-            self.sprite = props[PLPROP.SPRITE]
-
-        if PLPROP.CARRYSPRITE in props:
-            self.carrysprite = props[PLPROP.CARRYSPRITE]
-
-        if PLPROP.CARRYNPC in props:
-            # Unconditional like CARRYSPRITE: 0 means the carried NPC was
-            # released, so a stale id must not survive a drop-without-throw.
-            self.npc_id = props[PLPROP.CARRYNPC]
-
-        if PLPROP.GANI in props:
-            self.gani = props[PLPROP.GANI]
+        for prop_id, value in props.items():
+            attrs = _APPLIED_PROPS.get(prop_id)
+            if attrs is not None:
+                for attr in attrs:
+                    setattr(self, attr, value)
 
         # Local level chat (PLPROP_CURCHAT, sent by Client.send_level_chat via
         # PLI_PLAYERPROPS) fires the GS1 "playerchats" NPC event, e.g. the
@@ -103,11 +114,7 @@ class MovementHandlers:
             if self.level and getattr(self.server, 'npc_manager', None):
                 await self.server.npc_manager.on_player_chats(self, self.chat)
 
-        # Appearance updates
-        if PLPROP.HEADIMAGE in props:
-            self.head_image = props[PLPROP.HEADIMAGE]
-        if PLPROP.BODYIMAGE in props:
-            self.body_image = props[PLPROP.BODYIMAGE]
+        # Appearance updates (head/body images were applied above)
         if PLPROP.COLORS in props:
             # Body colour slots, parsed and then dropped like the gear below.
             # The reference server stores them verbatim at this point
@@ -150,15 +157,11 @@ class MovementHandlers:
             # dropped every movement update from classic-prop senders, so
             # other players saw them frozen at their spawn position. Relay
             # as X2/Y2 (self.x/y were normalized above) whichever arrived.
-            if PLPROP.X in props or PLPROP.X2 in props:
+            if x_changed:
                 broadcast_props[PLPROP.X2] = self.x
-            if PLPROP.Y in props or PLPROP.Y2 in props:
+            if y_changed:
                 broadcast_props[PLPROP.Y2] = self.y
-            position_changed = (
-                PLPROP.X in props or PLPROP.X2 in props
-                or PLPROP.Y in props or PLPROP.Y2 in props
-            )
-            if position_changed:
+            if x_changed or y_changed:
                 gmap_info = self.server.world.get_gmap_for_level(self.level.name)
                 if gmap_info:
                     broadcast_props[PLPROP.GMAPLEVELX] = gmap_info[1]
@@ -191,8 +194,7 @@ class MovementHandlers:
         """Handle PLI_ADJACENTLEVEL - client preloading a neighbouring GMAP
         segment. Send that level's name + board so the client can stitch the
         world together; no warp and no player-add (the player stays put)."""
-        reader = PacketReader(data)
-        level_name = reader.remaining().decode('latin-1', errors='replace').strip()
+        level_name = data.decode('latin-1').strip()
         if not level_name:
             return
         level = self.server.world.get_level(level_name)
@@ -204,7 +206,8 @@ class MovementHandlers:
         # belong to that segment and are sent when the player actually warps in;
         # sending them here leaks e.g. neighbouring signs into the current level.
         level_name_pkt = build_level_name(level.name)
-        tile_data = level.get_board_packet()
-        board_packet = bytes([PLO.BOARDPACKET + 32]) + tile_data + b'\n'
+        board_packet = build_board_packet(level.board_view())
         announcement = build_raw_data_announcement(len(board_packet))
-        await self.send_raw(level_name_pkt + announcement + board_packet)
+        await self.send_raw(b''.join((
+            level_name_pkt, announcement, board_packet,
+        )))
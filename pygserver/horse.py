@@ -406,12 +406,15 @@ class HorseManager:
             player: Player to send to
             level: Level to send horses from
         """
-        for horse in self.get_horses_on_level(level.name):
-            if horse.is_alive and not horse.is_ridden:
-                packet = build_horse_add(
-                    horse.x, horse.y, horse.direction, horse.bushes, horse.image
-                )
-                await player.send_raw(packet)
+        packets = [
+            build_horse_add(
+                horse.x, horse.y, horse.direction, horse.bushes, horse.image
+            )
+            for horse in self.get_horses_on_level(level.name)
+            if horse.is_alive and not horse.is_ridden
+        ]
+        if packets:
+            await player.send_raw(b''.join(packets))
 
     async def handle_player_warp(self, player: 'Player', old_level: Optional['Level'],
                                   new_level: 'Level'):
@@ -557,16 +557,20 @@ class ItemManager:
             player: Player to send to
             level: Level to send items from
         """
-        # Send ground items
-        for item in self.get_items_on_level(level.name):
-            packet = build_item_add(item.x, item.y, item.item_type.value)
-            await player.send_raw(packet)
+        # Ground items
+        packets = [
+            build_item_add(item.x, item.y, item.item_type.value)
+            for item in self.get_items_on_level(level.name)
+        ]
 
         # Announce chests: opened ones as the 3-byte form, unopened with item/sign
         for chest in self.get_chests_on_level(level.name):
             opened = player.account_name in chest.opened_by
-            packet = build_level_chest(
+            packets.append(build_level_chest(
                 opened, chest.x, chest.y,
                 chest.item_type.value, chest.sign_index
-            )
-            await player.send_raw(packet)
+            ))
+
+        # One encode and drain for the whole level rather than one per item.
+        if packets:
+            await player.send_raw(b''.join(packets))
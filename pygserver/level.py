@@ -6,7 +6,9 @@ tiles, NPCs, items, signs, and links.
 """
 
 import logging
-from typing import TYPE_CHECKING, Optional, List, Dict, Tuple
+from typing import (
+    TYPE_CHECKING, Optional, List, Dict, KeysView, Tuple, ValuesView,
+)
 from pathlib import Path
 
 from reborn_protocol.coords import LEVEL_SIZE, in_level_bounds, level_index
@@ -297,6 +299,14 @@ class Level:
         """Get tile data as board packet (8192 bytes)."""
         return bytes(self._tiles)
 
+    def board_view(self) -> memoryview:
+        """Read-only view of the tile data, without get_board_packet()'s copy.
+
+        It tracks later set_tile() calls, so use it before the next await (e.g.
+        b''.join it straight into the outgoing packet).
+        """
+        return memoryview(self._tiles).toreadonly()
+
     def add_player(self, player: 'Player'):
         """Add a player to this level."""
         self._players[player.id] = None
@@ -309,6 +319,16 @@ class Level:
         """Get IDs of players on this level, in join order (first = leader)."""
         return list(self._players.keys())
 
+    @property
+    def player_ids(self) -> KeysView[int]:
+        """Live view of get_player_ids(), without the copy.
+
+        For loops that finish before their next await; one that awaits while
+        iterating must take get_player_ids() instead, since a warp or
+        disconnect during the await resizes the underlying dict.
+        """
+        return self._players.keys()
+
     def get_leader_id(self) -> Optional[int]:
         """ID of this level's leader (the first player who joined and is
         still present), or None if the level is empty. GServer-v2
@@ -336,6 +356,11 @@ class Level:
         """Get all NPCs on this level."""
         return list(self._npcs.values())
 
+    @property
+    def npcs(self) -> ValuesView['NPC']:
+        """Live view of get_npcs(); same await caveat as player_ids."""
+        return self._npcs.values()
+
     def get_npc(self, npc_id: int) -> Optional['NPC']:
         """Get NPC by ID."""
         return self._npcs.get(npc_id)
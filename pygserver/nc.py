@@ -126,8 +126,10 @@ class NCManager:
             packet_id: Packet ID
             data: Packet data
         """
+        # Player ids are reused, so a session is only honoured for the player
+        # object it was registered with, never a later player on the same id.
         session = self.get_session(player.id)
-        if not session:
+        if not session or session.player is not player:
             logger.warning(f"NC packet from non-NC player {player.id}")
             return
 
@@ -201,7 +203,7 @@ class NCManager:
         """Handle NC_NPCSCRIPTSET - Set NPC script."""
         reader = PacketReader(data)
         npc_id = reader.read_gint3()
-        script = reader.remaining().decode('latin-1', errors='replace')
+        script = reader.remaining_latin1()
 
         npc = self.server.npc_manager.get_npc(npc_id)
         if npc:
@@ -216,7 +218,7 @@ class NCManager:
         npc_id = reader.read_gint3()
         x = reader.read_gchar() / 2.0
         y = reader.read_gchar() / 2.0
-        level_name = reader.remaining().decode('latin-1', errors='replace')
+        level_name = reader.remaining_latin1()
 
         npc = self.server.npc_manager.get_npc(npc_id)
         if npc:
@@ -237,7 +239,7 @@ class NCManager:
         """Handle NC_NPCFLAGSSET - Set NPC flags."""
         reader = PacketReader(data)
         npc_id = reader.read_gint3()
-        flags_str = reader.remaining().decode('latin-1', errors='replace')
+        flags_str = reader.remaining_latin1()
 
         npc = self.server.npc_manager.get_npc(npc_id)
         if npc:
@@ -257,7 +259,7 @@ class NCManager:
         y = reader.read_gchar() / 2.0
         level_name = reader.read_string()
         image = reader.read_string()
-        script = reader.remaining().decode('latin-1', errors='replace')
+        script = reader.remaining_latin1()
 
         # Get level
         level = self.server.world.get_level(level_name)
@@ -283,7 +285,7 @@ class NCManager:
     async def _handle_local_npcs_get(self, session: NCSession, data: bytes):
         """Handle NC_LOCALNPCSGET - Get NPCs on a level."""
         reader = PacketReader(data)
-        level_name = reader.remaining().decode('latin-1', errors='replace')
+        level_name = reader.remaining_latin1()
 
         level = self.server.world.get_level(level_name)
         if not level:
@@ -314,7 +316,7 @@ class NCManager:
     async def _handle_class_edit(self, session: NCSession, data: bytes):
         """Handle NC_CLASSEDIT - Edit a class."""
         reader = PacketReader(data)
-        class_name = reader.remaining().decode('latin-1', errors='replace')
+        class_name = reader.remaining_latin1()
 
         session.editing_class = class_name
 
@@ -334,7 +336,7 @@ class NCManager:
         """Handle NC_CLASSADD - Add/update a class."""
         reader = PacketReader(data)
         class_name = reader.read_string()
-        script = reader.remaining().decode('latin-1', errors='replace')
+        script = reader.remaining_latin1()
 
         if hasattr(self.server, 'class_manager'):
             self.server.class_manager.add_class(class_name, script)
@@ -348,7 +350,7 @@ class NCManager:
     async def _handle_class_delete(self, session: NCSession, data: bytes):
         """Handle NC_CLASSDELETE - Delete a class."""
         reader = PacketReader(data)
-        class_name = reader.remaining().decode('latin-1', errors='replace')
+        class_name = reader.remaining_latin1()
 
         if hasattr(self.server, 'class_manager'):
             self.server.class_manager.remove_class(class_name)
@@ -375,7 +377,7 @@ class NCManager:
     async def _handle_weapon_get(self, session: NCSession, data: bytes):
         """Handle NC_WEAPONGET - Get weapon details."""
         reader = PacketReader(data)
-        weapon_name = reader.remaining().decode('latin-1', errors='replace')
+        weapon_name = reader.remaining_latin1()
 
         session.editing_weapon = weapon_name
 
@@ -397,7 +399,7 @@ class NCManager:
         reader = PacketReader(data)
         weapon_name = reader.read_string()
         image = reader.read_string()
-        script = reader.remaining().decode('latin-1', errors='replace')
+        script = reader.remaining_latin1()
 
         if hasattr(self.server, 'weapon_manager'):
             self.server.weapon_manager.add_weapon(weapon_name, image, script)
@@ -407,7 +409,7 @@ class NCManager:
     async def _handle_weapon_delete(self, session: NCSession, data: bytes):
         """Handle NC_WEAPONDELETE - Delete a weapon."""
         reader = PacketReader(data)
-        weapon_name = reader.remaining().decode('latin-1', errors='replace')
+        weapon_name = reader.remaining_latin1()
 
         if hasattr(self.server, 'weapon_manager'):
             self.server.weapon_manager.remove_weapon(weapon_name)
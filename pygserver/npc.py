@@ -13,7 +13,7 @@ from typing import TYPE_CHECKING, Optional, Dict, Any, List, Callable
 from pathlib import Path
 
 from .protocol.packets import PacketBuilder, build_npc_props
-from .protocol.constants import PLO, NPCPROP
+from .protocol.constants import PLO, NPCPROP, NPCPROP_COUNT
 
 if TYPE_CHECKING:
     from .server import GameServer
@@ -167,22 +167,24 @@ class NPC:
 
     def build_props_packet(self) -> bytes:
         """Build NPC properties packet."""
-        props = {
-            NPCPROP.IMAGE: self.image,
-            NPCPROP.X: self.x,
-            NPCPROP.Y: self.y,
-            # High-precision position (pixel-accurate), sent alongside X/Y for
-            # compat. The client applies each prop as it reads it, so X2/Y2
-            # (75/76) must arrive after X/Y (2/3) for the high-precision value
-            # to win - which the ascending-id order build_npc_props writes in
-            # guarantees, independently of this dict's insertion order.
-            NPCPROP.X2: self.x,
-            NPCPROP.Y2: self.y,
-            # SPRITE carries the facing direction in its low 2 bits. direction
-            # can arrive as a float (script/default), so coerce before masking.
-            NPCPROP.SPRITE: int(self.direction) & 0x03,
-            NPCPROP.GLOVEPOWER: self.glove_power,
-        }
+        # One slot per prop id, None where unset: already in the ascending-id
+        # order build_npc_props writes, so it skips building and sorting a
+        # dict for every NPC on every level entry.
+        props = [None] * NPCPROP_COUNT
+        props[NPCPROP.IMAGE] = self.image
+        props[NPCPROP.X] = self.x
+        props[NPCPROP.Y] = self.y
+        # High-precision position (pixel-accurate), sent alongside X/Y for
+        # compat. The client applies each prop as it reads it, so X2/Y2
+        # (75/76) must arrive after X/Y (2/3) for the high-precision value
+        # to win - which the ascending-id order build_npc_props writes in
+        # guarantees, independently of the order the slots are filled here.
+        props[NPCPROP.X2] = self.x
+        props[NPCPROP.Y2] = self.y
+        # SPRITE carries the facing direction in its low 2 bits. direction
+        # can arrive as a float (script/default), so coerce before masking.
+        props[NPCPROP.SPRITE] = int(self.direction) & 0x03
+        props[NPCPROP.GLOVEPOWER] = self.glove_power
         if self.gani:
             props[NPCPROP.GANI] = self.gani
         if self.nickname:
@@ -740,12 +742,18 @@ class NPCManager:
 
         # Push props for any NPC whose visible state changed this tick so
         # players see movement, animation, chat, and appearance updates live.
+        # A busy level dirties many NPCs per tick; their packets are collected
+        # per level and sent as one blob, so each recipient encodes and drains
+        # once per tick instead of once per NPC.
+        pending: Dict[str, List[bytes]] = {}
         for npc in list(self._npcs.values()):
             if npc._dirty:
                 npc._dirty = False
                 if npc.level:
-                    packet = npc.build_props_packet()
-                    await self.server.broadcast_to_level(npc.level.name, packet)
+                    pending.setdefault(npc.level.name, []).append(
+                        npc.build_props_packet())
+        for level_name, packets in pending.items():
+            await self.server.broadcast_to_level(level_name, b''.join(packets))
 
     async def on_player_enters(self, player: 'Player', level: 'Level'):
         """Trigger on_player_enters for NPCs on level."""
@@ -19,7 +19,9 @@ player-data accessors the managers and NPC scripts use.
 
 import asyncio
 import logging
+import sys
 import time
+from operator import attrgetter
 from typing import TYPE_CHECKING, Optional, Dict, Any, Set, Tuple
 
 from .handlers import (
@@ -35,17 +37,21 @@ from .handlers import (
 from .player_login import LoginService
 from .player_session import PlayerSession
 from .player_state import Character, Identity, Inventory, Status
-from .protocol.constants import PLO, PLPROP
+from .protocol.constants import PLPROP
 from .protocol.packets import (
     PacketBuilder,
+    build_board_packet,
     build_player_props,
-    build_other_player_props,
+    build_other_player_props_seq,
     build_warp,
     build_warp2,
     build_player_left,
     build_level_name,
     build_raw_data_announcement,
     build_is_leader,
+    build_disc_message,
+    build_level_sign,
+    build_level_link,
 )
 
 if TYPE_CHECKING:
@@ -92,6 +98,9 @@ class Player(MovementHandlers, CombatHandlers, ItemHandlers, EntityHandlers,
         # so "the server ignored that" is visible instead of silent.
         self._unhandled_packet_ids: Set[int] = set()
 
+        # (state key, packet) for the last build_props_packet() - see there.
+        self._props_cache: Optional[Tuple[tuple, bytes]] = None
+
     # =========================================================================
     # Connection lifecycle
     # =========================================================================
@@ -108,7 +117,7 @@ class Player(MovementHandlers, CombatHandlers, ItemHandlers, EntityHandlers,
                 try:
                     data = await self.session.read(timeout=300.0)  # 5 minutes
                 except asyncio.TimeoutError:
-                    logger.info(f"Player {self.id} timed out")
+                    logger.info("Player %s timed out", self.id)
                     break
 
                 if not data:
@@ -128,6 +137,13 @@ class Player(MovementHandlers, CombatHandlers, ItemHandlers, EntityHandlers,
         """Clean up player resources on disconnect."""
         self.connected = False
 
+        # Unregister RC/NC sessions first, so a failure in the cleanup below
+        # cannot leave an admin session behind keyed by this (reusable) id.
+        if hasattr(self.server, 'rc_manager'):
+            self.server.rc_manager.unregister_session(self.id)
+        if hasattr(self.server, 'nc_manager'):
+            self.server.nc_manager.unregister_session(self.id)
+
         # Leave current level. The leave broadcast itself is left to
         # GameServer._remove_player (server.py), which runs right after this
         # in the connection's finally block - broadcasting it here too sent
@@ -152,16 +168,9 @@ class Player(MovementHandlers, CombatHandlers, ItemHandlers, EntityHandlers,
             if account:
                 self.server.account_manager.save_player_to_account(self, account)
 
-        # Unregister RC/NC sessions
-        if hasattr(self.server, 'rc_manager'):
-            self.server.rc_manager.unregister_session(self.id)
-        if hasattr(self.server, 'nc_manager'):
-            self.server.nc_manager.unregister_session(self.id)
-
     async def disconnect(self, message: str = ""):
         """Disconnect the player."""
         if message:
-            from .protocol.packets import build_disc_message
             try:
                 packet = build_disc_message(message)
                 await self.send_raw(packet)
@@ -262,7 +271,8 @@ class Player(MovementHandlers, CombatHandlers, ItemHandlers, EntityHandlers,
 
     async def warp(self, level_name: str, x: float, y: float):
         """Warp player to a level."""
-        logger.info(f"Player {self.id} warping to {level_name} at ({x}, {y})")
+        logger.info("Player %s warping to %s at (%s, %s)",
+                    self.id, level_name, x, y)
 
         # Find or load the destination FIRST: a bad/nonexistent level name
         # must not detach the player from their current level (this used to
@@ -340,14 +350,15 @@ class Player(MovementHandlers, CombatHandlers, ItemHandlers, EntityHandlers,
 
     async def _send_level(self, level: 'Level'):
         """Send level data to player."""
-        logger.info(f"Sending level {level.name} to player {self.id}")
+        logger.info("Sending level %s to player %s", level.name, self.id)
 
         # Build packets
         level_name_pkt = build_level_name(level.name)
 
-        # Board data format: [packet_id + 32] + [8192 tile bytes] + [\n]
-        tile_data = level.get_board_packet()  # 8192 bytes
-        board_packet = bytes([PLO.BOARDPACKET + 32]) + tile_data + b'\n'
+        # Board data format: [packet_id + 32] + [8192 tile bytes] + [\n]. The
+        # tiles are read through a view, so the board packet is their only
+        # copy before the join below.
+        board_packet = build_board_packet(level.board_view())
 
         # Announce raw data size (1 + 8192 + 1 = 8194)
         announcement = build_raw_data_announcement(len(board_packet))
@@ -364,7 +375,9 @@ class Player(MovementHandlers, CombatHandlers, ItemHandlers, EntityHandlers,
         else:
             warp_packet = build_warp(self.x, self.y, level.name)
 
-        combined = level_name_pkt + announcement + board_packet + warp_packet
+        combined = b''.join((
+            level_name_pkt, announcement, board_packet, warp_packet,
+        ))
         await self.send_raw(combined)
 
         # If this level is a GMAP segment, announce the .gmap name. That makes the
@@ -378,22 +391,31 @@ class Player(MovementHandlers, CombatHandlers, ItemHandlers, EntityHandlers,
             gmap_file = gmap.name if gmap.name.endswith('.gmap') else gmap.name + '.gmap'
             await self.send_raw(build_level_name(gmap_file))
 
-        # Send signs and links on level
-        from .protocol.packets import build_level_sign, build_level_link
-        for (sx, sy), text in level.get_signs().items():
-            await self.send_raw(build_level_sign(sx, sy, text))
-        for link in level.get_links():
-            await self.send_raw(build_level_link(
+        # Send signs and links on level, as one blob
+        level_features = [
+            build_level_sign(sx, sy, text)
+            for (sx, sy), text in level.get_signs().items()
+        ]
+        level_features.extend(
+            build_level_link(
                 link['dest_level'], link['x'], link['y'],
                 link['width'], link['height'], link['dest_x'], link['dest_y'],
-            ))
-
-        # Send NPCs on level
-        for npc in level.get_npcs():
-            await self.send_raw(npc.build_props_packet())
+            )
+            for link in level.get_links()
+        )
+        if level_features:
+            await self.send_raw(b''.join(level_features))
+
+        # Send NPCs on level. Built off the live view with no await in the
+        # loop, then sent as one blob.
+        npc_packets = []
+        for npc in level.npcs:
+            npc_packets.append(npc.build_props_packet())
             showimgs = npc.build_showimgs_packet()
             if showimgs is not None:
-                await self.send_raw(showimgs)
+                npc_packets.append(showimgs)
+        if npc_packets:
+            await self.send_raw(b''.join(npc_packets))
 
         # Send items on level
         if hasattr(self.server, 'item_manager'):
@@ -411,11 +433,17 @@ class Player(MovementHandlers, CombatHandlers, ItemHandlers, EntityHandlers,
             await self.send_raw(build_is_leader())
 
         # Exchange props with everyone else already in the world (see
-        # audience.Audience for the one definition of who that is).
-        for other in self.server.audience.players_in_world(
-                level.name, exclude={self.id}):
-            await self.send_raw(other.build_props_packet())
-            await other.send_raw(self.build_props_packet())
+        # audience.Audience for the one definition of who that is). Their props
+        # reach us as one blob - a single encode and drain however full the
+        # level is - and ours are built once for all of them.
+        others = self.server.audience.players_in_world(
+            level.name, exclude={self.id})
+        if others:
+            await self.send_raw(
+                b''.join(other.build_props_packet() for other in others))
+            own_props = self.build_props_packet()
+            for other in others:
+                await other.send_raw(own_props)
 
     # =========================================================================
     # Sending
@@ -425,9 +453,17 @@ class Player(MovementHandlers, CombatHandlers, ItemHandlers, EntityHandlers,
         """Send raw packet data (will be encoded)."""
         await self.session.send(data)
 
+    def write_raw(self, data: bytes) -> bool:
+        """Buffer raw packet data without draining; see PlayerSession.write."""
+        return self.session.write(data)
+
+    async def drain(self):
+        """Flush what write_raw() buffered."""
+        await self.session.drain()
+
     async def send_packet(self, packet_id: int, data: bytes = b""):
         """Send a packet with given ID and data."""
-        packet = PacketBuilder().write_gchar(packet_id).write_bytes(data).write_byte(ord('\n')).build()
+        packet = PacketBuilder().write_gchar(packet_id).write_bytes(data).write_newline().build()
         await self.send_raw(packet)
 
     async def send_props(self, props: dict):
@@ -436,7 +472,15 @@ class Player(MovementHandlers, CombatHandlers, ItemHandlers, EntityHandlers,
         await self.send_raw(packet)
 
     def build_props_packet(self) -> bytes:
-        """Build PLO_OTHERPLPROPS packet for this player."""
+        """Build PLO_OTHERPLPROPS packet for this player.
+
+        Every player entering a level asks each one already there for this
+        packet, so it is cached against a snapshot of the props it encodes and
+        only rebuilt when one of them differs. The snapshot is compared rather
+        than invalidated from setters because the state is also written
+        straight onto the components (player.character.x) and, for colors,
+        mutated in place by the GS1 host.
+        """
         gmap_info = (
             self.server.world.get_gmap_for_level(self.level.name)
             if self.level else None
@@ -451,28 +495,42 @@ class Player(MovementHandlers, CombatHandlers, ItemHandlers, EntityHandlers,
             grid_x = grid_y = None
             current_level = self.level.name if self.level else ""
 
-        props = {
-            PLPROP.NICKNAME: self.nickname,
-            PLPROP.X2: self.x,
-            PLPROP.Y2: self.y,
-            PLPROP.DIRECTION: self.direction,
-            PLPROP.SPRITE: self.sprite,
-            PLPROP.GANI: self.gani,
+        key = (
+            current_level, grid_x, grid_y, self.nickname, self.x, self.y,
+            self.direction, self.sprite, self.gani,
+            self.sword_power, self.sword_image,
+            self.shield_power, self.shield_image,
+            self.head_image, self.body_image, tuple(self.colors),
+            self.mp, self.ap,
+        )
+        cached = self._props_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        # Ascending PlayerProp-id order (see build_player_props for why the
+        # client needs it), written out so no dict is built just to be sorted.
+        props = (
+            (PLPROP.NICKNAME, self.nickname),
             # (power, image): the biased form is the only one that carries the
             # gear's image name, which is what the other client renders.
-            PLPROP.SWORDPOWER: (self.sword_power, self.sword_image),
-            PLPROP.SHIELDPOWER: (self.shield_power, self.shield_image),
-            PLPROP.HEADIMAGE: self.head_image,
-            PLPROP.BODYIMAGE: self.body_image,
-            PLPROP.CURLEVEL: current_level,
-            PLPROP.COLORS: self.colors,
-            PLPROP.MAGICPOINTS: self.mp,
-            PLPROP.ALIGNMENT: self.ap,
-        }
+            (PLPROP.SWORDPOWER, (self.sword_power, self.sword_image)),
+            (PLPROP.SHIELDPOWER, (self.shield_power, self.shield_image)),
+            (PLPROP.GANI, self.gani),
+            (PLPROP.HEADIMAGE, self.head_image),
+            (PLPROP.COLORS, self.colors),
+            # DIRECTION shares SPRITE's id (17); the sprite is what goes out.
+            (PLPROP.SPRITE, self.sprite),
+            (PLPROP.CURLEVEL, current_level),
+            (PLPROP.MAGICPOINTS, self.mp),
+            (PLPROP.ALIGNMENT, self.ap),
+            (PLPROP.BODYIMAGE, self.body_image),
+        )
         if gmap_info:
-            props[PLPROP.GMAPLEVELX] = grid_x
-            props[PLPROP.GMAPLEVELY] = grid_y
-        return build_other_player_props(self.id, props)
+            props += ((PLPROP.GMAPLEVELX, grid_x), (PLPROP.GMAPLEVELY, grid_y))
+        props += ((PLPROP.X2, self.x), (PLPROP.Y2, self.y))
+        packet = build_other_player_props_seq(self.id, props)
+        self._props_cache = (key, packet)
+        return packet
 
     def build_leave_packet(self) -> bytes:
         """Build PLO_PLAYERLEFT packet."""
@@ -488,7 +546,7 @@ class Player(MovementHandlers, CombatHandlers, ItemHandlers, EntityHandlers,
 
     def set_flag(self, name: str, value: str):
         """Set player flag value."""
-        self.flags[name] = value
+        self.flags[sys.intern(name)] = value
 
     def has_weapon(self, name: str) -> bool:
         """Check if player has a weapon."""
@@ -496,13 +554,11 @@ class Player(MovementHandlers, CombatHandlers, ItemHandlers, EntityHandlers,
 
     def add_weapon(self, name: str):
         """Add a weapon to player."""
-        if name not in self.weapons:
-            self.weapons.append(name)
+        self.weapons.setdefault(name, None)
 
     def remove_weapon(self, name: str):
         """Remove a weapon from player."""
-        if name in self.weapons:
-            self.weapons.remove(name)
+        self.weapons.pop(name, None)
 
 
 # =============================================================================
@@ -577,8 +633,9 @@ _STATE_ALIASES: Dict[str, Tuple[str, str]] = {
 def _state_alias(component: str, field: str) -> property:
     """Build the Player property that reads/writes component.field."""
 
-    def getter(self):
-        return getattr(getattr(self, component), field)
+    # attrgetter walks "component.field" in C; reads (is_muted on every chat,
+    # x/y on every props build) vastly outnumber writes.
+    getter = attrgetter("%s.%s" % (component, field))
 
     def setter(self, value):
         setattr(getattr(self, component), field, value)
@@ -66,7 +66,8 @@ class LoginService:
 
             # Parse login
             login = parse_login_packet(decrypted)
-            logger.info(f"Login from {login.get('username', '?')}, protocol={login.get('protocol', '?')}")
+            logger.info("Login from %s, protocol=%s",
+                        login.get('username', '?'), login.get('protocol', '?'))
 
             protocol = login.get('protocol', '')
             if protocol not in KNOWN_PROTOCOLS:
@@ -132,7 +133,11 @@ class LoginService:
 
         player.logged_in = True
         player.login_time = time.time()
-        logger.info(f"Player {player.id} logged in as {player.account_name}")
+        logger.info("Player %s logged in as %s", player.id, player.account_name)
+
+        index_player_name = getattr(player.server, 'index_player_name', None)
+        if index_player_name is not None:
+            index_player_name(player)
 
         listserver = getattr(player.server, 'listserver', None)
         if listserver:
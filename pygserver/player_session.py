@@ -50,6 +50,33 @@ class PlayerSession:
             logger.error(f"Send error: {e}")
             self.connected = False
 
+    def write(self, data: bytes) -> bool:
+        """Encode and buffer one packet without waiting on the socket.
+
+        For broadcasts: one slow peer no longer holds up the rest. Returns
+        True when the transport buffer is past its high-water mark, i.e. the
+        caller should drain() this session before writing to it again.
+        """
+        if not self.connected or not self.codec:
+            return False
+        try:
+            self.writer.write(self.codec.encode_packet(data))
+            transport = self.writer.transport
+            return (transport.get_write_buffer_size()
+                    > transport.get_write_buffer_limits()[1])
+        except Exception as e:
+            logger.error(f"Send error: {e}")
+            self.connected = False
+            return False
+
+    async def drain(self):
+        """Wait for a backed-up write() buffer to flush."""
+        try:
+            await self.writer.drain()
+        except Exception as e:
+            logger.error(f"Send error: {e}")
+            self.connected = False
+
     async def send_login_response(self, data: bytes):
         """Send the one packet that is encoded as a login response.
 
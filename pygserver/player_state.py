@@ -7,9 +7,12 @@ player._STATE_ALIASES), so the managers, the GS1 host, account persistence and
 the test suite are unaffected.
 
 Nothing here talks to the network or to Player: these are plain state holders.
+Each declares __slots__, so the ~45 fields of every connected player live in
+fixed slots instead of four per-instance dicts; a field must be listed there
+before __init__ can assign it.
 """
 
-from typing import Dict, List
+from typing import Dict
 
 from .protocol.constants import PLTYPE
 
@@ -17,6 +20,9 @@ from .protocol.constants import PLTYPE
 class Identity:
     """Who the account is, as far as other players see it."""
 
+    __slots__ = ('account_name', 'nickname', 'guild_name', 'guild_nickname',
+                 'connection_type')
+
     def __init__(self):
         self.account_name = ""
         self.nickname = ""
@@ -30,6 +36,15 @@ class Identity:
 class Character:
     """The body in the world: position, stats, gear and animation."""
 
+    __slots__ = (
+        'x', 'y', 'direction', 'carrysprite', 'npc_id',
+        'hearts', 'max_hearts', 'rupees', 'arrows', 'bombs',
+        'glove_power', 'sword_power', 'shield_power',
+        'kills', 'deaths',
+        'head_image', 'body_image', 'sword_image', 'shield_image', 'colors',
+        'mp', 'ap', 'gani', 'sprite', 'chat',
+    )
+
     def __init__(self):
         # Position (in tiles)
         self.x = 0.0
@@ -78,8 +93,12 @@ class Character:
 class Inventory:
     """Persisted per-account state: weapons, flags and custom attributes."""
 
+    __slots__ = ('weapons', 'flags', 'gattribs')
+
     def __init__(self):
-        self.weapons: List[str] = []
+        # Weapon names as an insertion-ordered set: membership is checked on
+        # every weapon packet, and login announces them in the order gained.
+        self.weapons: Dict[str, None] = {}
         self.flags: Dict[str, str] = {}
         # GATTRIBS (custom attributes)
         self.gattribs: Dict[int, str] = {}
@@ -88,6 +107,9 @@ class Inventory:
 class Status:
     """Server-imposed state and session bookkeeping."""
 
+    __slots__ = ('logged_in', 'is_frozen', 'is_ghost', 'is_muted',
+                 'admin_rights', 'login_time', 'last_packet_time')
+
     def __init__(self):
         self.logged_in = False
         self.is_frozen = False
@@ -20,6 +20,7 @@ from .packets import (
     # Building functions
     build_player_props,
     build_other_player_props,
+    build_other_player_props_seq,
     build_npc_props,
     build_level_name,
     build_level_link,
@@ -85,6 +86,7 @@ __all__ = [
     # Packet building
     "build_player_props",
     "build_other_player_props",
+    "build_other_player_props_seq",
     "build_npc_props",
     "build_level_name",
     "build_level_link",
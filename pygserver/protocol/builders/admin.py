@@ -1,12 +1,15 @@
 """Packet construction helpers."""
 
 import logging
+import struct
+from functools import lru_cache
 from typing import List, Tuple
 
 from ..packet_codec import PacketBuilder
 from ..constants import (
     PLO
 )
+from .core import _finish_player_props
 from ..constants import BDMODE, BDPROP, LevelItemType, NPCBLOCKFLAG, NPCPROP, NPCVISFLAG, PLI, PLPERM, PLPROP, PLSTATUS  # noqa: F401  - kept: original import block (star-import consumers rely on it)
 from ..packet_codec import PacketReader  # noqa: F401  - kept: original import block (star-import consumers rely on it)
 from reborn_protocol.props import COLORS_NEWWORLD, NPC_PROPS, PLAYER_PROPS, StreamPolicy, encode_value, parse_prop_stream, preset_power_image, with_gif_fallback  # noqa: F401  - kept: original import block (star-import consumers rely on it)
@@ -14,49 +17,68 @@ from typing import Any, Dict, Optional  # noqa: F401  - kept: original import bl
 
 logger = logging.getLogger(__name__)
 
+# Fixed lanes packed in one struct call, as the builder would write them (see
+# builders/combat.py): a file browser row's two gint5s (size, modtime) and the
+# [gchar id][gint3 npc id] head of NC_NPCADD.
+_PACK10 = struct.Struct('10B').pack
+_PACK4 = struct.Struct('4B').pack
+
 # =============================================================================
 # RC (Remote Control) Packets
 # =============================================================================
 
 def build_rc_chat(message: str) -> bytes:
     """Build PLO_RC_CHAT packet."""
-    builder = PacketBuilder().write_gchar(PLO.RC_CHAT)
-    builder.write_string(message)
-    builder.write_newline()
-    return builder.build()
+    return PacketBuilder.text_packet(PLO.RC_CHAT, message)
+
+
+@lru_cache(maxsize=64)
+def _rc_chat_prefix(account_name: str) -> bytes:
+    """[gchar PLO_RC_CHAT]"name: " - the same few RC names label every line."""
+    return b"".join((
+        bytes(((PLO.RC_CHAT + 32) & 0xFF,)),
+        account_name.encode("latin-1", "replace"),
+        b": ",
+    ))
+
+
+def build_rc_chat_from(account_name: str, message: str) -> bytes:
+    """Build PLO_RC_CHAT for a line an RC typed, labelled "name: message".
+
+    Same bytes as build_rc_chat(f"{account_name}: {message}"), with the
+    labelled prefix encoded once per name instead of once per line.
+    """
+    return b"".join((
+        _rc_chat_prefix(account_name),
+        message.encode("latin-1", "replace"),
+        b"\n",
+    ))
 
 
 def build_rc_server_options(options: str) -> bytes:
     """Build PLO_RC_SERVEROPTIONSGET packet."""
-    builder = PacketBuilder().write_gchar(PLO.RC_SERVEROPTIONSGET)
-    builder.write_string(options)
-    builder.write_newline()
-    return builder.build()
+    return PacketBuilder.text_packet(PLO.RC_SERVEROPTIONSGET, options)
 
 
 def build_rc_folder_config(config: str) -> bytes:
     """Build PLO_RC_FOLDERCONFIGGET packet."""
-    builder = PacketBuilder().write_gchar(PLO.RC_FOLDERCONFIGGET)
-    builder.write_string(config)
-    builder.write_newline()
-    return builder.build()
+    return PacketBuilder.text_packet(PLO.RC_FOLDERCONFIGGET, config)
 
 
 def build_rc_server_flags(flags: str) -> bytes:
     """Build PLO_RC_SERVERFLAGSGET packet."""
-    builder = PacketBuilder().write_gchar(PLO.RC_SERVERFLAGSGET)
-    builder.write_string(flags)
-    builder.write_newline()
-    return builder.build()
+    return PacketBuilder.text_packet(PLO.RC_SERVERFLAGSGET, flags)
 
 
-def build_rc_player_props(account: str, props: str) -> bytes:
-    """Build PLO_RC_PLAYERPROPSGET packet."""
+def build_rc_player_props(account: str, props) -> bytes:
+    """Build PLO_RC_PLAYERPROPSGET packet.
+
+    `props` is (prop_id, value) pairs in ascending PlayerProp-id order,
+    encoded by the same writer as PLO_PLAYERPROPS.
+    """
     builder = PacketBuilder().write_gchar(PLO.RC_PLAYERPROPSGET)
     builder.write_gstring(account)
-    builder.write_string(props)
-    builder.write_newline()
-    return builder.build()
+    return _finish_player_props(builder, props)
 
 
 def build_rc_player_rights(account: str, rights: int) -> bytes:
@@ -115,20 +137,28 @@ def build_rc_file_browser_dir(path: str, files: List[Tuple[str, int, int]]) -> b
     """
     builder = PacketBuilder().write_gchar(PLO.RC_FILEBROWSER_DIRLIST)
     builder.write_gstring(path)
+    # A listing can run to hundreds of rows; each is written straight into
+    # the buffer rather than through three builder calls.
+    data = builder.data
     for filename, size, modtime in files:
-        builder.write_gstring(filename)
-        builder.write_gint5(size)
-        builder.write_gint5(modtime)
+        name = filename.encode('latin-1', 'replace')
+        data.append((len(name) + 32) & 0xFF)
+        data += name
+        data += _PACK10(
+            ((size >> 28) + 32) & 0xFF, ((size >> 21) & 0x7F) + 32,
+            ((size >> 14) & 0x7F) + 32, ((size >> 7) & 0x7F) + 32,
+            (size & 0x7F) + 32,
+            ((modtime >> 28) + 32) & 0xFF, ((modtime >> 21) & 0x7F) + 32,
+            ((modtime >> 14) & 0x7F) + 32, ((modtime >> 7) & 0x7F) + 32,
+            (modtime & 0x7F) + 32,
+        )
     builder.write_newline()
     return builder.build()
 
 
 def build_rc_file_browser_message(message: str) -> bytes:
     """Build PLO_RC_FILEBROWSER_MESSAGE packet."""
-    builder = PacketBuilder().write_gchar(PLO.RC_FILEBROWSER_MESSAGE)
-    builder.write_string(message)
-    builder.write_newline()
-    return builder.build()
+    return PacketBuilder.text_packet(PLO.RC_FILEBROWSER_MESSAGE, message)
 
 
 def build_rc_max_upload_filesize(size: int) -> bytes:
@@ -163,16 +193,20 @@ def build_nc_npc_attributes(npc_id: int, attributes: str) -> bytes:
 
 def build_nc_npc_add(npc_id: int, name: str, npc_type: str, level: str) -> bytes:
     """Build PLO_NC_NPCADD packet."""
-    builder = PacketBuilder().write_gchar(PLO.NC_NPCADD)
-    builder.write_gint3(npc_id)
-    builder.write_gchar(50)  # Name tag
-    builder.write_gstring(name)
-    builder.write_gchar(51)  # Type tag
-    builder.write_gstring(npc_type)
-    builder.write_gchar(52)  # Level tag
-    builder.write_gstring(level)
-    builder.write_newline()
-    return builder.build()
+    name = name.encode('latin-1', 'replace')
+    npc_type = npc_type.encode('latin-1', 'replace')
+    level = level.encode('latin-1', 'replace')
+    return b"".join((
+        _PACK4((PLO.NC_NPCADD + 32) & 0xFF,
+               ((npc_id >> 14) + 32) & 0xFF,
+               ((npc_id >> 7) & 0x7F) + 32,
+               (npc_id & 0x7F) + 32),
+        # Each gstring is preceded by its tag: name 50, type 51, level 52.
+        bytes((50 + 32, (len(name) + 32) & 0xFF)), name,
+        bytes((51 + 32, (len(npc_type) + 32) & 0xFF)), npc_type,
+        bytes((52 + 32, (len(level) + 32) & 0xFF)), level,
+        b"\n",
+    ))
 
 
 def build_nc_npc_delete(npc_id: int) -> bytes:
@@ -212,18 +246,12 @@ def build_nc_class_get(name: str, script: str) -> bytes:
 
 def build_nc_class_add(name: str) -> bytes:
     """Build PLO_NC_CLASSADD packet."""
-    builder = PacketBuilder().write_gchar(PLO.NC_CLASSADD)
-    builder.write_string(name)
-    builder.write_newline()
-    return builder.build()
+    return PacketBuilder.text_packet(PLO.NC_CLASSADD, name)
 
 
 def build_nc_class_delete(name: str) -> bytes:
     """Build PLO_NC_CLASSDELETE packet."""
-    builder = PacketBuilder().write_gchar(PLO.NC_CLASSDELETE)
-    builder.write_string(name)
-    builder.write_newline()
-    return builder.build()
+    return PacketBuilder.text_packet(PLO.NC_CLASSDELETE, name)
 
 
 def build_nc_weapon_list(weapons: List[str]) -> bytes:
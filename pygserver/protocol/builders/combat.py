@@ -1,6 +1,7 @@
 """Packet construction helpers."""
 
 import logging
+import struct
 from typing import Optional
 
 from ..packet_codec import PacketBuilder
@@ -14,29 +15,39 @@ from typing import Any, Dict, List, Tuple  # noqa: F401  - kept: original import
 
 logger = logging.getLogger(__name__)
 
+# The fixed-shape packets below are packed in one struct call instead of a
+# PacketBuilder chain. Each lane is written exactly as the builder would:
+# a gchar is (v + 32) & 0xFF, a gshort is ((v >> 7) + 32) & 0xFF then
+# (v & 0x7F) + 32, a gint3 likewise from bit 14 down; the trailing 10 is the
+# newline terminator.
+_PACK4 = struct.Struct('4B')
+_PACK6 = struct.Struct('6B')
+_PACK8 = struct.Struct('8B')
+_PACK9 = struct.Struct('9B')
+_PACK10 = struct.Struct('10B')
+
+
 def build_bomb_add(player_id: int, x: float, y: float, power: int, time_left: float) -> bytes:
     """Build PLO_BOMBADD packet.
 
     Format: {GSHORT owner_id}{GCHAR x*2}{GCHAR y*2}{GCHAR power}{GCHAR timer}
     timer is 50ms increments (+50ms base); time_left is seconds.
     """
-    builder = PacketBuilder().write_gchar(PLO.BOMBADD)
-    builder.write_gshort(player_id)
-    builder.write_gchar(int(x * 2))
-    builder.write_gchar(int(y * 2))
-    builder.write_gchar(int(power) & 0x03)
-    builder.write_gchar(max(0, int(time_left / 0.05) - 1))
-    builder.write_newline()
-    return builder.build()
+    return _PACK8.pack(
+        (PLO.BOMBADD + 32) & 0xFF,
+        ((player_id >> 7) + 32) & 0xFF, (player_id & 0x7F) + 32,
+        (int(x * 2) + 32) & 0xFF,
+        (int(y * 2) + 32) & 0xFF,
+        (int(power) & 0x03) + 32,
+        (max(0, int(time_left / 0.05) - 1) + 32) & 0xFF,
+        10,
+    )
 
 
 def build_bomb_del(x: float, y: float) -> bytes:
     """Build PLO_BOMBDEL packet."""
-    builder = PacketBuilder().write_gchar(PLO.BOMBDEL)
-    builder.write_gchar(int(x * 2))
-    builder.write_gchar(int(y * 2))
-    builder.write_newline()
-    return builder.build()
+    return _PACK4.pack((PLO.BOMBDEL + 32) & 0xFF,
+                       (int(x * 2) + 32) & 0xFF, (int(y * 2) + 32) & 0xFF, 10)
 
 
 def build_arrow_add(player_id: int, x: float, y: float, flags: int,
@@ -53,26 +64,28 @@ def build_arrow_add(player_id: int, x: float, y: float, flags: int,
     direction and dropped sprite/power, corrupting the relay payload the
     client's parse_arrow_add() expects.
     """
-    builder = PacketBuilder().write_gchar(PLO.ARROWADD)
-    builder.write_gshort(player_id)
-    builder.write_gchar(int(x * 2))
-    builder.write_gchar(int(y * 2))
-    builder.write_gchar(flags & 0xFF)
-    builder.write_gchar(sprite)
-    builder.write_gchar(power)
-    builder.write_newline()
-    return builder.build()
+    return _PACK9.pack(
+        (PLO.ARROWADD + 32) & 0xFF,
+        ((player_id >> 7) + 32) & 0xFF, (player_id & 0x7F) + 32,
+        (int(x * 2) + 32) & 0xFF,
+        (int(y * 2) + 32) & 0xFF,
+        ((flags & 0xFF) + 32) & 0xFF,
+        (sprite + 32) & 0xFF,
+        (power + 32) & 0xFF,
+        10,
+    )
 
 
 def build_explosion(x: float, y: float, radius: int, power: int) -> bytes:
     """Build PLO_EXPLOSION packet."""
-    builder = PacketBuilder().write_gchar(PLO.EXPLOSION)
-    builder.write_gchar(int(x * 2))
-    builder.write_gchar(int(y * 2))
-    builder.write_gchar(int(radius))
-    builder.write_gchar(int(power))
-    builder.write_newline()
-    return builder.build()
+    return _PACK6.pack(
+        (PLO.EXPLOSION + 32) & 0xFF,
+        (int(x * 2) + 32) & 0xFF,
+        (int(y * 2) + 32) & 0xFF,
+        (int(radius) + 32) & 0xFF,
+        (int(power) + 32) & 0xFF,
+        10,
+    )
 
 
 def build_hurt_player(attacker_id: int, hurt_dx: int, hurt_dy: int,
@@ -85,14 +98,18 @@ def build_hurt_player(attacker_id: int, hurt_dx: int, hurt_dy: int,
     damage (0 = environment). hurtdx/hurtdy are signed (readGChar() on the
     client), so left/up knockback must round-trip through write_gchar_signed.
     """
-    builder = PacketBuilder().write_gchar(PLO.HURTPLAYER)
-    builder.write_gshort(attacker_id)
-    builder.write_gchar_signed(int(hurt_dx))
-    builder.write_gchar_signed(int(hurt_dy))
-    builder.write_gchar(int(power))
-    builder.write_gint3(npc_id)
-    builder.write_newline()
-    return builder.build()
+    # write_gchar_signed is write_gchar: the & 0xFF wrap is the signed form.
+    return _PACK10.pack(
+        (PLO.HURTPLAYER + 32) & 0xFF,
+        ((attacker_id >> 7) + 32) & 0xFF, (attacker_id & 0x7F) + 32,
+        (int(hurt_dx) + 32) & 0xFF,
+        (int(hurt_dy) + 32) & 0xFF,
+        (int(power) + 32) & 0xFF,
+        ((npc_id >> 14) + 32) & 0xFF,
+        ((npc_id >> 7) & 0x7F) + 32,
+        (npc_id & 0x7F) + 32,
+        10,
+    )
 
 
 def build_hit_objects(source_id: int, power: int, x: float, y: float,
@@ -120,12 +137,13 @@ def build_hit_objects(source_id: int, power: int, x: float, y: float,
 
 def build_fire_spy(player_id: int, x: float, y: float) -> bytes:
     """Build PLO_FIRESPY packet."""
-    builder = PacketBuilder().write_gchar(PLO.FIRESPY)
-    builder.write_gshort(player_id)
-    builder.write_gchar(int(x * 2))
-    builder.write_gchar(int(y * 2))
-    builder.write_newline()
-    return builder.build()
+    return _PACK6.pack(
+        (PLO.FIRESPY + 32) & 0xFF,
+        ((player_id >> 7) + 32) & 0xFF, (player_id & 0x7F) + 32,
+        (int(x * 2) + 32) & 0xFF,
+        (int(y * 2) + 32) & 0xFF,
+        10,
+    )
 
 
 def build_throw_carried(player_id: int) -> bytes:
@@ -138,19 +156,15 @@ def build_throw_carried(player_id: int) -> bytes:
     owner id. Previously this also wrote x/y/direction, which would have
     desynced the client's parser had this ever been called.
     """
-    builder = PacketBuilder().write_gchar(PLO.THROWCARRIED)
-    builder.write_gshort(player_id)
-    builder.write_newline()
-    return builder.build()
+    return _PACK4.pack((PLO.THROWCARRIED + 32) & 0xFF,
+                       ((player_id >> 7) + 32) & 0xFF, (player_id & 0x7F) + 32,
+                       10)
 
 
 def build_push_away(dx: float, dy: float) -> bytes:
     """Build PLO_PUSHAWAY packet (knockback)."""
-    builder = PacketBuilder().write_gchar(PLO.PUSHAWAY)
-    builder.write_gchar(int(dx * 2))
-    builder.write_gchar(int(dy * 2))
-    builder.write_newline()
-    return builder.build()
+    return _PACK4.pack((PLO.PUSHAWAY + 32) & 0xFF,
+                       (int(dx * 2) + 32) & 0xFF, (int(dy * 2) + 32) & 0xFF, 10)
 
 
 # =============================================================================
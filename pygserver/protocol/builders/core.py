@@ -1,6 +1,8 @@
 """Packet construction helpers."""
 
 import logging
+import time
+from functools import lru_cache
 from typing import List
 from reborn_protocol.props import (
     COLORS_NEWWORLD,
@@ -20,34 +22,46 @@ from typing import Any, Dict, Optional, Tuple  # noqa: F401  - kept: original im
 
 logger = logging.getLogger(__name__)
 
+# Builders whose output depends only on a small, repeating set of arguments
+# (a flag, a level name) are memoized with lru_cache: the result is immutable
+# bytes, so every warp or heartbeat can share one object instead of running a
+# PacketBuilder again. The parameterless ones return a module-level constant,
+# which skips even the cache lookup.
+
 # =============================================================================
 # Packet Builders
 # =============================================================================
 
+@lru_cache(maxsize=256)
 def build_level_name(level_name: str) -> bytes:
     """Build PLO_LEVELNAME packet."""
-    return PacketBuilder().write_gchar(PLO.LEVELNAME).write_string(level_name).write_byte(ord('\n')).build()
+    return PacketBuilder.text_packet(PLO.LEVELNAME, level_name)
 
 
 def build_level_link(dest_level: str, x: int, y: int, width: int, height: int,
                      dest_x: str, dest_y: str) -> bytes:
     """Build PLO_LEVELLINK packet."""
     link_str = f"{dest_level} {x} {y} {width} {height} {dest_x} {dest_y}"
-    return PacketBuilder().write_gchar(PLO.LEVELLINK).write_string(link_str).write_byte(ord('\n')).build()
+    return PacketBuilder.text_packet(PLO.LEVELLINK, link_str)
+
+
+_BOARDPACKET_HEADER = bytes(((PLO.BOARDPACKET + 32) & 0xFF,))
 
 
 def build_board_packet(tiles: bytes) -> bytes:
     """
     Build PLO_BOARDPACKET packet (raw 8192 bytes of tile data).
 
-    This is sent as raw data after a PLO_RAWDATA announcement.
+    The tiles are binary, so this is sent as raw data after a PLO_RAWDATA
+    announcement of its length. `tiles` may be any bytes-like object (e.g.
+    Level.board_view()).
     """
-    return tiles
+    return b"".join((_BOARDPACKET_HEADER, tiles, b"\n"))
 
 
 def build_raw_data_announcement(size: int) -> bytes:
     """Build PLO_RAWDATA packet to announce raw data size."""
-    return PacketBuilder().write_gchar(PLO.RAWDATA).write_gint3(size).write_byte(ord('\n')).build()
+    return PacketBuilder().write_gchar(PLO.RAWDATA).write_gint3(size).write_newline().build()
 
 
 def build_player_props(props: dict) -> bytes:
@@ -64,13 +78,8 @@ def build_player_props(props: dict) -> bytes:
     whatever order is convenient without silently corrupting every later
     prop on the wire.
     """
-    builder = PacketBuilder().write_gchar(PLO.PLAYERPROPS)
-
-    for prop_id, value in sorted(props.items()):
-        _write_player_prop(builder, prop_id, value)
-
-    builder.write_byte(ord('\n'))
-    return builder.build()
+    return _finish_player_props(
+        PacketBuilder().write_gchar(PLO.PLAYERPROPS), sorted(props.items()))
 
 
 # Outbound props are for v6.037 (new-world) clients, so PLPROP_COLORS is 8 wide.
@@ -89,7 +98,8 @@ def _write_player_prop(builder: 'PacketBuilder', prop_id: int, value) -> None:
     power or a (power, image) pair for SWORDPOWER/SHIELDPOWER, a preset int or a
     name for HEADIMAGE, a sequence for COLORS.
     """
-    desc = PLAYER_PROPS.get(int(prop_id))
+    prop_id = int(prop_id)
+    desc = PLAYER_PROPS.get(prop_id)
     if desc is None:
         logger.warning("build_player_props: unhandled prop %s (skipped)", prop_id)
         return
@@ -99,7 +109,20 @@ def _write_player_prop(builder: 'PacketBuilder', prop_id: int, value) -> None:
         logger.warning("build_player_props: prop %s (%s) value %r not encodable: %s",
                        prop_id, desc.name, value, exc)
         return
-    builder.write_gchar(int(prop_id)).write_bytes(payload)
+    builder.write_gchar(prop_id).write_bytes(payload)
+
+
+def _finish_player_props(builder: 'PacketBuilder', props) -> bytes:
+    """Write (prop_id, value) pairs in the order given, then terminate.
+
+    The one loop behind all three player-props builders; callers decide the
+    order (sorted, or a layout that is already ascending).
+    """
+    for prop_id, value in props:
+        _write_player_prop(builder, prop_id, value)
+
+    builder.write_newline()
+    return builder.build()
 
 
 def build_other_player_props(player_id: int, props: dict) -> bytes:
@@ -108,16 +131,24 @@ def build_other_player_props(player_id: int, props: dict) -> bytes:
     See build_player_props() for why props must be emitted in ascending
     PlayerProp-id order (GServer-v2 convention the client's parser relies on).
     """
-    builder = PacketBuilder().write_gchar(PLO.OTHERPLPROPS).write_gshort(player_id)
+    return _finish_player_props(
+        PacketBuilder().write_gchar(PLO.OTHERPLPROPS).write_gshort(player_id),
+        sorted(props.items()))
 
-    for prop_id, value in sorted(props.items()):
-        _write_player_prop(builder, prop_id, value)
 
-    builder.write_byte(ord('\n'))
-    return builder.build()
+def build_other_player_props_seq(player_id: int, props) -> bytes:
+    """Build PLO_OTHERPLPROPS from (prop_id, value) pairs, written as given.
 
+    For fixed layouts (Player.build_props_packet) that are already in
+    ascending PlayerProp-id order, so no dict has to be built only to be
+    sorted again. Ad-hoc callers should use build_other_player_props().
+    """
+    return _finish_player_props(
+        PacketBuilder().write_gchar(PLO.OTHERPLPROPS).write_gshort(player_id),
+        props)
 
-def build_npc_props(npc_id: int, props: dict) -> bytes:
+
+def build_npc_props(npc_id: int, props) -> bytes:
     """Build PLO_NPCPROPS packet.
 
     Widths and encodings come from reborn_protocol.props.NPC_PROPS, so this and
@@ -140,13 +171,22 @@ def build_npc_props(npc_id: int, props: dict) -> bytes:
     NPC.build_props_packet's natural grouping (image, x, y, x2, y2, sprite, ...)
     stopped the client dead at `sprite`, so every NPC arrived with only its
     image and position - no gani, nickname, colors, gear or gattribs.
+
+    `props` may also be a list indexed by prop id with None for unset slots
+    (NPC.build_props_packet builds one): it is already in ascending id order,
+    so it is walked as-is with no sort.
     """
     builder = PacketBuilder().write_gchar(PLO.NPCPROPS).write_gint3(npc_id)
 
-    for prop_id, value in sorted(props.items()):
-        _write_npc_prop(builder, prop_id, value)
+    if isinstance(props, dict):
+        for prop_id, value in sorted(props.items()):
+            _write_npc_prop(builder, prop_id, value)
+    else:
+        for prop_id, value in enumerate(props):
+            if value is not None:
+                _write_npc_prop(builder, prop_id, value)
 
-    builder.write_byte(ord('\n'))
+    builder.write_newline()
     return builder.build()
 
 
@@ -156,7 +196,8 @@ def _write_npc_prop(builder: 'PacketBuilder', prop_id: int, value) -> None:
     A prop that cannot be encoded is skipped WITHOUT writing its id, since a
     bare id with no payload desyncs every following prop in the packet.
     """
-    desc = NPC_PROPS.get(int(prop_id))
+    prop_id = int(prop_id)
+    desc = NPC_PROPS.get(prop_id)
     if desc is None:
         logger.warning("build_npc_props: unhandled prop %s (skipped)", prop_id)
         return
@@ -166,7 +207,7 @@ def _write_npc_prop(builder: 'PacketBuilder', prop_id: int, value) -> None:
         logger.warning("build_npc_props: prop %s (%s) value %r not encodable: %s",
                        prop_id, desc.name, value, exc)
         return
-    builder.write_gchar(int(prop_id)).write_bytes(payload)
+    builder.write_gchar(prop_id).write_bytes(payload)
 
 
 def build_chat(player_id: int, message: str) -> bytes:
@@ -174,7 +215,7 @@ def build_chat(player_id: int, message: str) -> bytes:
     builder = PacketBuilder().write_gchar(PLO.TOALL).write_gshort(player_id)
     builder.write_gchar(len(message))
     builder.write_string(message)
-    builder.write_byte(ord('\n'))
+    builder.write_newline()
     return builder.build()
 
 
@@ -185,7 +226,7 @@ def build_warp(x: float, y: float, level_name: str = "") -> bytes:
     builder.write_gchar(int(y * 2))
     if level_name:
         builder.write_string(level_name)
-    builder.write_byte(ord('\n'))
+    builder.write_newline()
     return builder.build()
 
 
@@ -205,19 +246,24 @@ def build_warp2(x: float, y: float, level_name: str, gmap_x: int = 0,
     builder.write_gchar(gmap_x)
     builder.write_gchar(gmap_y)
     builder.write_string(level_name)
-    builder.write_byte(ord('\n'))
+    builder.write_newline()
     return builder.build()
 
 
+@lru_cache(maxsize=1024)
 def build_player_left(player_id: int) -> bytes:
-    """Build player left packet using PLO_OTHERPLPROPS with JOINLEAVELVL=0."""
+    """Build player left packet using PLO_OTHERPLPROPS with JOINLEAVELVL=0.
+
+    Sent on every warp out of a level as well as on disconnect; player IDs
+    are reused lowest-first, so the live ones stay within the cache.
+    """
     # Send PLPROP_JOINLEAVELVL = 0 (leave) via PLO_OTHERPLPROPS
     return (PacketBuilder()
         .write_gchar(PLO.OTHERPLPROPS)
         .write_gshort(player_id)
         .write_gchar(PLPROP.JOINLEAVELVL)
         .write_gchar(0)  # 0 = leave
-        .write_byte(ord('\n'))
+        .write_newline()
         .build())
 
 
@@ -229,14 +275,18 @@ def build_world_time() -> bytes:
     epoch 2001-02-01T17:33:34Z. Clients read exactly 4 G-bytes; the old
     3-byte seconds-of-day encoding parsed as time=0 on their side.
     """
-    import time
-    world_time = int(time.time() - 981048814) // 5
-    return PacketBuilder().write_gchar(PLO.NEWWORLDTIME).write_gint4(world_time).write_byte(ord('\n')).build()
+    return _build_world_time(int(time.time() - 981048814) // 5)
+
+
+@lru_cache(maxsize=1)
+def _build_world_time(world_time: int) -> bytes:
+    """The packet for one 5-second unit; rebuilt only when the unit ticks."""
+    return PacketBuilder().write_gchar(PLO.NEWWORLDTIME).write_gint4(world_time).write_newline().build()
 
 
 def build_npc_del(npc_id: int) -> bytes:
     """Build PLO_NPCDEL packet."""
-    return PacketBuilder().write_gchar(PLO.NPCDEL).write_gint3(npc_id).write_byte(ord('\n')).build()
+    return PacketBuilder().write_gchar(PLO.NPCDEL).write_gint3(npc_id).write_newline().build()
 
 
 # Reborn sign-text alphabet (GServer-v2 LevelSign.cpp `signText`). Each plain
@@ -247,26 +297,35 @@ _SIGN_ALPHABET = (
 )
 
 
+class _SignCodeTable(dict):
+    """str.translate table for sign text: a character outside the alphabet
+    maps to None, which translate() drops."""
+
+    def __missing__(self, codepoint):
+        return None
+
+
+# Each character's first alphabet index as a GChar. LevelSign::encodeSignCode
+# always uses code 86 for a literal '#'; its earlier alphabet position (67) is
+# reserved by the escape table and decodes as '#.'.
+_SIGN_CODES = _SignCodeTable()
+for _idx, _ch in enumerate(_SIGN_ALPHABET):
+    _SIGN_CODES.setdefault(ord(_ch), chr(_idx + 32))
+_SIGN_CODES[ord('#')] = chr(86 + 32)
+
+
 def encode_sign_text(text: str) -> bytes:
     """Encode plain sign text into the Reborn sign-code byte stream.
 
     Mirrors GServer-v2 encodeSign/encodeSignCode for the common (non-symbol)
-    case: each line is encoded char-by-char against the sign alphabet and
-    terminated with an encoded newline. Characters absent from the alphabet are
-    dropped (button-symbol '#' escapes are not emitted by the server fixtures).
+    case: each line is encoded against the sign alphabet and terminated with an
+    encoded newline. Characters absent from the alphabet are dropped
+    (button-symbol '#' escapes are not emitted by the server fixtures).
+
+    One str.translate() over the whole text does the per-character lookup in
+    C; '\n' is in the alphabet, so only the last line's terminator is added.
     """
-    out = bytearray()
-    for line in text.split('\n'):
-        for ch in line:
-            # LevelSign::encodeSignCode always uses code 86 for a literal '#'.
-            # Its earlier alphabet position (67) is reserved by the escape
-            # table and decodes as '#.'.
-            idx = 86 if ch == '#' else _SIGN_ALPHABET.find(ch)
-            if idx != -1:
-                out.append((idx + 32) & 0xFF)
-        # Encoded newline (alphabet index of '\n').
-        out.append((_SIGN_ALPHABET.find('\n') + 32) & 0xFF)
-    return bytes(out)
+    return (text.translate(_SIGN_CODES) + _SIGN_CODES[ord('\n')]).encode('latin-1')
 
 
 def build_level_sign(x: int, y: int, text: str) -> bytes:
@@ -275,7 +334,7 @@ def build_level_sign(x: int, y: int, text: str) -> bytes:
     builder.write_gchar(int(x))
     builder.write_gchar(int(y))
     builder.write_bytes(encode_sign_text(text))
-    builder.write_byte(ord('\n'))
+    builder.write_newline()
     return builder.build()
 
 
@@ -288,21 +347,27 @@ def build_level_sign(x: int, y: int, text: str) -> bytes:
 # System Packets
 # =============================================================================
 
+_SIGNATURE_PACKET = bytes(((PLO.SIGNATURE + 32) & 0xFF, 0x0A))
+
+
 def build_signature() -> bytes:
     """Build PLO_SIGNATURE packet."""
-    builder = PacketBuilder().write_gchar(PLO.SIGNATURE)
-    builder.write_newline()
-    return builder.build()
+    return _SIGNATURE_PACKET
+
+
+_SERVERTEXT_HEADER = bytes(((PLO.SERVERTEXT + 32) & 0xFF,))
 
 
 def build_server_text(key: str, value: str) -> bytes:
     """Build PLO_SERVERTEXT packet."""
-    builder = PacketBuilder().write_gchar(PLO.SERVERTEXT)
-    builder.write_string(key)
-    builder.write_byte(0x00)  # Separator
-    builder.write_string(value)
-    builder.write_newline()
-    return builder.build()
+    # key NUL value, joined directly; same bytes as the builder chain.
+    return b"".join((
+        _SERVERTEXT_HEADER,
+        key.encode("latin-1", "replace"),
+        b"\x00",
+        value.encode("latin-1", "replace"),
+        b"\n",
+    ))
 
 
 def build_default_weapon(weapon_name: str) -> bytes:
@@ -313,6 +378,7 @@ def build_default_weapon(weapon_name: str) -> bytes:
     return builder.build()
 
 
+@lru_cache(maxsize=None)
 def build_has_npc_server(has: bool) -> bytes:
     """Build PLO_HASNPCSERVER packet."""
     builder = PacketBuilder().write_gchar(PLO.HASNPCSERVER)
@@ -323,10 +389,13 @@ def build_has_npc_server(has: bool) -> bytes:
 
 def build_staff_guilds(guilds: List[str]) -> bytes:
     """Build PLO_STAFFGUILDS packet."""
-    builder = PacketBuilder().write_gchar(PLO.STAFFGUILDS)
-    builder.write_string(','.join(guilds))
-    builder.write_newline()
-    return builder.build()
+    return _build_staff_guilds(tuple(guilds))
+
+
+@lru_cache(maxsize=16)
+def _build_staff_guilds(guilds: Tuple[str, ...]) -> bytes:
+    """The packet for one guild list; the server's list rarely changes."""
+    return PacketBuilder.text_packet(PLO.STAFFGUILDS, ','.join(guilds))
 
 
 def build_status_list(statuses: List[str]) -> bytes:
@@ -338,11 +407,12 @@ def build_status_list(statuses: List[str]) -> bytes:
     return builder.build()
 
 
+_CLEAR_WEAPONS_PACKET = bytes(((PLO.CLEARWEAPONS + 32) & 0xFF, 0x0A))
+
+
 def build_clear_weapons() -> bytes:
     """Build PLO_CLEARWEAPONS packet."""
-    builder = PacketBuilder().write_gchar(PLO.CLEARWEAPONS)
-    builder.write_newline()
-    return builder.build()
+    return _CLEAR_WEAPONS_PACKET
 
 
 def build_list_processes(processes: List[str]) -> bytes:
@@ -358,35 +428,36 @@ def build_list_processes(processes: List[str]) -> bytes:
 # Player State Packets
 # =============================================================================
 
+_WARP_FAILED_PACKET = bytes(((PLO.WARPFAILED + 32) & 0xFF, 0x0A))
+
+
 def build_warp_failed() -> bytes:
     """Build PLO_WARPFAILED packet."""
-    builder = PacketBuilder().write_gchar(PLO.WARPFAILED)
-    builder.write_newline()
-    return builder.build()
+    return _WARP_FAILED_PACKET
 
 
 def build_disc_message(message: str) -> bytes:
     """Build PLO_DISCMESSAGE packet (disconnect message)."""
-    builder = PacketBuilder().write_gchar(PLO.DISCMESSAGE)
-    builder.write_string(message)
-    builder.write_newline()
-    return builder.build()
+    return PacketBuilder.text_packet(PLO.DISCMESSAGE, message)
+
+
+_FREEZE_PLAYER_PACKET = bytes(((PLO.FREEZEPLAYER2 + 32) & 0xFF, 0x0A))
 
 
 def build_freeze_player() -> bytes:
     """Build PLO_FREEZEPLAYER2 packet."""
-    builder = PacketBuilder().write_gchar(PLO.FREEZEPLAYER2)
-    builder.write_newline()
-    return builder.build()
+    return _FREEZE_PLAYER_PACKET
+
+
+_UNFREEZE_PLAYER_PACKET = bytes(((PLO.UNFREEZEPLAYER + 32) & 0xFF, 0x0A))
 
 
 def build_unfreeze_player() -> bytes:
     """Build PLO_UNFREEZEPLAYER packet."""
-    builder = PacketBuilder().write_gchar(PLO.UNFREEZEPLAYER)
-    builder.write_newline()
-    return builder.build()
+    return _UNFREEZE_PLAYER_PACKET
 
 
+@lru_cache(maxsize=None)
 def build_ghost_mode(enabled: bool) -> bytes:
     """Build PLO_GHOSTMODE packet."""
     builder = PacketBuilder().write_gchar(PLO.GHOSTMODE)
@@ -395,6 +466,7 @@ def build_ghost_mode(enabled: bool) -> bytes:
     return builder.build()
 
 
+@lru_cache(maxsize=None)
 def build_ghost_icon(enabled: bool) -> bytes:
     """Build PLO_GHOSTICON packet."""
     builder = PacketBuilder().write_gchar(PLO.GHOSTICON)
@@ -403,18 +475,20 @@ def build_ghost_icon(enabled: bool) -> bytes:
     return builder.build()
 
 
+_FULLSTOP_PACKET = bytes(((PLO.FULLSTOP + 32) & 0xFF, 0x0A))
+
+
 def build_fullstop() -> bytes:
     """Build PLO_FULLSTOP packet (hides HUD, stops input)."""
-    builder = PacketBuilder().write_gchar(PLO.FULLSTOP)
-    builder.write_newline()
-    return builder.build()
+    return _FULLSTOP_PACKET
+
+
+_IS_LEADER_PACKET = bytes(((PLO.ISLEADER + 32) & 0xFF, 0x0A))
 
 
 def build_is_leader() -> bytes:
     """Build the valueless PLO_ISLEADER packet."""
-    builder = PacketBuilder().write_gchar(PLO.ISLEADER)
-    builder.write_newline()
-    return builder.build()
+    return _IS_LEADER_PACKET
 
 
 def build_server_warp(server: str, level: str, x: float, y: float) -> bytes:
@@ -430,17 +504,13 @@ def build_server_warp(server: str, level: str, x: float, y: float) -> bytes:
 
 def build_flag_set(flag_name: str, flag_value: str) -> bytes:
     """Build PLO_FLAGSET packet."""
-    builder = PacketBuilder().write_gchar(PLO.FLAGSET)
-    builder.write_string(f"{flag_name}={flag_value}")
-    builder.write_newline()
-    return builder.build()
+    # Formatted rather than encoded piecewise: GS1 passes non-str values
+    # (ints), which formatting accepts and str.encode() would reject.
+    return PacketBuilder.text_packet(PLO.FLAGSET, f"{flag_name}={flag_value}")
 
 
 def build_flag_del(flag_name: str) -> bytes:
     """Build PLO_FLAGDEL packet."""
-    builder = PacketBuilder().write_gchar(PLO.FLAGDEL)
-    builder.write_string(flag_name)
-    builder.write_newline()
-    return builder.build()
+    return PacketBuilder.text_packet(PLO.FLAGDEL, flag_name)
 
 
@@ -1,6 +1,7 @@
 """Packet construction helpers."""
 
 import logging
+import struct
 
 from ..packet_codec import PacketBuilder
 from ..constants import (
@@ -13,6 +14,11 @@ from typing import Any, Dict, List, Optional, Tuple  # noqa: F401  - kept: origi
 
 logger = logging.getLogger(__name__)
 
+# [gchar id][gint5][newline], packed lane by lane as the builder would write
+# it (see builders/combat.py).
+_PACK7 = struct.Struct('7B')
+
+
 def build_file(filename: str, data: bytes, mod_time: int = 0) -> bytes:
     """Build PLO_FILE packet.
 
@@ -22,54 +28,53 @@ def build_file(filename: str, data: bytes, mod_time: int = 0) -> bytes:
     This packet contains arbitrary bytes (incl. newlines) so it must be preceded
     by a PLO_RAWDATA announcement of its total length.
     """
+    return b"".join(build_file_segments(filename, data, mod_time))
+
+
+def build_file_segments(filename: str, data: bytes,
+                        mod_time: int = 0) -> Tuple[bytes, bytes, bytes]:
+    """PLO_FILE as (header, data, terminator) without copying `data`.
+
+    Lets a sender join the PLO_RAWDATA announcement and the file in a single
+    copy of the payload; build_file() used to copy it into a builder, then
+    into the built packet, then once more onto the announcement.
+    """
     name = filename.encode('latin-1')
     builder = PacketBuilder().write_gchar(PLO.FILE)
     builder.write_gint5(mod_time)
     builder.write_gchar(len(name))
     builder.write_bytes(name)
-    builder.write_bytes(data)
-    builder.write_byte(ord('\n'))
-    return builder.build()
+    return builder.build(), data, b"\n"
 
 
 def build_file_send_failed(filename: str) -> bytes:
     """Build PLO_FILESENDFAILED packet."""
-    builder = PacketBuilder().write_gchar(PLO.FILESENDFAILED)
-    builder.write_string(filename)
-    builder.write_newline()
-    return builder.build()
+    return PacketBuilder.text_packet(PLO.FILESENDFAILED, filename)
 
 
 def build_file_uptodate(filename: str) -> bytes:
     """Build PLO_FILEUPTODATE packet."""
-    builder = PacketBuilder().write_gchar(PLO.FILEUPTODATE)
-    builder.write_string(filename)
-    builder.write_newline()
-    return builder.build()
+    return PacketBuilder.text_packet(PLO.FILEUPTODATE, filename)
 
 
 def build_large_file_start(filename: str) -> bytes:
     """Build PLO_LARGEFILESTART packet."""
-    builder = PacketBuilder().write_gchar(PLO.LARGEFILESTART)
-    builder.write_string(filename)
-    builder.write_newline()
-    return builder.build()
+    return PacketBuilder.text_packet(PLO.LARGEFILESTART, filename)
 
 
 def build_large_file_end(filename: str) -> bytes:
     """Build PLO_LARGEFILEEND packet."""
-    builder = PacketBuilder().write_gchar(PLO.LARGEFILEEND)
-    builder.write_string(filename)
-    builder.write_newline()
-    return builder.build()
+    return PacketBuilder.text_packet(PLO.LARGEFILEEND, filename)
 
 
 def build_large_file_size(size: int) -> bytes:
     """Build PLO_LARGEFILESIZE packet."""
-    builder = PacketBuilder().write_gchar(PLO.LARGEFILESIZE)
-    builder.write_gint5(size)
-    builder.write_newline()
-    return builder.build()
+    return _PACK7.pack((PLO.LARGEFILESIZE + 32) & 0xFF,
+                       ((size >> 28) + 32) & 0xFF,
+                       ((size >> 21) & 0x7F) + 32,
+                       ((size >> 14) & 0x7F) + 32,
+                       ((size >> 7) & 0x7F) + 32,
+                       (size & 0x7F) + 32, 10)
 
 
 def build_gani_script(gani_name: str, bytecode: bytes) -> bytes:
@@ -52,9 +52,11 @@ def build_profile(account: str, profile: dict, online_time: str = '') -> bytes:
     implemented - this server targets modern (6.037) clients.
     """
     builder = PacketBuilder().write_gchar(PLO.PROFILE)
-    builder.write_gstring(account)
+    write_gstring = builder.write_gstring
+    get = profile.get
+    write_gstring(account)
     for field in PROFILE_FIELDS:
-        builder.write_gstring(profile.get(field, ''))
-    builder.write_gstring(online_time)
+        write_gstring(get(field, ''))
+    write_gstring(online_time)
     builder.write_newline()
     return builder.build()
@@ -1,6 +1,8 @@
 """Packet construction helpers."""
 
 import logging
+import struct
+from functools import lru_cache
 
 from ..packet_codec import PacketBuilder
 from ..constants import (
@@ -13,23 +15,24 @@ from typing import Any, Dict, List, Optional, Tuple  # noqa: F401  - kept: origi
 
 logger = logging.getLogger(__name__)
 
+# Fixed-shape packets packed in one struct call, lane by lane as the builder
+# would write them (see builders/combat.py).
+_PACK4 = struct.Struct('4B')
+_PACK5 = struct.Struct('5B')
+_PACK7 = struct.Struct('7B')
+_PACK8 = struct.Struct('8B')
+
 def build_item_add(x: float, y: float, item_type: int) -> bytes:
     """Build PLO_ITEMADD packet."""
-    builder = PacketBuilder().write_gchar(PLO.ITEMADD)
-    builder.write_gchar(int(x * 2))
-    builder.write_gchar(int(y * 2))
-    builder.write_gchar(item_type)
-    builder.write_newline()
-    return builder.build()
+    return _PACK5.pack((PLO.ITEMADD + 32) & 0xFF,
+                       (int(x * 2) + 32) & 0xFF, (int(y * 2) + 32) & 0xFF,
+                       (item_type + 32) & 0xFF, 10)
 
 
 def build_item_del(x: float, y: float) -> bytes:
     """Build PLO_ITEMDEL packet."""
-    builder = PacketBuilder().write_gchar(PLO.ITEMDEL)
-    builder.write_gchar(int(x * 2))
-    builder.write_gchar(int(y * 2))
-    builder.write_newline()
-    return builder.build()
+    return _PACK4.pack((PLO.ITEMDEL + 32) & 0xFF,
+                       (int(x * 2) + 32) & 0xFF, (int(y * 2) + 32) & 0xFF, 10)
 
 
 def build_level_chest(opened: bool, x: int, y: int,
@@ -77,17 +80,23 @@ def build_horse_add(x: float, y: float, direction: int, bushes: int, image: str)
 
 def build_horse_del(x: float, y: float) -> bytes:
     """Build PLO_HORSEDEL packet."""
-    builder = PacketBuilder().write_gchar(PLO.HORSEDEL)
-    builder.write_gchar(int(x * 2))
-    builder.write_gchar(int(y * 2))
-    builder.write_newline()
-    return builder.build()
+    return _PACK4.pack((PLO.HORSEDEL + 32) & 0xFF,
+                       (int(x * 2) + 32) & 0xFF, (int(y * 2) + 32) & 0xFF, 10)
 
 
 # =============================================================================
 # Baddy Packets
 # =============================================================================
 
+# Baddy prop ids grouped by payload shape, built once: the per-prop elif chain
+# used to rebuild a list literal and reload BDPROP members for every prop.
+_BADDY_GCHAR_PROPS = frozenset((BDPROP.ID, BDPROP.TYPE, BDPROP.MODE,
+                                BDPROP.ANI, BDPROP.DIR))
+_BADDY_HALF_TILE_PROPS = frozenset((BDPROP.X, BDPROP.Y))
+_BADDY_STRING_PROPS = frozenset((BDPROP.VERSESIGHT, BDPROP.VERSEHURT,
+                                 BDPROP.VERSEATTACK))
+
+
 def build_baddy_props(baddy_id: int, props: dict) -> bytes:
     """Build PLO_BADDYPROPS packet."""
     builder = PacketBuilder().write_gchar(PLO.BADDYPROPS)
@@ -96,21 +105,15 @@ def build_baddy_props(baddy_id: int, props: dict) -> bytes:
     for prop_id, value in props.items():
         builder.write_gchar(prop_id)
 
-        if prop_id == BDPROP.ID:
+        if prop_id in _BADDY_GCHAR_PROPS:
             builder.write_gchar(value)
-        elif prop_id in [BDPROP.X, BDPROP.Y]:
+        elif prop_id in _BADDY_HALF_TILE_PROPS:
             builder.write_gchar(int(value * 2))
-        elif prop_id == BDPROP.TYPE:
-            builder.write_gchar(value)
         elif prop_id == BDPROP.POWERIMAGE:
             power, image = value
             builder.write_gchar(power)
             builder.write_gstring(image)
-        elif prop_id == BDPROP.MODE:
-            builder.write_gchar(value)
-        elif prop_id in [BDPROP.ANI, BDPROP.DIR]:
-            builder.write_gchar(value)
-        elif prop_id in [BDPROP.VERSESIGHT, BDPROP.VERSEHURT, BDPROP.VERSEATTACK]:
+        elif prop_id in _BADDY_STRING_PROPS:
             builder.write_gstring(value)
 
     builder.write_newline()
@@ -149,10 +152,10 @@ def build_baddy_hurt(baddy_id: int, hurt_dx: float, hurt_dy: float, damage: int)
 
 def build_npc_moved(npc_id: int) -> bytes:
     """Build PLO_NPCMOVED packet (hides NPC for warping)."""
-    builder = PacketBuilder().write_gchar(PLO.NPCMOVED)
-    builder.write_gint3(npc_id)
-    builder.write_newline()
-    return builder.build()
+    return _PACK5.pack((PLO.NPCMOVED + 32) & 0xFF,
+                       ((npc_id >> 14) + 32) & 0xFF,
+                       ((npc_id >> 7) & 0x7F) + 32,
+                       (npc_id & 0x7F) + 32, 10)
 
 
 def build_npc_del2(level_name: str, npc_id: int) -> bytes:
@@ -164,18 +167,29 @@ def build_npc_del2(level_name: str, npc_id: int) -> bytes:
     return builder.build()
 
 
+_WEAPON_ADD_HEADER = bytes(((PLO.NPCWEAPONADD + 32) & 0xFF,))
+
+
 def build_npc_weapon_add(weapon_name: str, image: str, script: str) -> bytes:
     """Build a classic-script PLO_NPCWEAPONADD packet for v6.037."""
-    builder = PacketBuilder().write_gchar(PLO.NPCWEAPONADD)
-    builder.write_gstring(weapon_name)
-    builder.write_gchar(0)  # NPCProp.IMAGE
-    builder.write_gstring(image)
-    builder.write_gchar(1)  # NPCProp.SCRIPT
+    # Joined directly rather than through a PacketBuilder: every weapon goes
+    # out this way on each login. Same bytes as the builder chain
+    # gstring(name), gchar(0), gstring(image), gchar(1), gstring_short(script).
+    name = weapon_name.encode("latin-1", "replace")
+    image = image.encode("latin-1", "replace")
     # GS1 wire format joins script lines with 0xa7 — without this, the
     # newline-framed packet truncates the script at its first line
-    builder.write_gstring_short(script.replace("\n", "\xa7"))
-    builder.write_newline()
-    return builder.build()
+    script = script.replace("\n", "\xa7").encode("latin-1", "replace")
+    length = len(script)
+    return b"".join((
+        _WEAPON_ADD_HEADER,
+        bytes(((len(name) + 32) & 0xFF,)), name,
+        # 32: NPCProp.IMAGE (0) as a gchar
+        bytes((32, (len(image) + 32) & 0xFF)), image,
+        # 33: NPCProp.SCRIPT (1) as a gchar, then the gshort length
+        bytes((33, ((length >> 7) + 32) & 0xFF, (length & 0x7F) + 32)), script,
+        b"\n",
+    ))
 
 
 def build_npc_weapon_add_scripted(weapon_name: str, image: str,
@@ -221,10 +235,7 @@ def build_npc_weapon_script(header: str, bytecode: bytes) -> bytes:
 def build_load_script_header(header: str) -> bytes:
     """Build the announcement form of PLO_LOADSCRIPT: a bare header CSV with no
     length prefix and no bytecode (Weapon.cpp registerWeaponWithPlayer)."""
-    builder = PacketBuilder().write_gchar(PLO.LOADSCRIPT)
-    builder.write_string(header)
-    builder.write_newline()
-    return builder.build()
+    return PacketBuilder.text_packet(PLO.LOADSCRIPT, header)
 
 
 def build_load_script_bytecode(header: str, bytecode: bytes) -> bytes:
@@ -249,6 +260,7 @@ def build_npc_bytecode(npc_id: int, bytecode: bytes) -> bytes:
     return builder.build()
 
 
+@lru_cache(maxsize=None)
 def build_hide_npcs(hide: bool) -> bytes:
     """Build PLO_HIDENPCS packet."""
     builder = PacketBuilder().write_gchar(PLO.HIDENPCS)
@@ -291,13 +303,12 @@ def build_private_message(from_id: int, sender_name: str, message: str,
 
 def build_show_img(code: int, x: float, y: float, image: str) -> bytes:
     """Build PLO_SHOWIMG packet."""
-    builder = PacketBuilder().write_gchar(PLO.SHOWIMG)
-    builder.write_gchar(code)
-    builder.write_gchar(int(x * 2))
-    builder.write_gchar(int(y * 2))
-    builder.write_string(image)
-    builder.write_newline()
-    return builder.build()
+    return b"".join((
+        _PACK4.pack((PLO.SHOWIMG + 32) & 0xFF, (code + 32) & 0xFF,
+                    (int(x * 2) + 32) & 0xFF, (int(y * 2) + 32) & 0xFF),
+        image.encode("latin-1", "replace"),
+        b"\n",
+    ))
 
 
 # PLO_SHOWIMGNPC is absent from the shared beta4 enum, but is packet 166 in
@@ -320,8 +331,7 @@ def _write_showimg_prop(builder: PacketBuilder, prop_id: int, value) -> None:
             builder.write_gchar(1).write_gshort(x).write_gshort(y)
             builder.write_gchar(width).write_gchar(height)
     elif prop_id == 5:  # RGBA, each 0..200
-        for component in value:
-            builder.write_gchar(component)
+        builder.write_gchars(value)
     elif prop_id == 7:  # z tile coordinate, biased by 50
         builder.write_gchar(max(-50, min(170, int(value))) + 50)
 
@@ -341,18 +351,12 @@ def build_npc_showimgs(npc_id: int, images: dict, *, reset: bool = False) -> byt
 
 def build_admin_message(message: str) -> bytes:
     """Build PLO_RC_ADMINMESSAGE packet."""
-    builder = PacketBuilder().write_gchar(PLO.RC_ADMINMESSAGE)
-    builder.write_string(message)
-    builder.write_newline()
-    return builder.build()
+    return PacketBuilder.text_packet(PLO.RC_ADMINMESSAGE, message)
 
 
 def build_say2(text: str) -> bytes:
     """Build PLO_SAY2 packet (also used for signs)."""
-    builder = PacketBuilder().write_gchar(PLO.SAY2)
-    builder.write_string(text)
-    builder.write_newline()
-    return builder.build()
+    return PacketBuilder.text_packet(PLO.SAY2, text)
 
 
 def build_trigger_action(player_id: int, npc_id: int, x: float, y: float,
@@ -367,102 +371,98 @@ def build_trigger_action(player_id: int, npc_id: int, x: float, y: float,
     player_id/npc_id are mutually exclusive in practice (0 for whichever
     didn't originate the trigger).
     """
-    builder = PacketBuilder().write_gchar(PLO.TRIGGERACTION)
-    builder.write_gshort(player_id)
-    builder.write_gint3(npc_id)
-    builder.write_gchar(int(x * 2))
-    builder.write_gchar(int(y * 2))
-    builder.write_string(action)
-    builder.write_newline()
-    return builder.build()
+    return b"".join((
+        _PACK8.pack(
+            (PLO.TRIGGERACTION + 32) & 0xFF,
+            ((player_id >> 7) + 32) & 0xFF, (player_id & 0x7F) + 32,
+            ((npc_id >> 14) + 32) & 0xFF,
+            ((npc_id >> 7) & 0x7F) + 32,
+            (npc_id & 0x7F) + 32,
+            (int(x * 2) + 32) & 0xFF,
+            (int(y * 2) + 32) & 0xFF,
+        ),
+        action.encode("latin-1", "replace"),
+        b"\n",
+    ))
 
 
 def build_ghost_text(text: str) -> bytes:
     """Build PLO_GHOSTTEXT packet (shows in lower-right during ghost mode)."""
-    builder = PacketBuilder().write_gchar(PLO.GHOSTTEXT)
-    builder.write_string(text)
-    builder.write_newline()
-    return builder.build()
+    return PacketBuilder.text_packet(PLO.GHOSTTEXT, text)
 
 
 def build_rpg_window(text: str) -> bytes:
     """Build PLO_RPGWINDOW packet."""
-    builder = PacketBuilder().write_gchar(PLO.RPGWINDOW)
-    builder.write_string(text)
-    builder.write_newline()
-    return builder.build()
+    return PacketBuilder.text_packet(PLO.RPGWINDOW, text)
 
 
 # =============================================================================
 # Level Packets (Extended)
 # =============================================================================
 
+_LEVELBOARD_HEADER = bytes(((PLO.LEVELBOARD + 32) & 0xFF,))
+
+
 def build_level_board(tiles: bytes) -> bytes:
-    """Build PLO_LEVELBOARD packet."""
-    builder = PacketBuilder().write_gchar(PLO.LEVELBOARD)
-    builder.write_bytes(tiles)
-    builder.write_newline()
-    return builder.build()
+    """Build PLO_LEVELBOARD packet.
+
+    `tiles` may be any bytes-like object (e.g. Level.board_view()); it is
+    joined into the packet once rather than copied through a builder.
+    """
+    return b"".join((_LEVELBOARD_HEADER, tiles, b"\n"))
 
 
 def build_level_modtime(modtime: int) -> bytes:
     """Build PLO_LEVELMODTIME packet."""
-    builder = PacketBuilder().write_gchar(PLO.LEVELMODTIME)
-    builder.write_gint5(modtime)
-    builder.write_newline()
-    return builder.build()
+    return _PACK7.pack((PLO.LEVELMODTIME + 32) & 0xFF,
+                       ((modtime >> 28) + 32) & 0xFF,
+                       ((modtime >> 21) & 0x7F) + 32,
+                       ((modtime >> 14) & 0x7F) + 32,
+                       ((modtime >> 7) & 0x7F) + 32,
+                       (modtime & 0x7F) + 32, 10)
 
 
 def build_board_modify(x: int, y: int, width: int, height: int, tiles: bytes) -> bytes:
     """Build PLO_BOARDMODIFY packet."""
-    builder = PacketBuilder().write_gchar(PLO.BOARDMODIFY)
-    builder.write_gchar(x)
-    builder.write_gchar(y)
-    builder.write_gchar(width)
-    builder.write_gchar(height)
-    builder.write_bytes(tiles)
-    builder.write_newline()
-    return builder.build()
+    return b"".join((
+        _PACK5.pack((PLO.BOARDMODIFY + 32) & 0xFF, (x + 32) & 0xFF,
+                    (y + 32) & 0xFF, (width + 32) & 0xFF, (height + 32) & 0xFF),
+        tiles,
+        b"\n",
+    ))
 
 
 def build_board_modify2(map_x: int, map_y: int, x: int, y: int,
                         width: int, height: int, tiles: bytes) -> bytes:
     """Build PLO_BOARDMODIFY2 packet for a gmap segment."""
-    builder = PacketBuilder().write_gchar(PLO.BOARDMODIFY2)
-    builder.write_gchar(map_x)
-    builder.write_gchar(map_y)
-    builder.write_gchar(x)
-    builder.write_gchar(y)
-    builder.write_gchar(width)
-    builder.write_gchar(height)
-    builder.write_bytes(tiles)
-    builder.write_newline()
-    return builder.build()
+    return b"".join((
+        _PACK7.pack((PLO.BOARDMODIFY2 + 32) & 0xFF,
+                    (map_x + 32) & 0xFF, (map_y + 32) & 0xFF,
+                    (x + 32) & 0xFF, (y + 32) & 0xFF,
+                    (width + 32) & 0xFF, (height + 32) & 0xFF),
+        tiles,
+        b"\n",
+    ))
 
 
 def build_board_layer(layer: int, tiles: bytes) -> bytes:
     """Build PLO_BOARDLAYER packet."""
-    builder = PacketBuilder().write_gchar(PLO.BOARDLAYER)
-    builder.write_gchar(layer)
-    builder.write_bytes(tiles)
-    builder.write_newline()
-    return builder.build()
+    return b"".join((
+        bytes(((PLO.BOARDLAYER + 32) & 0xFF, (layer + 32) & 0xFF)),
+        tiles,
+        b"\n",
+    ))
 
 
+@lru_cache(maxsize=256)
 def build_set_active_level(level_name: str) -> bytes:
     """Build PLO_SETACTIVELEVEL packet."""
-    builder = PacketBuilder().write_gchar(PLO.SETACTIVELEVEL)
-    builder.write_string(level_name)
-    builder.write_newline()
-    return builder.build()
+    return PacketBuilder.text_packet(PLO.SETACTIVELEVEL, level_name)
 
 
 def build_minimap(text: str) -> bytes:
     """Build PLO_MINIMAP packet."""
-    builder = PacketBuilder().write_gchar(PLO.MINIMAP)
-    builder.write_string(text)
-    builder.write_newline()
-    return builder.build()
+    return PacketBuilder.text_packet(PLO.MINIMAP, text)
 
 
 # =============================================================================
@@ -1,10 +1,27 @@
 """Compatibility extensions around the shared packet codec."""
 
+import struct
+
 from reborn_protocol.codec import (
     PacketBuilder as SharedPacketBuilder,
     PacketReader as SharedPacketReader,
 )
 
+# GCHAR encoding of a whole byte run at once: bytes.translate() does the
+# (b + 32) & 0xFF per byte in one C loop.
+_GCHAR_ENCODE = bytes((i + 32) & 0xFF for i in range(256))
+
+# The same mapping as one-byte bytes objects, indexed by packet id & 0xFF, so
+# a packet header is a tuple lookup rather than a bytes((...)) build per send.
+_GCHAR_HEADERS = tuple(bytes((b,)) for b in _GCHAR_ENCODE)
+
+# The inverse, b - 32, for decoding a run of well-formed GCHARs in one pass.
+_GCHAR_DECODE = bytes((i - 32) & 0xFF for i in range(256))
+
+_UNPACK2 = struct.Struct('2B').unpack_from
+_UNPACK3 = struct.Struct('3B').unpack_from
+_UNPACK5 = struct.Struct('5B').unpack_from
+
 
 class PacketReader(SharedPacketReader):
     """Shared reader with preserved server-specific edge behavior."""
@@ -13,42 +30,61 @@ class PacketReader(SharedPacketReader):
         """Read a signed GCHAR without clamping."""
         return self.read_byte() - 32
 
+    # The multi-byte reads bind data/pos to locals and unpack the lanes with
+    # one precompiled struct call rather than index self.data once per byte:
+    # every player-props, movement and file packet goes through them, and the
+    # attribute loads were most of their cost. (unpack_from also skips the
+    # temporary slice an unpacked data[pos:pos + n] would build.)
+
     def read_gshort(self) -> int:
         """Read a two-byte encoded integer."""
         # Divergence: codec.py:79 consumes a truncated buffer and clamps
         # malformed negative results; this reader historically does neither.
-        if self.pos + 1 >= len(self.data):
+        data, pos = self.data, self.pos
+        if pos + 1 >= len(data):
             return 0
-        b1 = self.data[self.pos] - 32
-        b2 = self.data[self.pos + 1] - 32
-        self.pos += 2
-        return (b1 << 7) + b2
+        b1, b2 = _UNPACK2(data, pos)
+        self.pos = pos + 2
+        return ((b1 - 32) << 7) + (b2 - 32)
 
     def read_gint3(self) -> int:
         """Read a three-byte encoded integer."""
         # Divergence: codec.py:96 consumes a truncated buffer and clamps
         # malformed negative results; this reader historically does neither.
-        if self.pos + 2 >= len(self.data):
+        data, pos = self.data, self.pos
+        if pos + 2 >= len(data):
             return 0
-        b1 = self.data[self.pos] - 32
-        b2 = self.data[self.pos + 1] - 32
-        b3 = self.data[self.pos + 2] - 32
-        self.pos += 3
-        return (b1 << 14) + (b2 << 7) + b3
+        b1, b2, b3 = _UNPACK3(data, pos)
+        self.pos = pos + 3
+        return ((b1 - 32) << 14) + ((b2 - 32) << 7) + (b3 - 32)
 
     def read_gint5(self) -> int:
         """Read a five-byte encoded integer."""
         # Divergence: codec.py:129 consumes truncated input, uses addition,
         # and masks the result to 32 bits; this reader keeps its bitwise fold.
-        if self.pos + 4 >= len(self.data):
+        data, pos = self.data, self.pos
+        if pos + 4 >= len(data):
             return 0
-        b1 = self.data[self.pos] - 32
-        b2 = self.data[self.pos + 1] - 32
-        b3 = self.data[self.pos + 2] - 32
-        b4 = self.data[self.pos + 3] - 32
-        b5 = self.data[self.pos + 4] - 32
-        self.pos += 5
-        return (b1 << 28) | (b2 << 21) | (b3 << 14) | (b4 << 7) | b5
+        b1, b2, b3, b4, b5 = _UNPACK5(data, pos)
+        self.pos = pos + 5
+        return (((b1 - 32) << 28) | ((b2 - 32) << 21) | ((b3 - 32) << 14)
+                | ((b4 - 32) << 7) | (b5 - 32))
+
+    def read_gchars(self, count: int) -> tuple:
+        """Read `count` consecutive GCHARs.
+
+        A complete run with every byte >= 32 decodes with one translate();
+        a truncated or malformed one falls back to read_gchar() per field so
+        its edge behavior is unchanged.
+        """
+        data, pos = self.data, self.pos
+        end = pos + count
+        if 0 <= pos and end <= len(data):
+            raw = data[pos:end]
+            if raw and min(raw) >= 32:
+                self.pos = end
+                return tuple(raw.translate(_GCHAR_DECODE))
+        return tuple(self.read_gchar() for _ in range(count))
 
     def read_string(self, length: int) -> str:
         """Read a fixed-length string."""
@@ -68,6 +104,31 @@ class PacketReader(SharedPacketReader):
         self.pos += length
         return data
 
+    def has_remaining(self) -> bool:
+        """True while there are unread bytes.
+
+        The optional-trailing-field checks used to test remaining() for
+        truthiness, which copies the rest of the packet just to see whether
+        it is empty.
+        """
+        return self.pos < len(self.data)
+
+    def remaining_latin1(self) -> str:
+        """Decode everything after the cursor as latin-1.
+
+        latin-1 maps every byte to a code point, so this can never fail; the
+        errors='replace' handler the call sites used to pass was dead weight.
+        """
+        return self.data[self.pos:].decode("latin-1")
+
+    def remaining_view(self) -> memoryview:
+        """Zero-copy view of everything after the cursor.
+
+        For large binary tails (board-modify tile runs) that are only indexed
+        or forwarded; remaining() copies them.
+        """
+        return memoryview(self.data)[self.pos:]
+
     def skip(self, count: int) -> None:
         """Skip bytes."""
         # Divergence: codec.py:196 caps the cursor at the buffer length; this
@@ -88,16 +149,31 @@ class PacketBuilder(SharedPacketBuilder):
         self._data.append((value + 32) & 0xFF)
         return self
 
+    def write_gchars(self, values) -> "PacketBuilder":
+        """Write a run of one-byte encoded integers.
+
+        Same bytes, and the same wrapping, as write_gchar() once per value.
+        """
+        self._data.extend(bytes(v & 0xFF for v in values).translate(_GCHAR_ENCODE))
+        return self
+
     def write_gchar_signed(self, value: int) -> "PacketBuilder":
         """Write a signed one-byte encoded integer."""
-        return self.write_gchar(value)
+        # Same bytes as write_gchar(), appended here rather than delegated:
+        # the hurt, push and movement packets write several per packet.
+        self._data.append((value + 32) & 0xFF)
+        return self
+
+    # Only the top lane of a multi-byte write can exceed a byte and needs the
+    # & 0xFF wrap; the lower lanes are masked to 7 bits, so +32 stays below
+    # 160.
 
     def write_gshort(self, value: int) -> "PacketBuilder":
         """Write a two-byte encoded integer."""
         # Divergence: codec.py:235 clamps to 0..28767 and permits carry in
         # the low lane; this writer wraps the top lane and masks the low lane.
         self._data.append(((value >> 7) + 32) & 0xFF)
-        self._data.append(((value & 0x7F) + 32) & 0xFF)
+        self._data.append((value & 0x7F) + 32)
         return self
 
     def write_gint3(self, value: int) -> "PacketBuilder":
@@ -105,8 +181,8 @@ class PacketBuilder(SharedPacketBuilder):
         # Divergence: codec.py:247 clamps to 0..3682399 and permits carry in
         # inner lanes; this writer wraps the top lane and masks lower lanes.
         self._data.append(((value >> 14) + 32) & 0xFF)
-        self._data.append((((value >> 7) & 0x7F) + 32) & 0xFF)
-        self._data.append(((value & 0x7F) + 32) & 0xFF)
+        self._data.append(((value >> 7) & 0x7F) + 32)
+        self._data.append((value & 0x7F) + 32)
         return self
 
     def write_gint5(self, value: int) -> "PacketBuilder":
@@ -114,28 +190,57 @@ class PacketBuilder(SharedPacketBuilder):
         # Divergence: codec.py:284 clamps to the unsigned 32-bit range; this
         # writer wraps the top lane and masks each of the four lower lanes.
         self._data.append(((value >> 28) + 32) & 0xFF)
-        self._data.append((((value >> 21) & 0x7F) + 32) & 0xFF)
-        self._data.append((((value >> 14) & 0x7F) + 32) & 0xFF)
-        self._data.append((((value >> 7) & 0x7F) + 32) & 0xFF)
-        self._data.append(((value & 0x7F) + 32) & 0xFF)
+        self._data.append(((value >> 21) & 0x7F) + 32)
+        self._data.append(((value >> 14) & 0x7F) + 32)
+        self._data.append(((value >> 7) & 0x7F) + 32)
+        self._data.append((value & 0x7F) + 32)
         return self
 
+    # The string writers pass "replace" positionally: str.encode() parses an
+    # errors= keyword noticeably slower than the encode itself takes for a
+    # short name. The length-prefixed writers append their prefix lanes inline
+    # instead of calling write_gchar()/write_gshort(), one call fewer per
+    # string.
+
+    def write_string(self, value: str) -> "PacketBuilder":
+        """Write a raw (unprefixed) string."""
+        self._data.extend(value.encode("latin-1", "replace"))
+        return self
+
+    @staticmethod
+    def text_packet(packet_id: int, text: str) -> bytes:
+        """Build a whole [gchar id][raw string][newline] packet in one join.
+
+        Level names, links, chat-style messages and most RC/NC text replies
+        are exactly this shape; it skips the builder and its three writes.
+        Bytes match write_gchar(packet_id).write_string(text).write_newline().
+        """
+        return b"".join((
+            _GCHAR_HEADERS[packet_id & 0xFF],
+            text.encode("latin-1", "replace"),
+            b"\n",
+        ))
+
     def write_gstring(self, value: str) -> "PacketBuilder":
         """Write a one-byte-length-prefixed string."""
         # Divergence: codec.py:313 truncates encoded data to 223 bytes; this
         # writer retains the full data after its wrapping length prefix.
-        encoded = value.encode("latin-1", errors="replace")
-        self.write_gchar(len(encoded))
-        self._data.extend(encoded)
+        encoded = value.encode("latin-1", "replace")
+        data = self._data
+        data.append((len(encoded) + 32) & 0xFF)
+        data.extend(encoded)
         return self
 
     def write_gstring_short(self, value: str) -> "PacketBuilder":
         """Write a two-byte-length-prefixed string."""
         # Divergence: codec.py:321 truncates encoded data to 28767 bytes; this
         # writer retains the full data after its wrapping length prefix.
-        encoded = value.encode("latin-1", errors="replace")
-        self.write_gshort(len(encoded))
-        self._data.extend(encoded)
+        encoded = value.encode("latin-1", "replace")
+        length = len(encoded)
+        data = self._data
+        data.append(((length >> 7) + 32) & 0xFF)
+        data.append((length & 0x7F) + 32)
+        data.extend(encoded)
         return self
 
     def write_newline(self) -> "PacketBuilder":
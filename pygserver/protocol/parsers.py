@@ -1,6 +1,7 @@
 """Packet parsing helpers."""
 
 import logging
+from functools import lru_cache
 from typing import List, Tuple
 from reborn_protocol.props import (
     COLORS_NEWWORLD,
@@ -29,6 +30,16 @@ logger = logging.getLogger(__name__)
 _GATTRIB_IDS = frozenset(
     pid for pid, desc in PLAYER_PROPS.items() if desc.name.startswith('GATTRIB'))
 
+# Every byte whose latin-1 character str.strip() removes. Stripping these off
+# the raw bytes before decoding gives the same text as decode().strip()
+# without building the unstripped str first.
+_LATIN1_WHITESPACE = bytes(c for c in range(256) if chr(c).isspace())
+
+
+def _decode_stripped(data: bytes) -> str:
+    return data.strip(_LATIN1_WHITESPACE).decode('latin-1')
+
+
 def parse_login_packet(data: bytes) -> dict:
     """
     Parse login packet from client.
@@ -54,10 +65,10 @@ def parse_login_packet(data: bytes) -> dict:
     # Check for build string (older clients)
     if reader.has_data():
         # Could be build string or client info
-        remaining = reader.remaining().decode('latin-1', errors='replace')
+        remaining = reader.remaining_latin1()
         if remaining.startswith(chr(32)):  # Looks like gstring
             result['build'] = reader.read_gstring()
-            result['client_info'] = reader.remaining().decode('latin-1', errors='replace')
+            result['client_info'] = reader.remaining_latin1()
         else:
             result['client_info'] = remaining
 
@@ -87,13 +98,20 @@ def _store_power_image(prop_id: int, image_key: str, prefix: str,
     return handler
 
 
+# The shared decoder calls one of these per prop, so they store with a plain
+# subscript assignment rather than a props.__setitem__ lookup and call.
+
 def _store(prop_id: int):
-    return lambda props, value: props.__setitem__(prop_id, value)
+    def handler(props, value):
+        props[prop_id] = value
+    return handler
 
 
 def _store_half_tiles(prop_id: int):
     """X/Y stay in the raw half-tile units callers already divide by 2."""
-    return lambda props, value: props.__setitem__(prop_id, int(value * 2))
+    def handler(props, value):
+        props[prop_id] = int(value * 2)
+    return handler
 
 
 def _store_chat(props, value):
@@ -164,6 +182,13 @@ _INBOUND_STREAM = StreamPolicy(table=PLAYER_PROPS, max_prop_id=100,
                                handle_empty=frozenset({PLPROP.CURCHAT}))
 
 
+@lru_cache(maxsize=None)
+def _inbound_stream(colors_len: int) -> StreamPolicy:
+    """_INBOUND_STREAM at one colors width, derived once per width rather than
+    once per PLI_PLAYERPROPS."""
+    return _INBOUND_STREAM.with_colors_len(colors_len)
+
+
 def parse_player_props(data: bytes, start_pos: int = 0,
                        colors_len: int = COLORS_NEWWORLD) -> dict:
     """
@@ -179,7 +204,7 @@ def parse_player_props(data: bytes, start_pos: int = 0,
     passing reborn_protocol.props.COLORS_CLASSIC.
     """
     props, _clean, _pos = parse_prop_stream(
-        data, start_pos, _INBOUND_STREAM.with_colors_len(colors_len),
+        data, start_pos, _inbound_stream(colors_len),
         _INBOUND_PROP_HANDLERS)
     return props
 
@@ -196,24 +221,22 @@ def parse_level_warp(data: bytes) -> Tuple[float, float, str]:
         Tuple of (x, y, level_name)
     """
     reader = PacketReader(data)
-    x = reader.read_gchar() / 2.0
-    y = reader.read_gchar() / 2.0
-    level_name = reader.remaining().decode('latin-1', errors='replace').strip()
+    x, y = reader.read_gchars(2)
+    x /= 2.0
+    y /= 2.0
+    level_name = reader.remaining_latin1().strip()
     return x, y, level_name
 
 
-def parse_board_modify(data: bytes) -> Tuple[int, int, int, int, bytes]:
+def parse_board_modify(data: bytes) -> Tuple[int, int, int, int, memoryview]:
     """Parse PLI_BOARDMODIFY packet.
 
     Returns:
-        Tuple of (x, y, width, height, tiles)
+        Tuple of (x, y, width, height, tiles); tiles is a view into `data`.
     """
     reader = PacketReader(data)
-    x = reader.read_gchar()
-    y = reader.read_gchar()
-    width = reader.read_gchar()
-    height = reader.read_gchar()
-    tiles = reader.remaining()
+    x, y, width, height = reader.read_gchars(4)
+    tiles = reader.remaining_view()
     return x, y, width, height, tiles
 
 
@@ -231,9 +254,10 @@ def parse_trigger_action(data: bytes) -> Tuple[int, float, float, str, List[str]
     """
     reader = PacketReader(data)
     npc_id = reader.read_gint3()
-    x = reader.read_gchar() / 2.0
-    y = reader.read_gchar() / 2.0
-    action_str = reader.remaining().decode('latin-1', errors='replace').strip()
+    x, y = reader.read_gchars(2)
+    x /= 2.0
+    y /= 2.0
+    action_str = reader.remaining_latin1().strip()
     parts = action_str.split(',')
     action = parts[0] if parts else ''
     params = parts[1:] if len(parts) > 1 else []
@@ -246,10 +270,8 @@ def parse_item_take(data: bytes) -> Tuple[float, float]:
     Returns:
         Tuple of (x, y)
     """
-    reader = PacketReader(data)
-    x = reader.read_gchar() / 2.0
-    y = reader.read_gchar() / 2.0
-    return x, y
+    x, y = PacketReader(data).read_gchars(2)
+    return x / 2.0, y / 2.0
 
 
 def parse_baddy_hurt(data: bytes) -> Tuple[int, int, float, float]:
@@ -258,12 +280,8 @@ def parse_baddy_hurt(data: bytes) -> Tuple[int, int, float, float]:
     Returns:
         Tuple of (baddy_id, power, from_x, from_y)
     """
-    reader = PacketReader(data)
-    baddy_id = reader.read_gchar()
-    power = reader.read_gchar()
-    from_x = reader.read_gchar() / 2.0
-    from_y = reader.read_gchar() / 2.0
-    return baddy_id, power, from_x, from_y
+    baddy_id, power, from_x, from_y = PacketReader(data).read_gchars(4)
+    return baddy_id, power, from_x / 2.0, from_y / 2.0
 
 
 def parse_flag_set(data: bytes) -> Tuple[str, str]:
@@ -272,11 +290,9 @@ def parse_flag_set(data: bytes) -> Tuple[str, str]:
     Returns:
         Tuple of (flag_name, flag_value)
     """
-    text = data.decode('latin-1', errors='replace').strip()
-    if '=' in text:
-        name, value = text.split('=', 1)
-        return name, value
-    return text, ''
+    text = _decode_stripped(data)
+    name, _, value = text.partition('=')
+    return name, value
 
 
 def parse_want_file(data: bytes) -> str:
@@ -285,7 +301,7 @@ def parse_want_file(data: bytes) -> str:
     Returns:
         Filename requested
     """
-    return data.decode('latin-1', errors='replace').strip()
+    return _decode_stripped(data)
 
 
 def parse_verify_want_send(data: bytes) -> Tuple[int, str]:
@@ -296,7 +312,7 @@ def parse_verify_want_send(data: bytes) -> Tuple[int, str]:
     """
     reader = PacketReader(data)
     checksum = reader.read_gint5()
-    filename = reader.remaining().decode('latin-1', errors='replace').strip()
+    filename = _decode_stripped(reader.remaining())
     return checksum, filename
 
 
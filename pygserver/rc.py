@@ -7,14 +7,15 @@ Based on GServer-v2 TPlayerRC.cpp implementation.
 
 import asyncio
 import logging
-from typing import TYPE_CHECKING, Optional, Dict, Any, List, Set, Callable
-from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Optional, Dict, Any, List, Set, Tuple, Callable
 
 from .protocol.constants import PLI, PLO, PLPROP, PLPERM
 from .protocol.packets import (
     PacketBuilder,
     PacketReader,
+    build_admin_message,
     build_rc_chat,
+    build_rc_chat_from,
     build_rc_server_options,
     build_rc_folder_config,
     build_rc_server_flags,
@@ -35,23 +36,67 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# (option key, config attribute) pairs reported by RC_SERVEROPTIONSGET, in
+# the order they are listed. Absent attributes are skipped.
+_SERVER_OPTION_FIELDS = (
+    ('name', 'server_name'),
+    ('description', 'description'),
+    ('startlevel', 'start_level'),
+    ('startx', 'start_x'),
+    ('starty', 'start_y'),
+)
+_MISSING = object()
+
 
-@dataclass
 class RCSession:
     """Represents an RC admin session."""
-    player: 'Player'
-    rights: int = 0
-    file_browser_path: str = ""
-    file_browser_active: bool = False
-    # Chunked RC large-file uploads in flight, keyed by filename (mirrors
-    # GServer-v2 PlayerRC::m_rcLargeFiles, a per-connection map populated by
-    # RC_LARGEFILESTART and flushed on RC_LARGEFILEEND).
-    large_file_uploads: Dict[str, bytearray] = field(default_factory=dict)
+
+    # A plain class rather than a dataclass: file_browser_path is a property
+    # that keeps file_browser_prefix in step, and a dataclass field cannot
+    # also be a property. Sessions compare by identity; __repr__ stands in for
+    # the dataclass one so RC log lines stay readable.
+    __slots__ = ('player', 'rights', '_file_browser_path',
+                 'file_browser_prefix', 'file_browser_active',
+                 'large_file_uploads')
+
+    def __init__(self, player: 'Player', rights: int = 0,
+                 file_browser_path: str = "",
+                 file_browser_active: bool = False,
+                 large_file_uploads: Optional[Dict[str, bytearray]] = None):
+        self.player = player
+        self.rights = rights
+        self.file_browser_path = file_browser_path
+        self.file_browser_active = file_browser_active
+        # Chunked RC large-file uploads in flight, keyed by filename (mirrors
+        # GServer-v2 PlayerRC::m_rcLargeFiles, a per-connection map populated
+        # by RC_LARGEFILESTART and flushed on RC_LARGEFILEEND).
+        self.large_file_uploads: Dict[str, bytearray] = (
+            {} if large_file_uploads is None else large_file_uploads)
+
+    def __repr__(self) -> str:
+        # Upload buffers are shown by name: one can hold max_upload_size bytes
+        return (f"RCSession(player={self.player!r}, rights={self.rights!r}, "
+                f"file_browser_path={self.file_browser_path!r}, "
+                f"file_browser_active={self.file_browser_active!r}, "
+                f"large_file_uploads={list(self.large_file_uploads)!r})")
 
     def has_right(self, right: PLPERM) -> bool:
         """Check if session has a specific right."""
         return bool(self.rights & right)
 
+    @property
+    def file_browser_path(self) -> str:
+        """Current file-browser folder, relative to the server root."""
+        return self._file_browser_path
+
+    @file_browser_path.setter
+    def file_browser_path(self, value: str):
+        # The file-browser handlers join names onto the folder on every
+        # operation; file_browser_prefix is that folder plus its "/" (or ""
+        # at the root), kept in step here.
+        self._file_browser_path = value
+        self.file_browser_prefix = value + "/" if value else ""
+
 
 class RCManager:
     """
@@ -72,9 +117,12 @@ class RCManager:
 
         # Active RC sessions
         self._sessions: Dict[int, RCSession] = {}  # player_id -> RCSession
+        # The same sessions as an immutable tuple, rebuilt on (un)register:
+        # broadcasts and listings iterate it without copying the dict first.
+        self._sessions_snapshot: Tuple[RCSession, ...] = ()
 
         # RC packet handlers
-        self._handlers: Dict[int, Callable] = {
+        handlers: Dict[int, Callable] = {
             PLI.RC_SERVEROPTIONSGET: self._handle_server_options_get,
             PLI.RC_SERVEROPTIONSSET: self._handle_server_options_set,
             PLI.RC_FOLDERCONFIGGET: self._handle_folder_config_get,
@@ -97,6 +145,8 @@ class RCManager:
             PLI.RC_ACCOUNTADD: self._handle_account_add,
             PLI.RC_ACCOUNTDEL: self._handle_account_del,
             PLI.RC_ACCOUNTLISTGET: self._handle_account_list_get,
+            # Separate handlers, not aliases of GET/SET: GET3 and SET2 carry
+            # a gstring account name where those read a raw name or an id.
             PLI.RC_PLAYERPROPSGET2: self._handle_player_props_get2,
             PLI.RC_PLAYERPROPSGET3: self._handle_player_props_get3,
             PLI.RC_PLAYERPROPSRESET: self._handle_player_props_reset,
@@ -123,6 +173,13 @@ class RCManager:
             PLI.RC_LARGEFILEEND: self._handle_large_file_end,
             PLI.RC_FOLDERDELETE: self._handle_folder_delete,
         }
+        # Dispatched by indexing a list with the packet id: RC ids are a
+        # small dense range, and every admin packet goes through the lookup.
+        # 256 slots cover every decoded id (byte - 32, so -32..223) without a
+        # bounds check; a negative id lands in the unused None slots at the top.
+        self._handlers: List[Optional[Callable]] = [None] * 256
+        for packet_id, handler in handlers.items():
+            self._handlers[packet_id] = handler
 
         # Settings
         self.max_upload_size = 1024 * 1024  # 1MB default
@@ -140,6 +197,7 @@ class RCManager:
         """
         session = RCSession(player=player, rights=rights)
         self._sessions[player.id] = session
+        self._sessions_snapshot = tuple(self._sessions.values())
         logger.info(f"RC session registered for {player.account_name} with rights {rights}")
         return session
 
@@ -147,6 +205,7 @@ class RCManager:
         """Unregister an RC session."""
         session = self._sessions.pop(player_id, None)
         if session:
+            self._sessions_snapshot = tuple(self._sessions.values())
             logger.info(f"RC session unregistered for player {player_id}")
 
     def get_session(self, player_id: int) -> Optional[RCSession]:
@@ -157,9 +216,9 @@ class RCManager:
         """Check if a player has an active RC session."""
         return player_id in self._sessions
 
-    def get_all_sessions(self) -> List[RCSession]:
+    def get_all_sessions(self) -> Tuple[RCSession, ...]:
         """Get all active RC sessions."""
-        return list(self._sessions.values())
+        return self._sessions_snapshot
 
     async def handle_packet(self, player: 'Player', packet_id: int, data: bytes):
         """
@@ -170,19 +229,29 @@ class RCManager:
             packet_id: Packet ID
             data: Packet data
         """
+        # Player ids are reused, so a session is only honoured for the player
+        # object it was registered with, never a later player on the same id.
         session = self.get_session(player.id)
-        if not session:
+        if not session or session.player is not player:
             logger.warning(f"RC packet from non-RC player {player.id}")
             return
 
-        handler = self._handlers.get(packet_id)
-        if handler:
-            try:
-                await handler(session, data)
-            except Exception as e:
-                logger.error(f"RC handler error (packet {packet_id}): {e}")
-        else:
+        try:
+            handler = self._handlers[packet_id]
+        except IndexError:
+            handler = None
+        if handler is None:
             logger.warning(f"Unhandled RC packet: {packet_id}")
+            return
+
+        # Each handler builds its own PacketReader over `data`. One RCManager
+        # serves every admin connection's receive task, so a pooled reader
+        # could be rebound by another session's packet while a handler is
+        # suspended in an await mid-parse.
+        try:
+            await handler(session, data)
+        except Exception as e:
+            logger.error(f"RC handler error (packet {packet_id}): {e}")
 
     async def broadcast_to_rcs(self, packet: bytes, exclude: Optional[Set[int]] = None):
         """
@@ -192,10 +261,19 @@ class RCManager:
             packet: Packet to send
             exclude: Player IDs to exclude
         """
-        exclude = exclude or set()
-        for session in self._sessions.values():
-            if session.player.id not in exclude:
-                await session.player.send_raw(packet)
+        # Written to every socket first and drained only where a buffer backed
+        # up, concurrently: one slow admin connection no longer stalls the
+        # broadcast for the rest. Iterating the snapshot tuple means a session
+        # that (un)registers mid-broadcast cannot break the loop.
+        exclude = exclude or ()
+        backlogged = [
+            session.player for session in self._sessions_snapshot
+            if session.player.id not in exclude
+            and session.player.write_raw(packet)
+        ]
+        if backlogged:
+            await asyncio.gather(*(player.drain() for player in backlogged),
+                                 return_exceptions=True)
 
     # =========================================================================
     # Server Options Handlers
@@ -203,7 +281,7 @@ class RCManager:
 
     async def _handle_server_options_get(self, session: RCSession, data: bytes):
         """Handle RC_SERVEROPTIONSGET - Get server options."""
-        if not session.has_right(PLPERM.VIEWATTRIBUTES):
+        if not session.rights & PLPERM.VIEWATTRIBUTES:
             return
 
         # Build options string
@@ -213,11 +291,11 @@ class RCManager:
 
     async def _handle_server_options_set(self, session: RCSession, data: bytes):
         """Handle RC_SERVEROPTIONSSET - Set server options."""
-        if not session.has_right(PLPERM.SETATTRIBUTES):
+        if not session.rights & PLPERM.SETATTRIBUTES:
             return
 
         reader = PacketReader(data)
-        options_str = reader.remaining().decode('latin-1', errors='replace')
+        options_str = reader.remaining_latin1()
 
         # Parse and apply options
         self._apply_server_options(options_str)
@@ -229,33 +307,25 @@ class RCManager:
     def _build_server_options_string(self) -> str:
         """Build server options string for RC."""
         config = self.server.config
-        lines = []
-
-        # Add common options
-        if hasattr(config, 'server_name'):
-            lines.append(f"name={config.server_name}")
-        if hasattr(config, 'description'):
-            lines.append(f"description={config.description}")
-        if hasattr(config, 'start_level'):
-            lines.append(f"startlevel={config.start_level}")
-        if hasattr(config, 'start_x'):
-            lines.append(f"startx={config.start_x}")
-        if hasattr(config, 'start_y'):
-            lines.append(f"starty={config.start_y}")
-
-        return '\n'.join(lines)
+        return '\n'.join(
+            f"{key}={value}" for key, attr in _SERVER_OPTION_FIELDS
+            if (value := getattr(config, attr, _MISSING)) is not _MISSING
+        )
 
     def _apply_server_options(self, options_str: str):
         """Apply server options from string."""
+        # One partition() per line instead of strip/'in'/split. split('\n')
+        # rather than splitlines(), which would also break a value at the
+        # \x1c-\x1e/\x85 separators a latin-1 decode can produce.
+        config = self.server.config
         for line in options_str.split('\n'):
-            line = line.strip()
-            if '=' in line:
-                key, value = line.split('=', 1)
-                key = key.strip().lower()
-                value = value.strip()
-                # Apply to config
-                if hasattr(self.server.config, key):
-                    setattr(self.server.config, key, value)
+            key, sep, value = line.partition('=')
+            if not sep:
+                continue
+            key = key.strip().lower()
+            # Apply to config
+            if hasattr(config, key):
+                setattr(config, key, value.strip())
 
     # =========================================================================
     # Folder Config Handlers
@@ -263,7 +333,7 @@ class RCManager:
 
     async def _handle_folder_config_get(self, session: RCSession, data: bytes):
         """Handle RC_FOLDERCONFIGGET - Get folder configuration."""
-        if not session.has_right(PLPERM.VIEWATTRIBUTES):
+        if not session.rights & PLPERM.VIEWATTRIBUTES:
             return
 
         config = build_rc_folder_config(self._get_folder_config())
@@ -271,11 +341,11 @@ class RCManager:
 
     async def _handle_folder_config_set(self, session: RCSession, data: bytes):
         """Handle RC_FOLDERCONFIGSET - Set folder configuration."""
-        if not session.has_right(PLPERM.SETATTRIBUTES):
+        if not session.rights & PLPERM.SETATTRIBUTES:
             return
 
         reader = PacketReader(data)
-        config_str = reader.remaining().decode('latin-1', errors='replace')
+        config_str = reader.remaining_latin1()
         # Apply folder config
         logger.info(f"Folder config set by {session.player.account_name}")
 
@@ -289,14 +359,15 @@ class RCManager:
 
     async def _handle_respawn_set(self, session: RCSession, data: bytes):
         """Handle RC_RESPAWNSET - Set respawn time."""
-        if not session.has_right(PLPERM.SETATTRIBUTES):
+        if not session.rights & PLPERM.SETATTRIBUTES:
             return
 
         reader = PacketReader(data)
         respawn_time = reader.read_gchar()
 
-        if hasattr(self.server, 'combat_manager'):
-            self.server.combat_manager.respawn_time = respawn_time
+        combat_manager = getattr(self.server, 'combat_manager', None)
+        if combat_manager is not None:
+            combat_manager.respawn_time = respawn_time
 
         await self._broadcast_rc_message(
             f"{session.player.account_name} set respawn time to {respawn_time}"
@@ -304,14 +375,15 @@ class RCManager:
 
     async def _handle_horse_life_set(self, session: RCSession, data: bytes):
         """Handle RC_HORSELIFESET - Set horse lifetime."""
-        if not session.has_right(PLPERM.SETATTRIBUTES):
+        if not session.rights & PLPERM.SETATTRIBUTES:
             return
 
         reader = PacketReader(data)
         horse_life = reader.read_gchar()
 
-        if hasattr(self.server, 'horse_manager'):
-            self.server.horse_manager.default_respawn_time = horse_life
+        horse_manager = getattr(self.server, 'horse_manager', None)
+        if horse_manager is not None:
+            horse_manager.default_respawn_time = horse_life
 
         await self._broadcast_rc_message(
             f"{session.player.account_name} set horse life to {horse_life}"
@@ -330,7 +402,7 @@ class RCManager:
         auto-adjusted), so there's nothing sensible to wire it into. Parse
         and log for observability, but this stays a genuine no-op.
         """
-        if not session.has_right(PLPERM.SETATTRIBUTES):
+        if not session.rights & PLPERM.SETATTRIBUTES:
             return
 
         reader = PacketReader(data)
@@ -339,14 +411,15 @@ class RCManager:
 
     async def _handle_baddy_respawn_set(self, session: RCSession, data: bytes):
         """Handle RC_BADDYRESPAWNSET - Set baddy respawn time."""
-        if not session.has_right(PLPERM.SETATTRIBUTES):
+        if not session.rights & PLPERM.SETATTRIBUTES:
             return
 
         reader = PacketReader(data)
         respawn_time = reader.read_gchar()
 
-        if hasattr(self.server, 'baddy_manager'):
-            self.server.baddy_manager.default_respawn_time = respawn_time
+        baddy_manager = getattr(self.server, 'baddy_manager', None)
+        if baddy_manager is not None:
+            baddy_manager.default_respawn_time = respawn_time
 
         await self._broadcast_rc_message(
             f"{session.player.account_name} set baddy respawn to {respawn_time}"
@@ -358,11 +431,11 @@ class RCManager:
 
     async def _handle_player_props_get(self, session: RCSession, data: bytes):
         """Handle RC_PLAYERPROPSGET - Get player properties."""
-        if not session.has_right(PLPERM.VIEWATTRIBUTES):
+        if not session.rights & PLPERM.VIEWATTRIBUTES:
             return
 
         reader = PacketReader(data)
-        player_name = reader.remaining().decode('latin-1', errors='replace')
+        player_name = reader.remaining_latin1()
 
         player = self.server.get_player_by_name(player_name)
         if player:
@@ -372,7 +445,7 @@ class RCManager:
 
     async def _handle_player_props_get2(self, session: RCSession, data: bytes):
         """Handle RC_PLAYERPROPSGET2 - Get player props by ID."""
-        if not session.has_right(PLPERM.VIEWATTRIBUTES):
+        if not session.rights & PLPERM.VIEWATTRIBUTES:
             return
 
         reader = PacketReader(data)
@@ -392,7 +465,7 @@ class RCManager:
         to that handler, which read the leading length byte as part of the
         name (a leading garbage character on every lookup).
         """
-        if not session.has_right(PLPERM.VIEWATTRIBUTES):
+        if not session.rights & PLPERM.VIEWATTRIBUTES:
             return
 
         reader = PacketReader(data)
@@ -421,7 +494,7 @@ class RCManager:
         setPropsFromRCPacket (commit 36f409da) so the client's level state
         stays in sync.
         """
-        if not session.has_right(PLPERM.SETATTRIBUTES):
+        if not session.rights & PLPERM.SETATTRIBUTES:
             return
 
         reader = PacketReader(data)
@@ -446,7 +519,7 @@ class RCManager:
         Same stub caveat as _handle_player_props_set applies to the prop
         stream.
         """
-        if not session.has_right(PLPERM.SETATTRIBUTES):
+        if not session.rights & PLPERM.SETATTRIBUTES:
             return
 
         reader = PacketReader(data)
@@ -460,11 +533,11 @@ class RCManager:
 
     async def _handle_player_props_reset(self, session: RCSession, data: bytes):
         """Handle RC_PLAYERPROPSRESET - Reset player properties."""
-        if not session.has_right(PLPERM.SETATTRIBUTES):
+        if not session.rights & PLPERM.SETATTRIBUTES:
             return
 
         reader = PacketReader(data)
-        player_name = reader.remaining().decode('latin-1', errors='replace')
+        player_name = reader.remaining_latin1()
 
         player = self.server.get_player_by_name(player_name)
         if player:
@@ -478,30 +551,32 @@ class RCManager:
                 f"{session.player.account_name} reset props for {player_name}"
             )
 
-    def _build_player_props(self, player: 'Player') -> Dict[int, Any]:
-        """Build player properties dict for RC."""
-        return {
-            PLPROP.NICKNAME: player.nickname,
-            PLPROP.CURLEVEL: player.level.name if player.level else "",
-            PLPROP.X2: player.x,
-            PLPROP.Y2: player.y,
-            PLPROP.CURPOWER: int(player.hearts * 2),
+    def _build_player_props(self, player: 'Player') -> List[Tuple[int, Any]]:
+        """Build the (prop_id, value) pairs sent to RC, ascending by id."""
+        # Pairs rather than a dict: build_rc_player_props writes them as
+        # given. The ids are unique, so sorting never compares the values.
+        return sorted((
+            (PLPROP.NICKNAME, player.nickname),
+            (PLPROP.CURLEVEL, player.level.name if player.level else ""),
+            (PLPROP.X2, player.x),
+            (PLPROP.Y2, player.y),
+            (PLPROP.CURPOWER, int(player.hearts * 2)),
             # MAXPOWER is FULL hearts on the wire (unlike CURPOWER's halves)
             # - GServer-v2 PlayerProps.cpp:171-186.
-            PLPROP.MAXPOWER: int(player.max_hearts),
-            PLPROP.RUPEESCOUNT: player.rupees,
-            PLPROP.BOMBSCOUNT: player.bombs,
-            PLPROP.ARROWSCOUNT: player.arrows,
-        }
+            (PLPROP.MAXPOWER, int(player.max_hearts)),
+            (PLPROP.RUPEESCOUNT, player.rupees),
+            (PLPROP.BOMBSCOUNT, player.bombs),
+            (PLPROP.ARROWSCOUNT, player.arrows),
+        ))
 
     async def _handle_disconnect_player(self, session: RCSession, data: bytes):
         """Handle RC_DISCONNECTPLAYER - Disconnect a player."""
-        if not session.has_right(PLPERM.DISCONNECT):
+        if not session.rights & PLPERM.DISCONNECT:
             return
 
         reader = PacketReader(data)
         player_id = reader.read_gshort()
-        reason = reader.remaining().decode('latin-1', errors='replace')
+        reason = reader.remaining_latin1()
 
         player = self.server.get_player(player_id)
         if player:
@@ -512,7 +587,7 @@ class RCManager:
 
     async def _handle_warp_player(self, session: RCSession, data: bytes):
         """Handle RC_WARPPLAYER - Warp a player."""
-        if not session.has_right(PLPERM.WARPTOPLAYER):
+        if not session.rights & PLPERM.WARPTOPLAYER:
             return
 
         reader = PacketReader(data)
@@ -521,7 +596,7 @@ class RCManager:
         # a warp north/west of the origin needs negative values).
         x = reader.read_gchar_signed() / 2.0
         y = reader.read_gchar_signed() / 2.0
-        level_name = reader.remaining().decode('latin-1', errors='replace')
+        level_name = reader.remaining_latin1()
 
         player = self.server.get_player(player_id)
         if player:
@@ -536,16 +611,17 @@ class RCManager:
 
     async def _handle_player_rights_get(self, session: RCSession, data: bytes):
         """Handle RC_PLAYERRIGHTSGET - Get player rights."""
-        if not session.has_right(PLPERM.VIEWATTRIBUTES):
+        if not session.rights & PLPERM.VIEWATTRIBUTES:
             return
 
         reader = PacketReader(data)
-        player_name = reader.remaining().decode('latin-1', errors='replace')
+        player_name = reader.remaining_latin1()
 
         # Get rights from account
         rights = 0
-        if hasattr(self.server, 'account_manager'):
-            account = self.server.account_manager.get_account(player_name)
+        account_manager = getattr(self.server, 'account_manager', None)
+        if account_manager is not None:
+            account = account_manager.get_account(player_name)
             if account:
                 rights = account.admin_rights
 
@@ -554,7 +630,7 @@ class RCManager:
 
     async def _handle_player_rights_set(self, session: RCSession, data: bytes):
         """Handle RC_PLAYERRIGHTSSET - Set player rights."""
-        if not session.has_right(PLPERM.SETRIGHTS):
+        if not session.rights & PLPERM.SETRIGHTS:
             return
 
         reader = PacketReader(data)
@@ -566,11 +642,12 @@ class RCManager:
         admin_ip = reader.read_gstring()
         folders = reader.read_gstring_short()
 
-        if hasattr(self.server, 'account_manager'):
-            account = self.server.account_manager.get_account(player_name)
+        account_manager = getattr(self.server, 'account_manager', None)
+        if account_manager is not None:
+            account = account_manager.get_account(player_name)
             if account:
                 account.admin_rights = rights
-                self.server.account_manager.save_account(account)
+                account_manager.save_account(account)
 
         await self._broadcast_rc_message(
             f"{session.player.account_name} set rights for {player_name}"
@@ -582,15 +659,16 @@ class RCManager:
 
     async def _handle_player_comments_get(self, session: RCSession, data: bytes):
         """Handle RC_PLAYERCOMMENTSGET - Get player comments."""
-        if not session.has_right(PLPERM.VIEWATTRIBUTES):
+        if not session.rights & PLPERM.VIEWATTRIBUTES:
             return
 
         reader = PacketReader(data)
-        player_name = reader.remaining().decode('latin-1', errors='replace')
+        player_name = reader.remaining_latin1()
 
         comments = ""
-        if hasattr(self.server, 'account_manager'):
-            account = self.server.account_manager.get_account(player_name)
+        account_manager = getattr(self.server, 'account_manager', None)
+        if account_manager is not None:
+            account = account_manager.get_account(player_name)
             if account and hasattr(account, 'comments'):
                 comments = account.comments
 
@@ -599,31 +677,33 @@ class RCManager:
 
     async def _handle_player_comments_set(self, session: RCSession, data: bytes):
         """Handle RC_PLAYERCOMMENTSSET - Set player comments."""
-        if not session.has_right(PLPERM.SETATTRIBUTES):
+        if not session.rights & PLPERM.SETATTRIBUTES:
             return
 
         reader = PacketReader(data)
         player_name = reader.read_gstring()
-        comments = reader.remaining().decode('latin-1', errors='replace')
+        comments = reader.remaining_latin1()
 
-        if hasattr(self.server, 'account_manager'):
-            account = self.server.account_manager.get_account(player_name)
+        account_manager = getattr(self.server, 'account_manager', None)
+        if account_manager is not None:
+            account = account_manager.get_account(player_name)
             if account:
                 account.comments = comments
-                self.server.account_manager.save_account(account)
+                account_manager.save_account(account)
 
     async def _handle_player_ban_get(self, session: RCSession, data: bytes):
         """Handle RC_PLAYERBANGET - Get player ban info."""
-        if not session.has_right(PLPERM.BAN):
+        if not session.rights & PLPERM.BAN:
             return
 
         reader = PacketReader(data)
-        player_name = reader.remaining().decode('latin-1', errors='replace')
+        player_name = reader.remaining_latin1()
 
         is_banned = False
         ban_reason = ""
-        if hasattr(self.server, 'account_manager'):
-            account = self.server.account_manager.get_account(player_name)
+        account_manager = getattr(self.server, 'account_manager', None)
+        if account_manager is not None:
+            account = account_manager.get_account(player_name)
             if account:
                 is_banned = account.is_banned
                 ban_reason = account.ban_reason
@@ -633,20 +713,21 @@ class RCManager:
 
     async def _handle_player_ban_set(self, session: RCSession, data: bytes):
         """Handle RC_PLAYERBANSET - Set player ban."""
-        if not session.has_right(PLPERM.BAN):
+        if not session.rights & PLPERM.BAN:
             return
 
         reader = PacketReader(data)
         player_name = reader.read_gstring()
         is_banned = reader.read_gchar() != 0
-        ban_reason = reader.remaining().decode('latin-1', errors='replace')
+        ban_reason = reader.remaining_latin1()
 
-        if hasattr(self.server, 'account_manager'):
-            account = self.server.account_manager.get_account(player_name)
+        account_manager = getattr(self.server, 'account_manager', None)
+        if account_manager is not None:
+            account = account_manager.get_account(player_name)
             if account:
                 account.is_banned = is_banned
                 account.ban_reason = ban_reason
-                self.server.account_manager.save_account(account)
+                account_manager.save_account(account)
 
         action = "banned" if is_banned else "unbanned"
         await self._broadcast_rc_message(
@@ -656,7 +737,7 @@ class RCManager:
     async def _handle_apply_reason(self, session: RCSession, data: bytes):
         """Handle RC_APPLYREASON - Apply ban/mute reason."""
         reader = PacketReader(data)
-        reason = reader.remaining().decode('latin-1', errors='replace')
+        reason = reader.remaining_latin1()
         logger.info(f"RC apply reason from {session.player.account_name}: {reason}")
 
     # =========================================================================
@@ -665,19 +746,20 @@ class RCManager:
 
     async def _handle_server_flags_get(self, session: RCSession, data: bytes):
         """Handle RC_SERVERFLAGSGET - Get server flags."""
-        if not session.has_right(PLPERM.VIEWATTRIBUTES):
+        if not session.rights & PLPERM.VIEWATTRIBUTES:
             return
 
         flags = {}
-        if hasattr(self.server, 'server_flags'):
-            flags = self.server.server_flags
+        server_flags = getattr(self.server, 'server_flags', None)
+        if server_flags is not None:
+            flags = server_flags
 
         packet = build_rc_server_flags(flags)
         await session.player.send_raw(packet)
 
     async def _handle_server_flags_set(self, session: RCSession, data: bytes):
         """Handle RC_SERVERFLAGSSET - Set server flags."""
-        if not session.has_right(PLPERM.SETATTRIBUTES):
+        if not session.rights & PLPERM.SETATTRIBUTES:
             return
 
         # Wire format (msgPLI_RC_SERVERFLAGSSET): [GUSHORT count] then
@@ -686,12 +768,13 @@ class RCManager:
         reader = PacketReader(data)
         count = reader.read_gshort()
 
-        if hasattr(self.server, 'server_flags'):
+        server_flags = getattr(self.server, 'server_flags', None)
+        if server_flags is not None:
+            read_gstring = reader.read_gstring
             for _ in range(count):
-                pair = reader.read_gstring()
-                if '=' in pair:
-                    key, value = pair.split('=', 1)
-                    self.server.server_flags[key.strip()] = value.strip()
+                key, sep, value = read_gstring().partition('=')
+                if sep:
+                    server_flags[key.strip()] = value.strip()
 
         await self._broadcast_rc_message(
             f"{session.player.account_name} updated server flags"
@@ -703,22 +786,24 @@ class RCManager:
 
     async def _handle_account_add(self, session: RCSession, data: bytes):
         """Handle RC_ACCOUNTADD - Add account."""
-        if not session.has_right(PLPERM.SETATTRIBUTES):
+        if not session.rights & PLPERM.SETATTRIBUTES:
             return
 
         # Wire format (msgPLI_RC_ACCOUNTADD): [GUCHAR-len account][GUCHAR-len
         # password][GUCHAR-len email][GUCHAR banned][GUCHAR onlyLoad]
         # [GUCHAR adminlevel, deprecated].
         reader = PacketReader(data)
-        account_name = reader.read_gstring()
-        password = reader.read_gstring()
-        email = reader.read_gstring()
-        banned = reader.read_gchar() != 0
-        only_load = reader.read_gchar() != 0
-        reader.read_gchar()  # admin level, deprecated
-
-        if hasattr(self.server, 'account_manager'):
-            self.server.account_manager.create_account(account_name, password)
+        read_gstring = reader.read_gstring
+        account_name = read_gstring()
+        password = read_gstring()
+        email = read_gstring()
+        banned_flag, only_load_flag, _admin_level = reader.read_gchars(3)
+        banned = banned_flag != 0
+        only_load = only_load_flag != 0
+
+        account_manager = getattr(self.server, 'account_manager', None)
+        if account_manager is not None:
+            account_manager.create_account(account_name, password)
 
         await self._broadcast_rc_message(
             f"{session.player.account_name} created account {account_name}"
@@ -726,14 +811,15 @@ class RCManager:
 
     async def _handle_account_del(self, session: RCSession, data: bytes):
         """Handle RC_ACCOUNTDEL - Delete account."""
-        if not session.has_right(PLPERM.SETATTRIBUTES):
+        if not session.rights & PLPERM.SETATTRIBUTES:
             return
 
         reader = PacketReader(data)
-        account_name = reader.remaining().decode('latin-1', errors='replace')
+        account_name = reader.remaining_latin1()
 
-        if hasattr(self.server, 'account_manager'):
-            self.server.account_manager.delete_account(account_name)
+        account_manager = getattr(self.server, 'account_manager', None)
+        if account_manager is not None:
+            account_manager.delete_account(account_name)
 
         await self._broadcast_rc_message(
             f"{session.player.account_name} deleted account {account_name}"
@@ -741,27 +827,29 @@ class RCManager:
 
     async def _handle_account_list_get(self, session: RCSession, data: bytes):
         """Handle RC_ACCOUNTLISTGET - Get account list."""
-        if not session.has_right(PLPERM.VIEWATTRIBUTES):
+        if not session.rights & PLPERM.VIEWATTRIBUTES:
             return
 
         accounts = []
-        if hasattr(self.server, 'account_manager'):
-            accounts = self.server.account_manager.list_accounts()
+        account_manager = getattr(self.server, 'account_manager', None)
+        if account_manager is not None:
+            accounts = account_manager.list_accounts()
 
         packet = build_rc_account_list(accounts)
         await session.player.send_raw(packet)
 
     async def _handle_account_get(self, session: RCSession, data: bytes):
         """Handle RC_ACCOUNTGET - Get account details."""
-        if not session.has_right(PLPERM.VIEWATTRIBUTES):
+        if not session.rights & PLPERM.VIEWATTRIBUTES:
             return
 
         reader = PacketReader(data)
-        account_name = reader.remaining().decode('latin-1', errors='replace')
+        account_name = reader.remaining_latin1()
 
         account_data = {}
-        if hasattr(self.server, 'account_manager'):
-            account = self.server.account_manager.get_account(account_name)
+        account_manager = getattr(self.server, 'account_manager', None)
+        if account_manager is not None:
+            account = account_manager.get_account(account_name)
             if account:
                 account_data = {
                     'name': account.account_name,
@@ -774,7 +862,7 @@ class RCManager:
 
     async def _handle_account_set(self, session: RCSession, data: bytes):
         """Handle RC_ACCOUNTSET - Set account details."""
-        if not session.has_right(PLPERM.SETATTRIBUTES):
+        if not session.rights & PLPERM.SETATTRIBUTES:
             return
 
         # Wire format (msgPLI_RC_ACCOUNTSET): [GUCHAR-len account][GUCHAR-len
@@ -783,14 +871,15 @@ class RCManager:
         # banreason]. Applying these fields is not implemented (stub); only
         # parsed here so the packet doesn't desync/crash.
         reader = PacketReader(data)
-        account_name = reader.read_gstring()
-        password = reader.read_gstring()
-        email = reader.read_gstring()
-        banned = reader.read_gchar() != 0
-        load_only = reader.read_gchar() != 0
-        reader.read_gchar()  # admin level, deprecated
-        world = reader.read_gstring()
-        ban_reason = reader.read_gstring()
+        read_gstring = reader.read_gstring
+        account_name = read_gstring()
+        password = read_gstring()
+        email = read_gstring()
+        banned_flag, load_only_flag, _admin_level = reader.read_gchars(3)
+        banned = banned_flag != 0
+        load_only = load_only_flag != 0
+        world = read_gstring()
+        ban_reason = read_gstring()
 
         logger.info(f"Account {account_name} modified by {session.player.account_name}")
 
@@ -801,7 +890,7 @@ class RCManager:
     async def _handle_rc_chat(self, session: RCSession, data: bytes):
         """Handle RC_CHAT - RC chat message."""
         reader = PacketReader(data)
-        message = reader.remaining().decode('latin-1', errors='replace')
+        message = reader.remaining_latin1()
 
         await self.process_chat(message, session)
 
@@ -827,25 +916,30 @@ class RCManager:
             return
 
         # RC-authored chat is labelled; server-originated sendtorc text is not.
-        formatted = (f"{session.player.account_name}: {message}"
-                     if session is not None else message)
-        packet = build_rc_chat(formatted)
+        if session is not None:
+            account_name = session.player.account_name
+            packet = build_rc_chat_from(account_name, message)
+        else:
+            account_name = None
+            packet = build_rc_chat(message)
 
         # Broadcast to all RCs
         await self.broadcast_to_rcs(packet)
 
-        logger.info(f"[RC] {formatted}")
+        if account_name is not None:
+            logger.info("[RC] %s: %s", account_name, message)
+        else:
+            logger.info("[RC] %s", message)
 
     async def _handle_admin_message(self, session: RCSession, data: bytes):
         """Handle RC_ADMINMESSAGE - Admin message to all players."""
-        if not session.has_right(PLPERM.ADMINMSG):
+        if not session.rights & PLPERM.ADMINMSG:
             return
 
         reader = PacketReader(data)
-        message = reader.remaining().decode('latin-1', errors='replace')
+        message = reader.remaining_latin1()
 
         # Broadcast to all players
-        from .protocol.packets import build_admin_message
         packet = build_admin_message(message)
         await self.server.broadcast_to_all(packet)
 
@@ -855,24 +949,22 @@ class RCManager:
 
     async def _handle_priv_admin_message(self, session: RCSession, data: bytes):
         """Handle RC_PRIVADMINMESSAGE - Private admin message."""
-        if not session.has_right(PLPERM.ADMINMSG):
+        if not session.rights & PLPERM.ADMINMSG:
             return
 
         reader = PacketReader(data)
         player_id = reader.read_gshort()
-        message = reader.remaining().decode('latin-1', errors='replace')
+        message = reader.remaining_latin1()
 
         player = self.server.get_player(player_id)
         if player:
-            from .protocol.packets import build_admin_message
             packet = build_admin_message(message)
             await player.send_raw(packet)
 
     async def _handle_list_rcs(self, session: RCSession, data: bytes):
         """Handle RC_LISTRCS - List RC users."""
-        rc_list = []
-        for rc_session in self._sessions.values():
-            rc_list.append(rc_session.player.account_name)
+        rc_list = [rc_session.player.account_name
+                   for rc_session in self._sessions_snapshot]
 
         # Send list
         packet = build_rc_chat("RC Users: " + ", ".join(rc_list))
@@ -880,13 +972,13 @@ class RCManager:
 
     async def _handle_disconnect_rc(self, session: RCSession, data: bytes):
         """Handle RC_DISCONNECTRC - Disconnect an RC user."""
-        if not session.has_right(PLPERM.DISCONNECT):
+        if not session.rights & PLPERM.DISCONNECT:
             return
 
         reader = PacketReader(data)
-        rc_name = reader.remaining().decode('latin-1', errors='replace')
+        rc_name = reader.remaining_latin1()
 
-        for rc_session in self._sessions.values():
+        for rc_session in self._sessions_snapshot:
             if rc_session.player.account_name == rc_name:
                 await rc_session.player.disconnect()
                 await self._broadcast_rc_message(
@@ -900,12 +992,13 @@ class RCManager:
 
     async def _handle_update_levels(self, session: RCSession, data: bytes):
         """Handle RC_UPDATELEVELS - Reload levels."""
-        if not session.has_right(PLPERM.UPDATELEVEL):
+        if not session.rights & PLPERM.UPDATELEVEL:
             return
 
         # Reload levels
-        if hasattr(self.server.world, 'reload_levels'):
-            self.server.world.reload_levels()
+        reload_levels = getattr(self.server.world, 'reload_levels', None)
+        if reload_levels is not None:
+            reload_levels()
 
         await self._broadcast_rc_message(
             f"{session.player.account_name} reloaded levels"
@@ -917,7 +1010,7 @@ class RCManager:
 
     async def _handle_file_browser_start(self, session: RCSession, data: bytes):
         """Handle RC_FILEBROWSER_START - Start file browser."""
-        if not session.has_right(PLPERM.VIEWATTRIBUTES):
+        if not session.rights & PLPERM.VIEWATTRIBUTES:
             return
 
         session.file_browser_active = True
@@ -936,7 +1029,7 @@ class RCManager:
             return
 
         reader = PacketReader(data)
-        directory = reader.remaining().decode('latin-1', errors='replace')
+        directory = reader.remaining_latin1()
 
         # Update path
         if directory == "..":
@@ -947,10 +1040,7 @@ class RCManager:
                 session.file_browser_path = ""
         else:
             # Go into directory
-            if session.file_browser_path:
-                session.file_browser_path += "/" + directory
-            else:
-                session.file_browser_path = directory
+            session.file_browser_path = session.file_browser_prefix + directory
 
         await self._send_directory_listing(session)
 
@@ -965,15 +1055,16 @@ class RCManager:
             return
 
         reader = PacketReader(data)
-        filename = reader.remaining().decode('latin-1', errors='replace')
+        filename = reader.remaining_latin1()
 
-        if hasattr(self.server, 'filesystem'):
-            path = session.file_browser_path + "/" + filename if session.file_browser_path else filename
-            await self.server.filesystem.send_file(session.player, path)
+        filesystem = getattr(self.server, 'filesystem', None)
+        if filesystem is not None:
+            path = session.file_browser_prefix + filename
+            await filesystem.send_file(session.player, path)
 
     async def _handle_file_browser_up(self, session: RCSession, data: bytes):
         """Handle RC_FILEBROWSER_UP - Upload file."""
-        if not session.has_right(PLPERM.SETATTRIBUTES):
+        if not session.rights & PLPERM.SETATTRIBUTES:
             return
 
         # File upload is handled by large file transfer
@@ -981,7 +1072,7 @@ class RCManager:
 
     async def _handle_file_browser_move(self, session: RCSession, data: bytes):
         """Handle RC_FILEBROWSER_MOVE - Move file."""
-        if not session.has_right(PLPERM.SETATTRIBUTES):
+        if not session.rights & PLPERM.SETATTRIBUTES:
             return
 
         # Wire format (msgPLI_RC_FILEBROWSER_MOVE): [GUCHAR-len destination
@@ -989,30 +1080,32 @@ class RCManager:
         # current folder into the given destination dir.
         reader = PacketReader(data)
         dest_dir = reader.read_gstring()
-        filename = reader.remaining().decode('latin-1', errors='replace')
+        filename = reader.remaining_latin1()
 
-        if hasattr(self.server, 'filesystem'):
-            src = session.file_browser_path + "/" + filename if session.file_browser_path else filename
+        filesystem = getattr(self.server, 'filesystem', None)
+        if filesystem is not None:
+            src = session.file_browser_prefix + filename
             dst = dest_dir + "/" + filename if dest_dir else filename
-            self.server.filesystem.move_file(src, dst)
+            filesystem.move_file(src, dst)
             await self._send_directory_listing(session)
 
     async def _handle_file_browser_delete(self, session: RCSession, data: bytes):
         """Handle RC_FILEBROWSER_DELETE - Delete file."""
-        if not session.has_right(PLPERM.SETATTRIBUTES):
+        if not session.rights & PLPERM.SETATTRIBUTES:
             return
 
         reader = PacketReader(data)
-        filename = reader.remaining().decode('latin-1', errors='replace')
+        filename = reader.remaining_latin1()
 
-        if hasattr(self.server, 'filesystem'):
-            path = session.file_browser_path + "/" + filename if session.file_browser_path else filename
-            self.server.filesystem.delete_file(path)
+        filesystem = getattr(self.server, 'filesystem', None)
+        if filesystem is not None:
+            path = session.file_browser_prefix + filename
+            filesystem.delete_file(path)
             await self._send_directory_listing(session)
 
     async def _handle_file_browser_rename(self, session: RCSession, data: bytes):
         """Handle RC_FILEBROWSER_RENAME - Rename file."""
-        if not session.has_right(PLPERM.SETATTRIBUTES):
+        if not session.rights & PLPERM.SETATTRIBUTES:
             return
 
         # Wire format (msgPLI_RC_FILEBROWSER_RENAME): [GUCHAR-len old
@@ -1022,31 +1115,34 @@ class RCManager:
         old_name = reader.read_gstring()
         new_name = reader.read_gstring()
 
-        if hasattr(self.server, 'filesystem'):
-            old_path = session.file_browser_path + "/" + old_name if session.file_browser_path else old_name
-            new_path = session.file_browser_path + "/" + new_name if session.file_browser_path else new_name
-            self.server.filesystem.move_file(old_path, new_path)
+        filesystem = getattr(self.server, 'filesystem', None)
+        if filesystem is not None:
+            old_path = session.file_browser_prefix + old_name
+            new_path = session.file_browser_prefix + new_name
+            filesystem.move_file(old_path, new_path)
             await self._send_directory_listing(session)
 
     async def _handle_folder_delete(self, session: RCSession, data: bytes):
         """Handle RC_FOLDERDELETE - Delete folder."""
-        if not session.has_right(PLPERM.SETATTRIBUTES):
+        if not session.rights & PLPERM.SETATTRIBUTES:
             return
 
         reader = PacketReader(data)
-        folder = reader.remaining().decode('latin-1', errors='replace')
+        folder = reader.remaining_latin1()
 
-        if hasattr(self.server, 'filesystem'):
-            path = session.file_browser_path + "/" + folder if session.file_browser_path else folder
-            self.server.filesystem.delete_folder(path)
+        filesystem = getattr(self.server, 'filesystem', None)
+        if filesystem is not None:
+            path = session.file_browser_prefix + folder
+            filesystem.delete_folder(path)
             await self._send_directory_listing(session)
 
     async def _send_directory_listing(self, session: RCSession):
         """Send directory listing to RC session."""
         files = []
 
-        if hasattr(self.server, 'filesystem'):
-            files = self.server.filesystem.list_directory(session.file_browser_path)
+        filesystem = getattr(self.server, 'filesystem', None)
+        if filesystem is not None:
+            files = filesystem.list_directory(session.file_browser_path)
 
         packet = build_rc_file_browser_dir(session.file_browser_path, files)
         await session.player.send_raw(packet)
@@ -1063,11 +1159,11 @@ class RCManager:
         an empty CString buffer by filename; bytes stream in afterward via
         RC_FILEBROWSER_UP chunks and get flushed on RC_LARGEFILEEND).
         """
-        if not session.has_right(PLPERM.SETATTRIBUTES):
+        if not session.rights & PLPERM.SETATTRIBUTES:
             return
 
         reader = PacketReader(data)
-        filename = reader.remaining().decode('latin-1', errors='replace')
+        filename = reader.remaining_latin1()
 
         session.large_file_uploads[filename] = bytearray()
         logger.info(f"Large file upload started: {filename}")
@@ -1080,20 +1176,23 @@ class RCManager:
         RC_LARGEFILESTART. Previously this never read it, so the buffered
         upload could never be matched up and finalized.
         """
-        if not session.has_right(PLPERM.SETATTRIBUTES):
+        if not session.rights & PLPERM.SETATTRIBUTES:
             return
 
         reader = PacketReader(data)
-        filename = reader.remaining().decode('latin-1', errors='replace')
+        filename = reader.remaining_latin1()
 
         buf = session.large_file_uploads.pop(filename, None)
         if buf is None:
             logger.warning(f"Large file upload ended for unknown file: {filename}")
             return
 
-        if hasattr(self.server, 'filesystem'):
-            path = session.file_browser_path + "/" + filename if session.file_browser_path else filename
-            self.server.filesystem.write_file(path, bytes(buf))
+        filesystem = getattr(self.server, 'filesystem', None)
+        if filesystem is not None:
+            path = session.file_browser_prefix + filename
+            # The upload buffer is written as-is: bytes(buf) copied the whole
+            # file (up to max_upload_size) just to hand it to f.write().
+            filesystem.write_file(path, buf)
 
         logger.info(f"Large file upload completed: {filename} ({len(buf)} bytes)")
 
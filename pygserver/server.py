@@ -6,13 +6,14 @@ levels, NPCs, and game state. Full GServer-v2 compatible implementation.
 """
 
 import asyncio
+import heapq
 import logging
 import math
 import time
 from typing import Dict, Optional, Set, List
 from pathlib import Path
 
-from .audience import Audience
+from .audience import Audience, send_to_all
 from .config import ServerConfig
 from .player import Player
 from .level import Level
@@ -24,6 +25,92 @@ from .protocol.packets import build_flag_del, build_flag_set, build_world_time
 logger = logging.getLogger(__name__)
 
 
+# =============================================================================
+# Built-in "serverside,<action>,..." triggers, looked up by action name in
+# handle_trigger_action. Each returns True once it has handled the trigger.
+# =============================================================================
+
+async def _trigger_warp(server, player, params) -> bool:
+    # Format: serverside,warp,level,x,y
+    if len(params) < 3:
+        return False
+    try:
+        dest_x = float(params[1])
+        dest_y = float(params[2])
+    except ValueError:
+        return False
+    await player.warp(params[0], dest_x, dest_y)
+    return True
+
+
+async def _trigger_setflag(server, player, params) -> bool:
+    # Format: serverside,setflag,name,value
+    if len(params) < 2:
+        return False
+    player.set_flag(params[0], params[1])
+    return True
+
+
+async def _trigger_addweapon(server, player, params) -> bool:
+    # Format: serverside,addweapon,name
+    if not params:
+        return False
+    weapon_name = params[0]
+    player.add_weapon(weapon_name)
+    if server.gs2_manager is not None:
+        await server.gs2_manager.announce_weapon(player, weapon_name)
+    return True
+
+
+async def _trigger_removeweapon(server, player, params) -> bool:
+    # Format: serverside,removeweapon,name
+    if not params:
+        return False
+    player.remove_weapon(params[0])
+    return True
+
+
+async def _trigger_giverupees(server, player, params) -> bool:
+    # Format: serverside,giverupees,amount
+    if not params:
+        return False
+    try:
+        amount = int(params[0])
+    except ValueError:
+        return False
+    player.rupees = min(9999, player.rupees + amount)
+    return True
+
+
+async def _trigger_heal(server, player, params) -> bool:
+    # Format: serverside,heal,amount
+    if not params:
+        return False
+    try:
+        amount = float(params[0])
+    except ValueError:
+        return False
+    player.hearts = min(player.max_hearts, player.hearts + amount)
+    return True
+
+
+async def _trigger_setlevel(server, player, params) -> bool:
+    # Format: serverside,setlevel,flag,value
+    # Level-specific flags are not stored yet; the trigger is accepted.
+    return len(params) >= 2 and bool(player.level)
+
+
+_TRIGGER_ACTIONS = {
+    'warp': _trigger_warp,
+    'setflag': _trigger_setflag,
+    'addweapon': _trigger_addweapon,
+    'removeweapon': _trigger_removeweapon,
+    'giverupees': _trigger_giverupees,
+    'heal': _trigger_heal,
+    'setlevel': _trigger_setlevel,
+}
+
+
 class GameServer:
     """
     Main game server class.
@@ -39,7 +126,19 @@ class GameServer:
 
         # Player management
         self.players: Dict[int, Player] = {}
-        self.next_player_id = 2  # IDs 0-1 reserved
+        # IDs 0-1 reserved. Fresh IDs come from next_player_id; IDs handed
+        # back by _remove_player go on a min-heap and are reused first, so
+        # allocation still picks the lowest free ID without scanning.
+        self.next_player_id = 2
+        self._free_player_ids: List[int] = []
+        # Lowercased account name -> player, filled by get_player_by_name
+        # lookups, re-checked against self.players on every hit and dropped
+        # in _remove_player.
+        self._players_by_name: Dict[str, Player] = {}
+        # Case-folded config.staff for is_staff(); the staff list is only
+        # read from the config file, which is loaded before the server.
+        self._staff_lower = frozenset(
+            s.lower() for s in getattr(self.config, 'staff', ()))
 
         # World/level management
         self.world = World(self)
@@ -127,9 +226,14 @@ class GameServer:
         logger.info("Stopping server...")
         self.running = False
 
-        # Disconnect all players
-        for player in list(self.players.values()):
-            await player.disconnect()
+        # Disconnect all players; their socket closes overlap, and one that
+        # fails to close does not keep the rest connected.
+        results = await asyncio.gather(
+            *(player.disconnect() for player in list(self.players.values())),
+            return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Disconnect error during shutdown: {result}")
 
         # Stop subsystems
         await self._stop_subsystems()
@@ -239,10 +343,23 @@ class GameServer:
         if levels_path.exists():
             logger.info(f"Loading levels from {levels_path}")
 
+            # Read and parse the level files on worker threads so their disk
+            # reads overlap (run_in_executor rather than asyncio.to_thread:
+            # this project targets Python 3.8+). Registration stays here on
+            # the loop, in glob order, since it touches the managers.
+            loop = asyncio.get_running_loop()
+            level_files = list(levels_path.glob("*.nw"))
+            results = await asyncio.gather(
+                *(loop.run_in_executor(None, Level.load, str(level_file))
+                  for level_file in level_files),
+                return_exceptions=True)
+
             # Load individual levels
-            for level_file in levels_path.glob("*.nw"):
+            for level_file, level in zip(level_files, results):
+                if isinstance(level, Exception):
+                    logger.warning(f"Failed to load level {level_file}: {level}")
+                    continue
                 try:
-                    level = Level.load(str(level_file))
                     self.world.add_level(level)
                     await self._register_level_features(level)
                     logger.debug(f"Loaded level: {level.name}")
@@ -250,15 +367,22 @@ class GameServer:
                     logger.warning(f"Failed to load level {level_file}: {e}")
 
             # Load GMAPs
-            for gmap_name in self.config.gmaps:
-                gmap_path = levels_path / gmap_name
-                if gmap_path.exists():
-                    try:
-                        gmap = GMap.load(str(gmap_path))
-                        self.world.add_gmap(gmap)
-                        logger.info(f"Loaded GMAP: {gmap.name} ({gmap.width}x{gmap.height})")
-                    except Exception as e:
-                        logger.warning(f"Failed to load GMAP {gmap_name}: {e}")
+            gmap_names = [gmap_name for gmap_name in self.config.gmaps
+                          if (levels_path / gmap_name).exists()]
+            results = await asyncio.gather(
+                *(loop.run_in_executor(None, GMap.load,
+                                       str(levels_path / gmap_name))
+                  for gmap_name in gmap_names),
+                return_exceptions=True)
+            for gmap_name, gmap in zip(gmap_names, results):
+                if isinstance(gmap, Exception):
+                    logger.warning(f"Failed to load GMAP {gmap_name}: {gmap}")
+                    continue
+                try:
+                    self.world.add_gmap(gmap)
+                    logger.info(f"Loaded GMAP: {gmap.name} ({gmap.width}x{gmap.height})")
+                except Exception as e:
+                    logger.warning(f"Failed to load GMAP {gmap_name}: {e}")
 
         # Load NPCs from scripts
         npcs_path = Path(self.config.npcs_dir)
@@ -346,7 +470,7 @@ class GameServer:
                                   writer: asyncio.StreamWriter):
         """Handle a new client connection."""
         addr = writer.get_extra_info('peername')
-        logger.info(f"New connection from {addr}")
+        logger.info("New connection from %s", addr)
 
         # Create player
         player_id = self._allocate_player_id()
@@ -356,8 +480,13 @@ class GameServer:
             await writer.wait_closed()
             return
 
-        player = Player(self, player_id, reader, writer)
-        self.players[player_id] = player
+        try:
+            player = Player(self, player_id, reader, writer)
+            self.players[player_id] = player
+        except BaseException:
+            # Never registered, so _remove_player will not free the id
+            heapq.heappush(self._free_player_ids, player_id)
+            raise
 
         try:
             await player.run()
@@ -371,12 +500,15 @@ class GameServer:
         if len(self.players) >= self.config.max_players:
             return None
 
-        # Find available ID (2-15999)
-        for i in range(2, 16000):
-            if i not in self.players:
-                return i
+        if self._free_player_ids:
+            return heapq.heappop(self._free_player_ids)
 
-        return None
+        # Fresh IDs run 2-15999
+        player_id = self.next_player_id
+        if player_id >= 16000:
+            return None
+        self.next_player_id = player_id + 1
+        return player_id
 
     async def _remove_player(self, player: Player):
         """Remove a player from the server."""
@@ -384,8 +516,12 @@ class GameServer:
         if self.listserver and player.logged_in:
             await self.listserver.remove_player(player)
 
-        if player.id in self.players:
+        if self.players.get(player.id) is player:
             del self.players[player.id]
+            heapq.heappush(self._free_player_ids, player.id)
+        name_lower = player.account_name.lower()
+        if self._players_by_name.get(name_lower) is player:
+            del self._players_by_name[name_lower]
 
         # Part chat channels + roster pushes (after the players-dict removal
         # so the parted player gets no roster traffic)
@@ -400,13 +536,13 @@ class GameServer:
                 exclude={player.id}
             )
 
-        logger.info(f"Player {player.id} ({player.account_name}) disconnected")
+        logger.info("Player %s (%s) disconnected", player.id, player.account_name)
 
     async def _main_loop(self):
         """Main server loop for periodic tasks."""
         while self.running:
             try:
-                now = time.time()
+                now = time.monotonic()
 
                 # Send heartbeat to all players
                 if now - self._last_heartbeat >= self.config.heartbeat_interval:
@@ -427,9 +563,9 @@ class GameServer:
     async def _send_heartbeat(self):
         """Send world time heartbeat to all connected players."""
         packet = build_world_time()
-        for player in list(self.players.values()):
-            if player.logged_in:
-                await player.send_raw(packet)
+        await send_to_all(
+            [player for player in self.players.values() if player.logged_in],
+            packet)
 
     async def broadcast_to_level(self, level_name: str, packet: bytes,
                                   exclude: Optional[Set[int]] = None):
@@ -451,9 +587,10 @@ class GameServer:
     async def broadcast_to_all(self, packet: bytes, exclude: Optional[Set[int]] = None):
         """Broadcast packet to all logged-in players."""
         exclude = exclude or set()
-        for player in list(self.players.values()):
-            if player.logged_in and player.id not in exclude:
-                await player.send_raw(packet)
+        await send_to_all(
+            [player for player in self.players.values()
+             if player.logged_in and player.id not in exclude],
+            packet)
 
     async def broadcast_to_rcs(self, packet: bytes, exclude: Optional[Set[int]] = None):
         """Broadcast packet to all RC sessions."""
@@ -470,11 +607,40 @@ class GameServer:
         return self.players.get(player_id)
 
     def get_player_by_name(self, name: str) -> Optional[Player]:
-        """Get player by account name."""
+        """Get player by account name.
+
+        Answered from a name index, seeded at login (index_player_name) and
+        by earlier lookups. An entry is only trusted while that player is
+        still connected under that name; otherwise this falls back to the
+        scan, so a rename or a player added without logging in is still found.
+        """
         name_lower = name.lower()
+        player = self._indexed_player(name_lower)
+        if player is not None:
+            return player
         for player in self.players.values():
             if player.account_name.lower() == name_lower:
+                self._players_by_name[name_lower] = player
                 return player
+        self._players_by_name.pop(name_lower, None)
+        return None
+
+    def index_player_name(self, player: Player):
+        """Seed the name index so the first lookup for `player`'s name is a hit.
+
+        The entry is whatever get_player_by_name resolves: a still-valid one
+        is kept, otherwise it is seeded from the scan. With several sessions
+        on one account (an admin's RC and game client) that is the first one
+        in self.players, as the scan alone would return, not the newest login.
+        """
+        self.get_player_by_name(player.account_name)
+
+    def _indexed_player(self, name_lower: str) -> Optional[Player]:
+        """The name index entry for `name_lower`, if it is still valid."""
+        player = self._players_by_name.get(name_lower)
+        if (player is not None and self.players.get(player.id) is player
+                and player.account_name.lower() == name_lower):
+            return player
         return None
 
     def get_players_on_level(self, level_name: str) -> List[Player]:
@@ -487,13 +653,11 @@ class GameServer:
 
     def get_player_count(self) -> int:
         """Get number of logged-in players."""
-        return len([p for p in self.players.values() if p.logged_in])
+        return sum(1 for p in self.players.values() if p.logged_in)
 
     def is_staff(self, account_name: str) -> bool:
         """Check if account is staff."""
-        if hasattr(self.config, 'staff'):
-            return account_name.lower() in [s.lower() for s in self.config.staff]
-        return False
+        return account_name.lower() in self._staff_lower
 
     def get_flag(self, name: str) -> str:
         """Get server flag value."""
@@ -557,71 +721,10 @@ class GameServer:
             return False
 
         # Handle common triggers
-        if action_type == "warp":
-            # Format: serverside,warp,level,x,y
-            if len(params) >= 3:
-                level_name = params[0]
-                try:
-                    dest_x = float(params[1])
-                    dest_y = float(params[2])
-                except ValueError:
-                    return False
-                await player.warp(level_name, dest_x, dest_y)
-                return True
-
-        elif action_type == "setflag":
-            # Format: serverside,setflag,name,value
-            if len(params) >= 2:
-                flag_name = params[0]
-                flag_value = params[1]
-                player.set_flag(flag_name, flag_value)
-                return True
-
-        elif action_type == "addweapon":
-            # Format: serverside,addweapon,name
-            if len(params) >= 1:
-                weapon_name = params[0]
-                player.add_weapon(weapon_name)
-                if self.gs2_manager is not None:
-                    await self.gs2_manager.announce_weapon(player, weapon_name)
-                return True
-
-        elif action_type == "removeweapon":
-            # Format: serverside,removeweapon,name
-            if len(params) >= 1:
-                weapon_name = params[0]
-                player.remove_weapon(weapon_name)
-                return True
-
-        elif action_type == "giverupees":
-            # Format: serverside,giverupees,amount
-            if len(params) >= 1:
-                try:
-                    amount = int(params[0])
-                except ValueError:
-                    return False
-                player.rupees = min(9999, player.rupees + amount)
-                return True
-
-        elif action_type == "heal":
-            # Format: serverside,heal,amount
-            if len(params) >= 1:
-                try:
-                    amount = float(params[0])
-                except ValueError:
-                    return False
-                player.hearts = min(player.max_hearts, player.hearts + amount)
-                return True
-
-        elif action_type == "setlevel":
-            # Format: serverside,setlevel,flag,value
-            if len(params) >= 2 and player.level:
-                flag_name = params[0]
-                flag_value = params[1]
-                # Set level-specific flag
-                pass
-                return True
-        return False
+        handler = _TRIGGER_ACTIONS.get(action_type)
+        if handler is None:
+            return False
+        return await handler(self, player, params)
 
     def register_rc_session(self, player: Player) -> bool:
         """
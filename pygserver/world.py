@@ -18,6 +18,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# GMAP header lines of the form "<KEYWORD> <value>"
+_GMAP_SETTINGS = frozenset(('WIDTH', 'HEIGHT', 'MAPIMG'))
+
 
 class GMap:
     """
@@ -26,6 +29,10 @@ class GMap:
     GMAP files define how individual levels are arranged in a grid.
     """
 
+    # Slotted: every world broadcast and GMAP warp reads grid (via
+    # find_level) and the size fields.
+    __slots__ = ('name', 'width', 'height', '_grid', '_positions', 'image')
+
     def __init__(self, name: str):
         self.name = name
         self.width = 0  # Grid width in levels
@@ -37,6 +44,18 @@ class GMap:
         # Map image (minimap)
         self.image: Optional[str] = None
 
+    @property
+    def grid(self) -> Dict[Tuple[int, int], str]:
+        return self._grid
+
+    @grid.setter
+    def grid(self, grid: Dict[Tuple[int, int], str]):
+        # The dict is kept as given, not copied; find_level's index is built
+        # from it here and at the end of load(), the two places a grid is
+        # written. Code that edits cells in place assigns grid again after.
+        self._grid = grid
+        self._rebuild_positions()
+
     @classmethod
     def load(cls, file_path: str) -> 'GMap':
         """
@@ -56,58 +75,62 @@ class GMap:
         gmap = cls(path.stem)
 
         try:
-            with open(file_path, 'r') as f:
-                content = f.read()
-
-            lines = content.split('\n')
-            in_levelnames = False
-            level_index = 0
-
-            for line in lines:
-                line = line.strip()
-                if not line:
-                    continue
-
-                if line.startswith('WIDTH'):
-                    parts = line.split()
-                    if len(parts) >= 2:
-                        gmap.width = int(parts[1])
-
-                elif line.startswith('HEIGHT'):
-                    parts = line.split()
-                    if len(parts) >= 2:
-                        gmap.height = int(parts[1])
-
-                elif line.startswith('MAPIMG'):
+            with open(file_path, 'r', encoding='latin-1') as f:
+                in_levelnames = False
+                level_index = 0
+
+                # Parsed as the file is read: no whole-file string, and no
+                # list of every line, is built first.
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+
+                    # The level-name rows are nearly every line of a GMAP,
+                    # so inside the block only the end marker is checked;
+                    # the header keywords are matched outside it alone.
+                    if in_levelnames:
+                        if line in ('LEVELNAMESEND', 'LEVELNAMES END'):
+                            in_levelnames = False
+                        elif gmap.width > 0:
+                            # A row holds one or more comma-separated, quoted
+                            # level names, e.g.
+                            # "chicken4.nw","chicken5.nw","chicken6.nw", laid
+                            # out left-to-right then top-to-bottom.
+                            for token in line.split(','):
+                                token = token.strip().strip('"').strip()
+                                if not token:
+                                    continue
+                                gx = level_index % gmap.width
+                                gy = level_index // gmap.width
+                                gmap.grid[(gx, gy)] = token
+                                level_index += 1
+                        continue
+
+                    if line == 'LEVELNAMES':
+                        in_levelnames = True
+                        level_index = 0
+                        continue
+
+                    # One split per header line; a keyword must be the whole
+                    # first word (the old prefix tests also took a level name
+                    # such as WIDTHS.nw for a WIDTH line).
                     parts = line.split(None, 1)
-                    if len(parts) >= 2:
-                        gmap.image = parts[1]
-
-                elif line == 'LEVELNAMES':
-                    in_levelnames = True
-                    level_index = 0
-
-                elif line in ('LEVELNAMESEND', 'LEVELNAMES END'):
-                    in_levelnames = False
-
-                elif in_levelnames and gmap.width > 0:
-                    # A LEVELNAMES line holds one or more comma-separated, quoted
-                    # level names, e.g. "chicken4.nw","chicken5.nw","chicken6.nw",
-                    # laid out left-to-right then top-to-bottom across the grid.
-                    for token in line.split(','):
-                        token = token.strip().strip('"').strip()
-                        if not token:
-                            continue
-                        gx = level_index % gmap.width
-                        gy = level_index // gmap.width
-                        gmap.grid[(gx, gy)] = token
-                        level_index += 1
+                    keyword = parts[0]
+                    if keyword in _GMAP_SETTINGS and len(parts) >= 2:
+                        if keyword == 'MAPIMG':
+                            gmap.image = parts[1]
+                        elif keyword == 'WIDTH':
+                            gmap.width = int(parts[1].split()[0])
+                        else:
+                            gmap.height = int(parts[1].split()[0])
 
             logger.debug(f"Loaded GMAP {gmap.name}: {gmap.width}x{gmap.height}")
 
         except Exception as e:
             logger.error(f"Error loading GMAP {file_path}: {e}")
 
+        gmap._rebuild_positions()
         return gmap
 
     def get_level_at(self, gx: int, gy: int) -> Optional[str]:
@@ -115,11 +138,20 @@ class GMap:
         return self.grid.get((gx, gy))
 
     def find_level(self, level_name: str) -> Optional[Tuple[int, int]]:
-        """Find grid position of a level."""
-        for pos, name in self.grid.items():
-            if name == level_name:
-                return pos
-        return None
+        """Find grid position of a level.
+
+        Every world broadcast asks this of each GMAP, so it is a lookup in a
+        reverse index rather than a scan of the grid; see the grid setter for
+        when that index is built.
+        """
+        return self._positions.get(level_name)
+
+    def _rebuild_positions(self):
+        positions: Dict[str, Tuple[int, int]] = {}
+        for pos, name in self._grid.items():
+            # First cell wins, as the scan this replaces returned it
+            positions.setdefault(name, pos)
+        self._positions = positions
 
     def world_to_local(self, world_x: float, world_y: float) -> Tuple[float, float, int, int]:
         """
@@ -50,7 +50,8 @@ class AudienceServer:
         player = MagicMock()
         player.id = player_id
         player.x, player.y = x, y
-        player.send_raw = AsyncMock()
+        player.write_raw = MagicMock(return_value=False)
+        player.drain = AsyncMock()
         self.players[player_id] = player
         level.add_player(player)
         return player
@@ -180,5 +181,20 @@ def test_broadcast_to_level_sends_to_everyone_but_the_excluded():
 
     asyncio.run(server.audience.broadcast_to_level("a.nw", b"pkt", exclude={3}))
 
-    first.send_raw.assert_awaited_once_with(b"pkt")
-    second.send_raw.assert_not_awaited()
+    first.write_raw.assert_called_once_with(b"pkt")
+    second.write_raw.assert_not_called()
+
+
+def test_broadcast_to_level_drains_only_backed_up_sessions():
+    level = Level("a.nw")
+    server = AudienceServer([level])
+    idle = server.add_player(level, 2)
+    backed_up = server.add_player(level, 3)
+    backed_up.write_raw.return_value = True
+
+    asyncio.run(server.audience.broadcast_to_level("a.nw", b"pkt"))
+
+    idle.write_raw.assert_called_once_with(b"pkt")
+    backed_up.write_raw.assert_called_once_with(b"pkt")
+    idle.drain.assert_not_awaited()
+    backed_up.drain.assert_awaited_once()
@@ -167,3 +167,91 @@ def test_local_signed_and_newline_extensions():
     reader = LocalReader(data)
     assert reader.read_gchar_signed() == -1
     assert reader.read_byte() == 0x0A
+
+
+def test_has_remaining_tracks_the_cursor():
+    reader = LocalReader(b"ab")
+    assert reader.has_remaining()
+    reader.skip(2)
+    assert not reader.has_remaining()
+    reader.skip(1)  # this reader lets the cursor run past the end
+    assert not reader.has_remaining()
+    assert reader.remaining() == b""
+
+
+def test_remaining_latin1_matches_replace_decode():
+    data = bytes(range(256))
+    reader = LocalReader(data)
+    reader.skip(3)
+    expected = reader.remaining().decode("latin-1", errors="replace")
+    assert reader.remaining_latin1() == expected
+    assert reader.pos == 3
+
+
+def test_remaining_view_matches_remaining_without_moving_the_cursor():
+    reader = LocalReader(b"\x24\x25tiles")
+    reader.skip(2)
+    view = reader.remaining_view()
+    assert isinstance(view, memoryview)
+    assert view == reader.remaining() == b"tiles"
+    assert reader.pos == 2
+
+
+@pytest.mark.parametrize("data", (b"\x40\x50\xff ", b"\x40\x50", b"\x40\x10\x50 "))
+def test_read_gchars_matches_read_gchar_per_field(data):
+    expected = LocalReader(data)
+    fields = tuple(expected.read_gchar() for _ in range(4))
+    reader = LocalReader(data)
+    assert reader.read_gchars(4) == fields
+    assert reader.pos == expected.pos
+
+
+def test_write_gchars_matches_write_gchar_per_value():
+    values = (0, 1, 200, 223, 224, 255, 300, -1, -33)
+    expected = LocalBuilder()
+    for value in values:
+        expected.write_gchar(value)
+    assert LocalBuilder().write_gchars(values).build() == expected.build()
+
+
+@pytest.mark.parametrize("text", ("", "abc", "caf\xe9", "☃"))
+def test_text_packet_matches_builder_chain(text):
+    expected = LocalBuilder().write_gchar(6).write_string(text).write_newline().build()
+    assert LocalBuilder.text_packet(6, text) == expected
+
+
+def test_struct_packed_builders_match_builder_chain():
+    from pygserver.protocol.constants import PLO
+    from pygserver.protocol.packets import build_bomb_add, build_hurt_player
+
+    expected = (LocalBuilder().write_gchar(PLO.BOMBADD).write_gshort(300)
+                .write_gchar(61).write_gchar(-3).write_gchar(2)
+                .write_gchar(59).write_newline().build())
+    assert build_bomb_add(300, 30.5, -1.5, 6, 3.0) == expected
+
+    expected = (LocalBuilder().write_gchar(PLO.HURTPLAYER).write_gshort(7)
+                .write_gchar_signed(-1).write_gchar_signed(1).write_gchar(4)
+                .write_gint3(70000).write_newline().build())
+    assert build_hurt_player(7, -1, 1, 4, 70000) == expected
+
+
+def test_struct_packed_headers_match_builder_chain():
+    from pygserver.protocol.constants import PLO
+    from pygserver.protocol.packets import build_board_modify, build_trigger_action
+
+    expected = (LocalBuilder().write_gchar(PLO.TRIGGERACTION).write_gshort(3)
+                .write_gint3(70000).write_gchar(21).write_gchar(9)
+                .write_string("warp,caf\xe9").write_newline().build())
+    assert build_trigger_action(3, 70000, 10.5, 4.5, "warp,caf\xe9") == expected
+
+    expected = (LocalBuilder().write_gchar(PLO.BOARDMODIFY).write_gchar(1)
+                .write_gchar(2).write_gchar(2).write_gchar(1)
+                .write_bytes(b"\x00\x01\x02\x03").write_newline().build())
+    assert build_board_modify(1, 2, 2, 1, b"\x00\x01\x02\x03") == expected
+
+
+def test_labelled_rc_chat_matches_formatted_text_packet():
+    from pygserver.protocol.packets import build_rc_chat, build_rc_chat_from
+
+    assert (build_rc_chat_from("admin", "hi €")
+            == build_rc_chat("admin: hi €"))
@@ -0,0 +1,70 @@
+"""GMap: the level grid and its name-to-cell index."""
+
+from pygserver.world import GMap
+
+
+def test_gmap_find_level_follows_grid_assignment():
+    gmap = GMap("world")
+    assert gmap.find_level("a.nw") is None
+
+    gmap.grid = {(0, 0): "a.nw", (1, 0): "b.nw"}
+    assert gmap.find_level("a.nw") == (0, 0)
+    assert gmap.find_level("b.nw") == (1, 0)
+
+    gmap.grid = {(1, 1): "a.nw"}
+    assert gmap.find_level("a.nw") == (1, 1)
+    assert gmap.find_level("b.nw") is None
+
+
+def test_gmap_find_level_follows_an_overwritten_cell():
+    gmap = GMap("world")
+    gmap.grid = {(0, 0): "a.nw", (1, 0): "b.nw"}
+    assert gmap.find_level("a.nw") == (0, 0)
+
+    gmap.grid[(0, 0)] = "c.nw"
+    gmap.grid = gmap.grid
+    assert gmap.find_level("c.nw") == (0, 0)
+    assert gmap.find_level("a.nw") is None
+
+
+def test_gmap_grid_keeps_the_assigned_dict():
+    cells = {(0, 0): "a.nw"}
+    gmap = GMap("world")
+    gmap.grid = cells
+
+    assert gmap.grid is cells
+
+
+def test_gmap_find_level_returns_the_first_cell_of_a_repeated_name():
+    gmap = GMap("world")
+    gmap.grid = {(0, 0): "a.nw", (1, 0): "a.nw"}
+
+    assert gmap.find_level("a.nw") == (0, 0)
+
+
+def test_gmap_load_reads_headers_and_quoted_level_rows(tmp_path):
+    path = tmp_path / "world.gmap"
+    path.write_text(
+        "GRMAP001\n"
+        "WIDTH 2\n"
+        "HEIGHT 2\n"
+        "MAPIMG world.png\n"
+        "LEVELNAMES\n"
+        '"WIDTHS.nw","b.nw"\n'
+        '"c.nw", "d.nw"\n'
+        "LEVELNAMESEND\n"
+        "HEIGHT 3\n",
+        encoding="latin-1",
+    )
+
+    gmap = GMap.load(str(path))
+
+    assert gmap.name == "world"
+    assert (gmap.width, gmap.height, gmap.image) == (2, 3, "world.png")
+    assert gmap.grid == {
+        (0, 0): "WIDTHS.nw", (1, 0): "b.nw",
+        (0, 1): "c.nw", (1, 1): "d.nw",
+    }
+    assert gmap.find_level("WIDTHS.nw") == (0, 0)
+    assert gmap.find_level("d.nw") == (1, 1)
+    assert gmap.find_level("e.nw") is None
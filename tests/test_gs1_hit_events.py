@@ -341,8 +341,7 @@ def test_isonmap_and_onmapx_onmapy():
     gmap = GMap("overworld")
     gmap.width = 2
     gmap.height = 2
-    gmap.grid[(0, 0)] = "level_00.nw"
-    gmap.grid[(1, 0)] = "level_10.nw"
+    gmap.grid = {(0, 0): "level_00.nw", (1, 0): "level_10.nw"}
     server.world.add_gmap(gmap)
 
     npc = NPC(1, "t")
@@ -538,6 +538,32 @@ def test_addweapon_adds_and_sends_packet():
     asyncio.run(main())
 
 
+def test_addweapon_announces_a_compiled_weapon_with_its_script_header():
+    from pygserver.gs2 import GS2Script
+
+    weapon = GS2Script(kind="weapon", name="wand", image="wand.png",
+                       bytecode=b"\x01\x02", joined_classes="util",
+                       header_with_crc="weapon,wand,1,key,123")
+
+    class GS2:
+        def get_weapon(self, name):
+            return weapon if name == "wand" else None
+
+    class Server:
+        gs2_manager = GS2()
+
+    async def main():
+        npc = make_npc("if (playertouchsme) { addweapon wand; }")
+        p = FakePlayer()
+        run_npc_event(npc, "playertouchsme", Server(), p)
+        await asyncio.sleep(0)  # let the scheduled announce run
+        assert "wand" in p.weapons
+        assert p.sent == list(weapon.announce_packets())
+        assert len(p.sent) == 2  # weapon add, then the script header
+
+    asyncio.run(main())
+
+
 def test_toweapons_stores_and_serves_the_npc_image_and_script(tmp_path):
     from pygserver.gs2 import GS2ScriptManager
 
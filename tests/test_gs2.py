@@ -24,6 +24,7 @@ from pygserver.protocol.constants import PLO
 from pygserver.protocol.packets import (
     build_load_script_bytecode,
     build_load_script_header,
+    build_npc_weapon_add,
     build_npc_weapon_script,
     build_raw_data_announcement,
 )
@@ -496,3 +497,30 @@ def test_update_gani_handler_skips_the_leading_crc(tmp_path):
 
     assert player.send_raw.await_count == 1
     assert player.send_raw.await_args[0][0][0] == PLO.LOADGANI + 32
+
+
+def test_announce_packets_are_built_once_and_follow_field_changes():
+    script = GS2Script(kind="weapon", name="bow", image="bow.png",
+                       clientside="//bow")
+
+    first = script.announce_packets()
+    assert script.announce_packets() is first
+    assert first == (build_npc_weapon_add("bow", "bow.png", "//bow"),)
+
+    script.image = "bow2.png"
+    assert script.announce_packets() == (
+        build_npc_weapon_add("bow", "bow2.png", "//bow"),)
+
+
+def test_announce_weapons_sends_every_owned_weapon_in_one_write(tmp_path):
+    write_fixtures(tmp_path)
+    (tmp_path / "weapons" / "weaponqa%095gs2vm.gs2bc").write_bytes(BINARY_BYTECODE)
+    manager = make_manager(tmp_path, compiler_available=False)
+    manager.load()
+    player = FakePlayer()
+    player.weapons = ["qa_gs2vm", "not-loaded"]
+
+    run(manager.announce_weapons(player))
+
+    assert player.sent == [
+        b"".join(manager.get_weapon("qa_gs2vm").announce_packets())]
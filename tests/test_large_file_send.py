@@ -56,3 +56,18 @@ def test_large_file_chunks_have_file_headers_and_named_end(tmp_path, monkeypatch
 
     assert bytes(rebuilt) == payload
     assert player.packets[-1] == bytes([PLO.LARGEFILEEND + 32]) + b"map.bin\n"
+
+
+def test_list_directory_sorts_entries_and_ignores_missing_paths(tmp_path):
+    (tmp_path / "b.txt").write_bytes(b"12345")
+    (tmp_path / "a").mkdir()
+    filesystem = FileSystem(object(), str(tmp_path))
+
+    listing = filesystem.list_directory("")
+
+    assert [(f.name, f.size, f.is_directory) for f in listing] == [
+        ("a", 0, True),
+        ("b.txt", 5, False),
+    ]
+    assert filesystem.list_directory("missing") == []
+    assert filesystem.list_directory("b.txt") == []
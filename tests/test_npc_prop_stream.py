@@ -133,6 +133,17 @@ def test_unknown_prop_id_is_skipped_without_writing_its_id():
     assert props[NPCPROP.GANI] == "idle"
 
 
+def test_slot_list_props_match_the_dict_form():
+    """A prop-id-indexed list (None = unset) writes the same bytes as a dict."""
+    props = {NPCPROP.IMAGE: "a.png", NPCPROP.Y2: 3.5, NPCPROP.SPRITE: 2,
+             NPCPROP.GANI: "idle", NPCPROP.GLOVEPOWER: 0}
+    slots = [None] * (max(props) + 1)
+    for prop_id, value in props.items():
+        slots[prop_id] = value
+
+    assert build_npc_props(5, slots) == build_npc_props(5, props)
+
+
 def test_colors_are_written_at_the_new_world_width():
     """Outbound COLORS is 8 wide (see build_player_props' _OUTBOUND_COLORS).
 
@@ -1,6 +1,8 @@
 import asyncio
 from types import SimpleNamespace
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
 
 from pygserver.combat import CombatManager
 from pygserver.handlers.files import FileHandlers
@@ -112,15 +114,125 @@ def test_server_prefixed_flag_broadcasts_to_all_players():
         recipient = Player(server, 2, AsyncMock(), MagicMock())
         sender.logged_in = True
         recipient.logged_in = True
-        sender.send_raw = AsyncMock()
-        recipient.send_raw = AsyncMock()
+        for player in (sender, recipient):
+            player.write_raw = MagicMock(return_value=False)
+            player.drain = AsyncMock()
         server.players = {sender.id: sender, recipient.id: recipient}
 
         await sender._handle_flag_set(b"server.weather=sunny")
 
         assert server.server_flags["server.weather"] == "sunny"
-        sender.send_raw.assert_awaited_once()
-        recipient.send_raw.assert_awaited_once()
-        assert packet_type(sender.send_raw.await_args.args[0]) == PLO.FLAGSET
+        for player in (sender, recipient):
+            player.write_raw.assert_called_once()
+            assert packet_type(player.write_raw.call_args.args[0]) == PLO.FLAGSET
 
     asyncio.run(main())
+
+
+def test_player_by_name_index_rechecks_name_and_membership():
+    server = GameServer.__new__(GameServer)
+    server._players_by_name = {}
+    alice = SimpleNamespace(id=2, account_name="Alice")
+    bob = SimpleNamespace(id=3, account_name="bob")
+    server.players = {alice.id: alice, bob.id: bob}
+
+    assert server.get_player_by_name("alice") is alice
+    assert server.get_player_by_name("ALICE") is alice
+
+    # A renamed or disconnected player is not served from the index.
+    alice.account_name = "carol"
+    assert server.get_player_by_name("alice") is None
+    del server.players[bob.id]
+    assert server.get_player_by_name("bob") is None
+
+
+def test_login_seeds_the_player_name_index():
+    server = GameServer.__new__(GameServer)
+    server._players_by_name = {}
+    alice = SimpleNamespace(id=2, account_name="Alice")
+    server.players = {alice.id: alice}
+
+    server.index_player_name(alice)
+
+    assert server._players_by_name == {"alice": alice}
+    assert server.get_player_by_name("ALICE") is alice
+
+
+def test_name_index_keeps_the_first_session_on_an_account():
+    server = GameServer.__new__(GameServer)
+    server._players_by_name = {}
+    first = SimpleNamespace(id=2, account_name="Admin")
+    second = SimpleNamespace(id=3, account_name="admin")
+    server.players = {first.id: first}
+    server.index_player_name(first)
+
+    server.players[second.id] = second
+    server.index_player_name(second)
+
+    assert server.get_player_by_name("admin") is first
+
+    del server.players[first.id]
+    assert server.get_player_by_name("admin") is second
+
+
+def test_name_index_reseeds_from_the_scan_after_a_disconnect():
+    server = GameServer.__new__(GameServer)
+    server._players_by_name = {}
+    first = SimpleNamespace(id=2, account_name="admin")
+    second = SimpleNamespace(id=3, account_name="admin")
+    server.players = {first.id: first, second.id: second}
+    server.index_player_name(first)
+    server.index_player_name(second)
+
+    # first disconnects; a new session on the same account reuses its id and
+    # lands at the end of self.players, behind second.
+    del server.players[first.id]
+    server._players_by_name.pop("admin")
+    third = SimpleNamespace(id=2, account_name="admin")
+    server.players[third.id] = third
+    server.index_player_name(third)
+
+    assert server.get_player_by_name("admin") is second
+
+
+def test_player_ids_are_lowest_free_first():
+    server = GameServer.__new__(GameServer)
+    server.config = SimpleNamespace(max_players=100)
+    server.players = {}
+    server.next_player_id = 2
+    server._free_player_ids = []
+    server._players_by_name = {}
+    server.listserver = None
+    server.irc_manager = None
+
+    ids = []
+    for _ in range(4):
+        player_id = server._allocate_player_id()
+        server.players[player_id] = SimpleNamespace(
+            id=player_id, account_name="", logged_in=False, level=None)
+        ids.append(player_id)
+    assert ids == [2, 3, 4, 5]
+
+    for player_id in (4, 3):
+        asyncio.run(server._remove_player(server.players[player_id]))
+    assert server._allocate_player_id() == 3
+    assert server._allocate_player_id() == 4
+    assert server._allocate_player_id() == 6
+
+
+def test_player_id_is_freed_when_player_construction_fails():
+    server = GameServer.__new__(GameServer)
+    server.config = SimpleNamespace(max_players=100)
+    server.players = {}
+    server.next_player_id = 2
+    server._free_player_ids = []
+    writer = MagicMock()
+    writer.get_extra_info.return_value = ("127.0.0.1", 1)
+
+    with patch("pygserver.server.Player", side_effect=RuntimeError):
+        with pytest.raises(RuntimeError):
+            asyncio.run(server._handle_connection(MagicMock(), writer))
+
+    assert server.players == {}
+    assert server._allocate_player_id() == 2
+    assert server._allocate_player_id() == 3
@@ -11,8 +11,8 @@ from unittest.mock import AsyncMock, MagicMock
 
 from pygserver.player import Player, _HANDLER_NAMES, _STATE_ALIASES
 from pygserver.player_login import LoginService
-from pygserver.protocol.constants import PLI, PLTYPE
-from pygserver.protocol.packets import PacketBuilder
+from pygserver.protocol.constants import PLI, PLPROP, PLTYPE
+from pygserver.protocol.packets import PacketBuilder, build_other_player_props
 
 
 def make_player(server=None):
@@ -28,7 +28,7 @@ def test_every_component_field_has_an_alias():
     aliased = {(component, field)
                for component, field in _STATE_ALIASES.values()}
     for component in ('identity', 'character', 'inventory', 'status'):
-        for field in vars(getattr(player, component)):
+        for field in type(getattr(player, component)).__slots__:
             assert (component, field) in aliased, \
                 f"{component}.{field} is not exposed on Player"
 
@@ -53,10 +53,10 @@ def test_aliases_read_and_write_through_to_the_component():
 def test_mutable_containers_are_shared_not_copied():
     player = make_player()
 
-    player.weapons.append("bow")
+    player.weapons["bow"] = None
     player.flags["quest"] = "done"
 
-    assert player.inventory.weapons == ["bow"]
+    assert list(player.inventory.weapons) == ["bow"]
     assert player.inventory.flags == {"quest": "done"}
 
 
@@ -72,6 +72,51 @@ def test_transport_aliases_point_at_the_session():
     assert player.session.connected is False
 
 
+def test_props_packet_is_reused_until_visible_state_changes():
+    server = MagicMock()
+    server.world.get_gmap_for_level.return_value = None
+    player = make_player(server)
+
+    first = player.build_props_packet()
+    assert player.build_props_packet() is first
+
+    player.character.x = 30.5
+    moved = player.build_props_packet()
+    assert moved != first
+
+    player.colors[1] = 7  # GS1 colour commands mutate the list in place
+    assert player.build_props_packet() != moved
+
+
+def test_props_packet_layout_is_already_in_id_order():
+    """The hand-ordered pairs must match what sorting the old dict gave."""
+    server = MagicMock()
+    gmap = MagicMock()
+    gmap.name = "world"
+    server.world.get_gmap_for_level.return_value = (gmap, 1, 2)
+    player = make_player(server)
+    player.level = MagicMock()
+
+    expected = build_other_player_props(player.id, {
+        PLPROP.NICKNAME: player.nickname,
+        PLPROP.X2: player.x,
+        PLPROP.Y2: player.y,
+        PLPROP.SPRITE: player.sprite,
+        PLPROP.GANI: player.gani,
+        PLPROP.SWORDPOWER: (player.sword_power, player.sword_image),
+        PLPROP.SHIELDPOWER: (player.shield_power, player.shield_image),
+        PLPROP.HEADIMAGE: player.head_image,
+        PLPROP.BODYIMAGE: player.body_image,
+        PLPROP.CURLEVEL: "world.gmap",
+        PLPROP.COLORS: player.colors,
+        PLPROP.MAGICPOINTS: player.mp,
+        PLPROP.ALIGNMENT: player.ap,
+        PLPROP.GMAPLEVELX: 1,
+        PLPROP.GMAPLEVELY: 2,
+    })
+    assert player.build_props_packet() == expected
+
+
 # -- dispatch table ---------------------------------------------------------
 
 def test_handler_table_is_bound_methods_named_after_the_packet():
@@ -225,7 +225,7 @@ def test_weapons_survive_a_server_restart(tmp_path):
     restarted.load_player_from_account(fresh, reloaded)
 
     assert reloaded.weapons == ["qa_gs2vm"]
-    assert fresh.weapons == ["qa_gs2vm"]
+    assert list(fresh.weapons) == ["qa_gs2vm"]
 
 
 def test_the_players_weapon_list_is_not_shared_with_the_account(tmp_path):
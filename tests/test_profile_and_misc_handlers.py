@@ -382,3 +382,26 @@ class TestNCWeaponAndClassGuards:
 
         packet = session.player.send_raw.await_args[0][0]
         assert b"someclass" in packet
+
+
+class TestNCStaleSessionOnReusedId:
+    """An NC session is bound to its player object, not just the numeric id."""
+
+    def test_new_player_on_reused_id_gets_no_nc_dispatch(self):
+        from pygserver.nc import NCManager
+        from pygserver.protocol.constants import PLI
+
+        nc = NCManager(MagicMock())
+        handler = AsyncMock()
+        nc._handlers[PLI.NC_NPCGET] = handler
+        admin = MagicMock()
+        admin.id = 5
+        nc.register_session(admin)
+        newcomer = MagicMock()
+        newcomer.id = 5
+
+        asyncio.run(nc.handle_packet(newcomer, PLI.NC_NPCGET, b""))
+        handler.assert_not_awaited()
+
+        asyncio.run(nc.handle_packet(admin, PLI.NC_NPCGET, b""))
+        handler.assert_awaited_once()
@@ -68,6 +68,19 @@ class TestPacketBuilders:
         packet = build_arrow_add(1, 10.0, 20.0, 2)
         assert isinstance(packet, bytes)
 
+    def test_build_board_packet_frames_the_tiles(self):
+        """Test the board packet is id byte, raw tiles, terminator."""
+        from pygserver.protocol.packets import build_board_packet
+        from pygserver.protocol.constants import PLO
+
+        tiles = bytearray(range(256)) * 32
+        packet = build_board_packet(memoryview(tiles))
+
+        assert len(packet) == 8194
+        assert packet[0] == PLO.BOARDPACKET + 32
+        assert packet[1:-1] == tiles
+        assert packet[-1:] == b"\n"
+
 
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
@@ -395,6 +395,99 @@ class TestLargeFileTransferWireFormat:
         assert "test.txt" not in session.large_file_uploads
 
 
+class TestRCSession:
+    """RCSession is a hand-written slotted class; its repr stays readable."""
+
+    def test_repr_names_the_fields_and_upload_names_only(self):
+        from pygserver.rc import RCSession
+
+        session = RCSession(player="admin", rights=3)
+        session.file_browser_path = "levels"
+        session.large_file_uploads["big.dat"] = bytearray(b"x" * 1024)
+
+        assert repr(session) == (
+            "RCSession(player='admin', rights=3, file_browser_path='levels', "
+            "file_browser_active=False, large_file_uploads=['big.dat'])")
+
+
+class TestPlayerPropsGetWireFormat:
+    """PLO_RC_PLAYERPROPSGET: [GUCHAR-len account][player prop stream]."""
+
+    def test_player_props_get2_sends_encoded_prop_stream(self):
+        from pygserver.rc import RCManager, RCSession
+        from pygserver.protocol.packets import PacketBuilder, build_player_props
+        from pygserver.protocol.constants import PLO, PLPERM
+
+        mock_server = MagicMock()
+        rc = RCManager(mock_server)
+        admin = MagicMock()
+        admin.send_raw = AsyncMock()
+        target = MagicMock()
+        target.account_name = "bob"
+        target.nickname = "Bob"
+        target.level = None
+        target.x, target.y = 30.0, 31.5
+        target.hearts, target.max_hearts = 2.5, 3
+        target.rupees, target.bombs, target.arrows = 10, 5, 20
+        mock_server.get_player.return_value = target
+
+        session = RCSession(player=admin, rights=PLPERM.VIEWATTRIBUTES)
+        payload = PacketBuilder().write_gshort(4).build()
+        asyncio.run(rc._handle_player_props_get2(session, payload))
+
+        packet = admin.send_raw.await_args.args[0]
+        assert packet[:5] == bytes((PLO.RC_PLAYERPROPSGET + 32, 3 + 32)) + b"bob"
+        # Same prop stream as PLO_PLAYERPROPS carries for those values.
+        props = dict(rc._build_player_props(target))
+        assert packet[5:] == build_player_props(props)[1:]
+
+
+class TestStaleSessionOnReusedId:
+    """A session is bound to its player object, not just the numeric id."""
+
+    def test_new_player_on_reused_id_gets_no_rc_dispatch(self):
+        from pygserver.protocol.constants import PLI, PLPERM
+        from pygserver.rc import RCManager
+
+        rc = RCManager(MagicMock())
+        admin = MagicMock()
+        admin.id = 5
+        rc.register_session(admin, PLPERM.VIEWATTRIBUTES)
+        newcomer = MagicMock()
+        newcomer.id = 5
+        newcomer.send_raw = AsyncMock()
+
+        asyncio.run(rc.handle_packet(newcomer, PLI.RC_SERVEROPTIONSGET, b""))
+
+        newcomer.send_raw.assert_not_awaited()
+
+
+class TestBroadcastToRcs:
+    """broadcast_to_rcs writes to every session and drains only backed-up ones."""
+
+    def test_writes_all_and_drains_backlogged_only(self):
+        from pygserver.rc import RCManager
+
+        rc = RCManager(MagicMock())
+        players = []
+        for player_id, backed_up in ((1, False), (2, True), (3, True)):
+            player = MagicMock()
+            player.id = player_id
+            player.write_raw.return_value = backed_up
+            player.drain = AsyncMock()
+            rc.register_session(player, 0)
+            players.append(player)
+
+        asyncio.run(rc.broadcast_to_rcs(b"pkt", exclude={3}))
+
+        players[0].write_raw.assert_called_once_with(b"pkt")
+        players[1].write_raw.assert_called_once_with(b"pkt")
+        players[2].write_raw.assert_not_called()
+        players[0].drain.assert_not_awaited()
+        players[1].drain.assert_awaited_once()
+        players[2].drain.assert_not_awaited()
+
+
 class TestNoArgumentlessReadString:
     """Verify there are no argument-less read_string() calls in rc.py."""
 
@@ -169,6 +169,24 @@ def test_unknown_and_malformed_triggers_are_refused(tmp_path):
         player, 0, 0, "serverside,giverupees,invalid")) is False
 
 
+def test_builtin_triggers_dispatch_by_action_name(tmp_path):
+    server, _ = make_server(tmp_path)
+    player = FakePlayer(FakeLevel())
+    player.rupees = 9990
+    player.hearts = 1.0
+    player.max_hearts = 3.0
+
+    assert run(server.handle_trigger_action(
+        player, 0, 0, "serverside,giverupees,20")) is True
+    assert run(server.handle_trigger_action(
+        player, 0, 0, "serverside,heal,0.5")) is True
+    assert run(server.handle_trigger_action(
+        player, 0, 0, "serverside,heal")) is False
+
+    assert player.rupees == 9999
+    assert player.hearts == 1.5
+
+
 def test_trigger_action_requires_strict_containment(tmp_path):
     # The reference uses triggerDistance only as a candidate-search radius;
     # the hit test is strict containment in the unexpanded NPC rect
@@ -11,3 +11,16 @@ def test_weapon_add_encodes_image_and_script():
     assert build_npc_weapon_add("Bow", "bow.png", "shoot();") == (
         b"A#Bow 'bow.png! (shoot();\n"
     )
+
+
+def test_weapon_add_matches_builder_chain_for_long_multiline_scripts():
+    from pygserver.protocol.constants import PLO
+    from pygserver.protocol.packet_codec import PacketBuilder
+
+    script = "if (playertouchsme) {\n  say 1;\n}\n" * 20
+    expected = (PacketBuilder().write_gchar(PLO.NPCWEAPONADD)
+                .write_gstring("Caf\xe9 Sword").write_gchar(0)
+                .write_gstring("sword.png").write_gchar(1)
+                .write_gstring_short(script.replace("\n", "\xa7"))
+                .write_newline().build())
+    assert build_npc_weapon_add("Caf\xe9 Sword", "sword.png", script) == expected